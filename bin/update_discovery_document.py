@@ -0,0 +1,75 @@
+"""
+Regenerate the pinned Compute Engine discovery document shipped with the plugin.
+
+The document is pruned to the resources and methods GoogleCloudComputeConnector calls
+(and the schemas they reference), and descriptions are dropped to keep it small.
+
+usage)
+    python bin/update_discovery_document.py [path of compute.v1.json]
+"""
+import os
+import sys
+import json
+import googleapiclient
+
+TARGET = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'spaceone', 'inventory', 'conf',
+                      'compute_v1_discovery.json')
+
+RESOURCES = ['regions', 'zones', 'instances', 'machineTypes', 'urlMaps', 'backendServices', 'disks', 'autoscalers',
+             'firewalls', 'images', 'instanceGroups', 'regionInstanceGroups', 'instanceGroupManagers', 'networks',
+             'subnetworks', 'targetPools', 'forwardingRules', 'zoneOperations', 'regionOperations',
+             'globalOperations']
+METHODS = ['list', 'aggregatedList', 'get', 'listInstances']
+
+
+def _strip_descriptions(obj):
+    if isinstance(obj, dict):
+        return {k: _strip_descriptions(v) for k, v in obj.items() if not (k == 'description' and isinstance(v, str))}
+    elif isinstance(obj, list):
+        return [_strip_descriptions(v) for v in obj]
+    return obj
+
+
+def _collect_refs(obj, refs):
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            if k == '$ref':
+                refs.add(v)
+            else:
+                _collect_refs(v, refs)
+    elif isinstance(obj, list):
+        for v in obj:
+            _collect_refs(v, refs)
+
+
+def prune(document):
+    resources = {}
+    for name in RESOURCES:
+        resource = dict(document['resources'][name])
+        resource['methods'] = {k: v for k, v in resource['methods'].items() if k in METHODS}
+        resources[name] = resource
+
+    pending, schemas = set(), set()
+    _collect_refs(resources, pending)
+    while pending:
+        schema = pending.pop()
+        if schema not in schemas:
+            schemas.add(schema)
+            _collect_refs(document['schemas'][schema], pending)
+
+    document = dict(document, resources=resources,
+                    schemas={k: document['schemas'][k] for k in sorted(schemas)})
+    return _strip_descriptions(document)
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else \
+        os.path.join(os.path.dirname(googleapiclient.__file__), 'discovery_cache', 'documents', 'compute.v1.json')
+
+    with open(source) as f:
+        pruned = prune(json.load(f))
+
+    with open(TARGET, 'w') as f:
+        json.dump(pruned, f, separators=(',', ':'), sort_keys=True)
+
+    print(f'revision {pruned["revision"]} -> {os.path.relpath(TARGET)}')
@@ -0,0 +1,33 @@
+"""
+Regenerate the bundled machine type snapshot (src/spaceone/inventory/conf/instances.json).
+
+Machine types of every zone are listed with aggregatedList and deduplicated by family and name,
+in the format of MachineTypeCatalogue.
+
+usage)
+    cd src && PYTHONPATH=. python ../bin/update_machine_types.py <service account key file>
+"""
+import sys
+import json
+import time
+from spaceone.inventory.connector import GoogleCloudComputeConnector
+from spaceone.inventory.libs.machine_type_catalogue import MachineTypeCatalogue, INSTANCE_TYPE_FILE
+
+
+def main(key_file):
+    with open(key_file) as f:
+        secret_data = json.load(f)
+
+    connector = GoogleCloudComputeConnector()
+    connector.get_connect(secret_data)
+    machine_types = connector._flatten(connector._iter_aggregated('machineTypes', skip_error=False))
+
+    snapshot = {'updated_at': int(time.time()), 'families': MachineTypeCatalogue.group_by_family(machine_types)}
+    with open(INSTANCE_TYPE_FILE, 'w') as f:
+        json.dump(snapshot, f, indent=1, sort_keys=True)
+    print(f'{len(machine_types)} machine types -> '
+          f'{sum([len(types) for types in snapshot["families"].values()])} entries : {INSTANCE_TYPE_FILE}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1])
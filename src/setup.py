@@ -30,11 +30,15 @@ setup(
     author_email='admin@spaceone.dev',
     license='Apache License 2.0',
     packages=find_packages(),
+    package_data={
+        'spaceone': ['inventory/conf/*.json']
+    },
     install_requires=[
         'spaceone-core',
         'spaceone-api',
         'google-auth',
         'google-api-python-client',
+        'aiohttp',
         'schematics'
     ],
     zip_safe=False,
@@ -1,10 +1,15 @@
 import logging
 
+from google.protobuf.struct_pb2 import Struct
 from spaceone.api.inventory.plugin import collector_pb2, collector_pb2_grpc
 from spaceone.core.pygrpc import BaseAPI
 from spaceone.core.pygrpc.message_type import *
+from spaceone.inventory.libs.struct_serializer import to_struct
+from spaceone.inventory.manager.metadata.metadata_manager import MetadataManager
 
 _LOGGER = logging.getLogger(__name__)
+# ServerMetadata layout of every inventory.Server, converted to a Struct once
+SERVER_METADATA = change_struct_type(MetadataManager.get_metadata_primitive())
 
 
 class Collector(BaseAPI, collector_pb2_grpc.CollectorServicer):
@@ -36,7 +41,16 @@ class Collector(BaseAPI, collector_pb2_grpc.CollectorServicer):
                     'message': '',
                     'resource_type': resource_format['resource_type'],
                     'match_rules': change_struct_type(resource_format['match_rules']),
-                    'resource': change_struct_type(resource.to_primitive())
+                    'resource': self.get_resource_struct(resource, resource_format['resource_type'])
                 }
 
                 yield self.locator.get_info('ResourceInfo', res)
+
+    @staticmethod
+    def get_resource_struct(resource, resource_type):
+        # written straight into the Struct, without the to_primitive() dict in between
+        # (a sharded transform already yields the Struct)
+        resource_struct = resource if isinstance(resource, Struct) else to_struct(resource)
+        if resource_type == 'inventory.Server':
+            resource_struct.fields['metadata'].struct_value.CopyFrom(SERVER_METADATA)
+        return resource_struct
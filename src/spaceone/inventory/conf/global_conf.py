@@ -19,3 +19,42 @@ HANDLERS = {
 
 ENDPOINTS = {
 }
+
+# Compute API calls per second / burst size of each method family, shared by a project (see libs/rate_limiter.py)
+COMPUTE_API_RATE_LIMIT = {
+    'list': {'rate': 20, 'burst': 40},
+    'get': {'rate': 20, 'burst': 40}
+}
+
+COMPUTE_API_RETRY = {
+    'max_retries': 5,
+    'backoff_base': 1.0,
+    'backoff_max': 32.0
+}
+
+# service account credentials kept between transactions (see libs/credential_cache.py)
+CREDENTIAL_CACHE = {
+    'max_size': 256,
+    'refresh_margin': 300
+}
+
+# public image catalogue shared by every tenant and persisted in cache_dir, custom images per project
+# (see libs/image_catalogue.py)
+IMAGE_CATALOGUE = {
+    'ttl': 86400,
+    'custom_ttl': 3600
+}
+
+# machine types starting from the bundled conf/instances.json, refreshed from the API after ttl
+# (see libs/machine_type_catalogue.py)
+MACHINE_TYPE_CATALOGUE = {
+    'ttl': 604800
+}
+
+# options['incremental'] state per project, persisted in cache_dir (see libs/incremental_collection.py).
+# Servers which did not change are not emitted, so full_resweep_interval has to stay shorter than
+# the garbage collection window of the inventory
+INCREMENTAL_COLLECTION = {
+    'full_resweep_interval': 21600,
+    'operation_margin': 300
+}
@@ -1 +1,2 @@
-from spaceone.inventory.connector.google_cloud_compute_connector import GoogleCloudComputeConnector
\ No newline at end of file
+from spaceone.inventory.connector.google_cloud_compute_connector import GoogleCloudComputeConnector
+from spaceone.inventory.connector.google_cloud_compute_async_connector import GoogleCloudComputeAsyncConnector
@@ -0,0 +1,281 @@
+__all__ = ["GoogleCloudComputeAsyncConnector"]
+
+import asyncio
+import logging
+import aiohttp
+import httplib2
+import google_auth_httplib2
+from spaceone.core.connector import BaseConnector
+from spaceone.inventory.connector.google_cloud_compute_connector import GoogleCloudComputeConnector
+from spaceone.inventory.libs.credential_cache import CREDENTIAL_CACHE
+from spaceone.inventory.libs.field_mask import get_fields
+from spaceone.inventory.libs.image_catalogue import IMAGE_CATALOGUE, PUBLIC_IMAGE_PROJECTS
+from spaceone.inventory.libs.machine_type_catalogue import MACHINE_TYPE_CATALOGUE
+from spaceone.inventory.libs.rate_limiter import RATE_LIMITER
+
+_LOGGER = logging.getLogger(__name__)
+COMPUTE_ENDPOINT = 'https://compute.googleapis.com/compute/v1'
+CONNECTION_LIMIT = 100
+
+
+class GoogleCloudComputeAsyncConnector(BaseConnector):
+    """
+    asyncio version of GoogleCloudComputeConnector.
+    Every method is a coroutine with the same name and result as the sync connector, and all requests
+    share one aiohttp connection pool, so page requests of different resource kinds run on one event loop.
+
+        async with GoogleCloudComputeAsyncConnector() as connector:
+            connector.get_connect(secret_data)
+            disks, instances = await asyncio.gather(connector.list_disks(), connector.list_instances())
+    """
+
+    endpoint = COMPUTE_ENDPOINT
+    connection_limit = CONNECTION_LIMIT
+    field_mask = True
+
+    def __init__(self, transaction=None, config=None):
+        self.project_id = None
+        self.credentials = None
+        self.session = None
+        self._token_lock = None
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    async def open(self):
+        if self.session is None:
+            self.session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.connection_limit))
+            self._token_lock = asyncio.Lock()
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    def get_connect(self, secret_data):
+        self.project_id = secret_data.get('project_id')
+        self.credentials = CREDENTIAL_CACHE.get_credentials(secret_data)
+
+    async def list_regions(self):
+        result = await self._get(f'projects/{self.project_id}/regions')
+        return result.get('items', [])
+
+    async def list_zones(self):
+        result = await self._get(f'projects/{self.project_id}/zones')
+        return result.get('items', [])
+
+    async def list_instances(self, **query):
+        status_filter = {'key': 'status', 'values': ['PROVISIONING', 'STAGING', 'RUNNING', 'STOPPING', 'REPAIRING',
+                                                     'SUSPENDING', 'SUSPENDED', 'TERMINATED']}
+        filters = query.pop('filter', []) + [status_filter]
+        filter_strings = [GoogleCloudComputeConnector._get_full_filter_string(f.get('key', ''), f.get('values', []))
+                          for f in filters]
+        query.update({'filter': ' AND '.join([f for f in filter_strings if f != ''])})
+        return await self._list_aggregated('instances', 'instances', **query)
+
+    async def list_machine_types(self, **query):
+        return await self._list_aggregated('machineTypes', 'machineTypes', **query)
+
+    async def get_machine_type_index(self):
+        """ asyncio version of GoogleCloudComputeConnector.get_machine_type_index """
+        if MACHINE_TYPE_CATALOGUE.begin_refresh():
+            query = self._set_fields('machineTypes', 'aggregatedList')
+            machine_types = []
+            try:
+                async for response in self._pages(f'projects/{self.project_id}/aggregated/machineTypes',
+                                                  skip_error=False, **query):
+                    for scoped_list in response.get('items', {}).values():
+                        machine_types.extend(scoped_list.get('machineTypes', []))
+            except Exception as e:
+                MACHINE_TYPE_CATALOGUE.fail_refresh()
+                _LOGGER.error(f'[GoogleCloudComputeAsyncConnector] aggregated/machineTypes failed, '
+                              f'catalogue is not refreshed: {e}')
+            else:
+                MACHINE_TYPE_CATALOGUE.refresh(machine_types)
+
+        return MACHINE_TYPE_CATALOGUE.get_index()
+
+    async def list_url_maps(self, **query):
+        return await self._list_aggregated('urlMaps', 'urlMaps', **query)
+
+    async def list_back_end_services(self, **query):
+        return await self._list_aggregated('backendServices', 'backendServices', **query)
+
+    async def list_disks(self, **query):
+        return await self._list_aggregated('disks', 'disks', **query)
+
+    async def list_autoscalers(self, **query):
+        return await self._list_aggregated('autoscalers', 'autoscalers', **query)
+
+    async def list_firewall(self, **query):
+        query = self._set_fields('firewalls', 'list', **query)
+        return await self._list(f'projects/{self.project_id}/global/firewalls', **query)
+
+    async def list_images(self, public_id, **query) -> dict:
+        query = self._set_fields('images', 'list', **query)
+        query.update({'orderBy': 'creationTimestamp desc'})
+        fields = query.get('fields')
+
+        public_images = IMAGE_CATALOGUE.get_public_images(fields)
+        if public_images is None:
+            responses = await asyncio.gather(*[self._list_images(project, **query)
+                                               for project in PUBLIC_IMAGE_PROJECTS.values()])
+            public_images = {key: images for key, (images, _) in zip(PUBLIC_IMAGE_PROJECTS.keys(), responses)}
+            # a partial catalogue is used by this collect only
+            if not any([failed for _, failed in responses]):
+                IMAGE_CATALOGUE.set_public_images(public_images, fields)
+
+        custom_images = IMAGE_CATALOGUE.get_custom_images(public_id, fields)
+        if custom_images is None:
+            custom_images, failed = await self._list_images(public_id, **query)
+            if not failed:
+                IMAGE_CATALOGUE.set_custom_images(public_id, custom_images, fields)
+
+        return {**public_images, 'custom': custom_images}
+
+    async def _list_images(self, image_project, **query):
+        """ (every page of images in image_project, True if the listing failed) """
+        images = []
+        try:
+            async for response in self._pages(f'projects/{image_project}/global/images', skip_error=False, **query):
+                images.extend(response.get('items', []))
+        except Exception as e:
+            _LOGGER.error(f'[GoogleCloudComputeAsyncConnector] projects/{image_project}/global/images skipped: {e}')
+            return [], True
+        return images, False
+
+    async def list_instance_groups(self, **query):
+        return await self._list_aggregated('instanceGroups', 'instanceGroups', **query)
+
+    async def get_machine_type(self, zone, machine_type, **query):
+        response = {}
+        query = self._set_fields('machineTypes', 'get', **query)
+        try:
+            response = await self._get(f'projects/{self.project_id}/zones/{zone}/machineTypes/{machine_type}',
+                                       family='get', **query)
+        except Exception as e:
+            _LOGGER.error(f'[GoogleCloudComputeAsyncConnector] machineTypes/{machine_type} of {zone} failed: {e}')
+
+        return response
+
+    async def list_instance_from_instance_groups(self, instance_group_name, key, loc, **query):
+        """ every page of instanceGroups().listInstances, same as the sync connector """
+        scope = 'zones' if key == 'zone' else 'regions'
+        path = f'projects/{self.project_id}/{scope}/{loc}/instanceGroups/{instance_group_name}/listInstances'
+        query = self._set_fields('instanceGroupInstances', 'list', **query)
+
+        response = []
+        try:
+            async for page in self._pages(path, skip_error=False, method='POST', **query):
+                response.extend(page.get('items', []))
+        except Exception as e:
+            _LOGGER.error(f'[GoogleCloudComputeAsyncConnector] listInstances of {instance_group_name} skipped: {e}')
+            return []
+
+        return response
+
+    async def list_operations(self, scopes=None, **query):
+        """ asyncio version of GoogleCloudComputeConnector.list_operations, a failed page raises """
+        query = self._set_fields('globalOperations', 'aggregatedList', items_key='operations', **query)
+        operations = []
+        async for response in self._pages(f'projects/{self.project_id}/aggregated/operations', skip_error=False,
+                                          **query):
+            for key, scoped_list in response.get('items', {}).items():
+                if GoogleCloudComputeConnector._is_in_scopes(key, scopes):
+                    operations.extend(scoped_list.get('operations', []))
+        return operations
+
+    async def list_instance_group_managers(self, **query):
+        return await self._list_aggregated('instanceGroupManagers', 'instanceGroupManagers', **query)
+
+    async def list_vpcs(self, **query):
+        query = self._set_fields('networks', 'list', **query)
+        return await self._list(f'projects/{self.project_id}/global/networks', **query)
+
+    async def list_subnetworks(self, **query):
+        return await self._list_aggregated('subnetworks', 'subnetworks', **query)
+
+    async def list_target_pools(self, **query):
+        return await self._list_aggregated('targetPools', 'targetPools', **query)
+
+    async def list_forwarding_rules(self, **query):
+        return await self._list_aggregated('forwardingRules', 'forwardingRules', **query)
+
+    async def set_instance_into_instance_group_managers(self, instance_group_managers):
+        async def _set_instance_list(instance_group):
+            key, loc = GoogleCloudComputeConnector._get_loc_from(instance_group)
+            instance_group_name = GoogleCloudComputeConnector._get_instance_group_name(instance_group)
+            inst_list = await self.list_instance_from_instance_groups(instance_group_name, key, loc)
+            instance_group.update({
+                'instance_list': inst_list
+            })
+
+        await asyncio.gather(*[_set_instance_list(instance_group) for instance_group in instance_group_managers])
+
+    async def _list_aggregated(self, resource, items_key, scopes=None, **query):
+        resource_list = []
+        query = self._set_fields(resource, 'aggregatedList', **query)
+        async for response in self._pages(f'projects/{self.project_id}/aggregated/{resource}', **query):
+            for key, scoped_list in response.get('items', {}).items():
+                if items_key in scoped_list and GoogleCloudComputeConnector._is_in_scopes(key, scopes):
+                    resource_list.extend(scoped_list.get(items_key))
+        return resource_list
+
+    async def _list(self, path, **query):
+        resource_list = []
+        query.pop('scopes', None)
+        async for response in self._pages(path, **query):
+            resource_list.extend(response.get('items', []))
+        return resource_list
+
+    async def _pages(self, path, skip_error=True, method='GET', **query):
+        while True:
+            try:
+                response = await self._get(path, method=method, **query)
+            except Exception as e:
+                if not skip_error:
+                    raise
+                _LOGGER.error(f'[GoogleCloudComputeAsyncConnector] {path} skipped: {e}')
+                return
+
+            yield response
+
+            next_page_token = response.get('nextPageToken')
+            if not next_page_token:
+                return
+            query.update({'pageToken': next_page_token})
+
+    def _set_fields(self, resource, list_type, items_key=None, **query):
+        if self.field_mask and 'fields' not in query:
+            fields = get_fields(resource, list_type, items_key)
+            if fields is not None:
+                query.update({'fields': fields})
+        return query
+
+    async def _get(self, path, method='GET', family='list', **query):
+        params = {k: str(v).lower() if isinstance(v, bool) else str(v) for k, v in query.items() if v is not None}
+
+        async def _request():
+            headers = {'Authorization': f'Bearer {await self._get_token()}'}
+            async with self.session.request(method, f'{self.endpoint}/{path}', params=params, headers=headers) as res:
+                if not res.ok:
+                    # the error body is kept as the message, its reason tells a rate limited 403 from a denied one
+                    raise aiohttp.ClientResponseError(res.request_info, res.history, status=res.status,
+                                                      message=await res.text(), headers=res.headers)
+                return await res.json()
+
+        # shares the rate limit of the sync connector, 429 / 5xx / rate limited 403 are retried with backoff
+        return await RATE_LIMITER.execute_async(self.project_id, family, _request)
+
+    async def _get_token(self):
+        async with self._token_lock:
+            if not self.credentials.valid:
+                # google-auth refreshes synchronously, so keep the token exchange off the event loop
+                loop = asyncio.get_running_loop()
+                await loop.run_in_executor(None, self.credentials.refresh,
+                                           google_auth_httplib2.Request(httplib2.Http()))
+        return self.credentials.token
@@ -1,21 +1,49 @@
 __all__ = ["GoogleCloudComputeConnector"]
 
+import json
 import logging
 import os
-import google.oauth2.service_account
+import time
+import threading
+import httplib2
+import google_auth_httplib2
 import googleapiclient
 import googleapiclient.discovery
 from spaceone.core.connector import BaseConnector
+from spaceone.inventory.libs.credential_cache import CREDENTIAL_CACHE
+from spaceone.inventory.libs.field_mask import get_fields, mask_resources
+from spaceone.inventory.libs.image_catalogue import IMAGE_CATALOGUE, PUBLIC_IMAGE_PROJECTS
+from spaceone.inventory.libs.machine_type_catalogue import MACHINE_TYPE_CATALOGUE
+from spaceone.inventory.libs.rate_limiter import RATE_LIMITER
 
 _LOGGER = logging.getLogger(__name__)
-INSTANCE_TYPE_FILE = '%s/conf/%s' % (os.path.dirname(os.path.abspath(__file__)), 'instances.json')
+DISCOVERY_DOCUMENT_FILE = '%s/conf/%s' % (os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                          'compute_v1_discovery.json')
+BATCH_SIZE = 100
+# resources listed per zone / region instead of aggregatedList, when a collect is limited to some regions
+# (not disks: disks().list of a zone misses the regional persistent disks, listed under regions/<region>)
+SCOPED_RESOURCES = {
+    'instances': 'zone',
+    'machineTypes': 'zone',
+    'subnetworks': 'region',
+    'targetPools': 'region'
+}
 
 
 class GoogleCloudComputeConnector(BaseConnector):
+    # compute v1 service built from the pinned discovery document, shared by every connector in the process
+    _service = None
+    _service_lock = threading.Lock()
 
     def __init__(self, transaction=None, config=None):
         self.client = None
         self.project_id = None
+        self.credentials = None
+        self.field_mask = True
+        self.field_mask_debug = False
+        self._local = threading.local()
+        # machine types asked by get_machine_type in this collect, (zone, machine_type) -> response
+        self._machine_types = {}
 
     def verify(self, options, secret_data):
         self.get_connect(secret_data)
@@ -31,21 +59,74 @@ class GoogleCloudComputeConnector(BaseConnector):
         """
         try:
             self.project_id = secret_data.get('project_id')
-            credentials = google.oauth2.service_account.Credentials.from_service_account_info(secret_data)
-            self.client = googleapiclient.discovery.build('compute', 'v1', credentials=credentials)
+            self.credentials = CREDENTIAL_CACHE.get_credentials(secret_data)
+            self.client = self.get_service()
         except Exception as e:
             print(e)
             raise self.client(message='connection failed. Please check your authentication information.')
 
+    @classmethod
+    def get_service(cls):
+        """
+        Build the compute v1 service once per process from the pinned discovery document.
+        The service carries no credentials, every request is executed with the authorized http of its connector.
+        """
+        if cls._service is None:
+            with cls._service_lock:
+                if cls._service is None:
+                    with open(DISCOVERY_DOCUMENT_FILE) as f:
+                        document = json.load(f)
+                    cls._service = googleapiclient.discovery.build_from_document(document, http=httplib2.Http())
+
+        return cls._service
+
+    def reset_after_fork(self):
+        """ In a forked process: the authorized http of the forking thread shares its sockets with the parent,
+        and a lock of the parent may have been held by another thread at fork """
+        self._local = threading.local()
+        GoogleCloudComputeConnector._service_lock = threading.Lock()
+
+    def _get_http(self):
+        """
+        httplib2 is not thread-safe, so every worker thread executes its requests
+        through its own authorized transport.
+        """
+        http = getattr(self._local, 'http', None)
+        if http is None:
+            http = google_auth_httplib2.AuthorizedHttp(self.credentials, http=httplib2.Http())
+            self._local.http = http
+        return http
+
+    def _execute(self, request, family='list'):
+        """
+        Execute a request within the shared rate limit of this project.
+        429 / 5xx are retried with backoff, so a paginated listing resumes from the failed page.
+        """
+        return RATE_LIMITER.execute(self.project_id, family, request, self._get_http())
+
+    def set_field_mask(self, enabled=True, debug=False):
+        """
+        enabled: request only the fields registered in libs.field_mask (fields=)
+        debug: raise ERROR_FIELD_MASKED when a manager reads a key which is masked out
+        """
+        self.field_mask = enabled
+        self.field_mask_debug = enabled and debug
+
     def list_regions(self):
-        result = self.client.regions().list(project=self.project_id).execute()
-        return result.get('items', [])
+        query = self._set_fields('regions', 'list', project=self.project_id)
+        result = self._execute(self.client.regions().list(**query))
+        return self._mask('regions', result.get('items', []))
 
     def list_zones(self):
-        result = self.client.zones().list(project=self.project_id).execute()
-        return result.get('items', [])
+        query = self._set_fields('zones', 'list', project=self.project_id)
+        result = self._execute(self.client.zones().list(**query))
+        return self._mask('zones', result.get('items', []))
 
     def list_instances(self, **query):
+        return self._flatten(self.iter_instances(**query))
+
+    def iter_instances(self, **query):
+        """ Pages of list_instances, one list of instances per API response """
         status_filter = {'key': 'status', 'values': ['PROVISIONING', 'STAGING', 'RUNNING', 'STOPPING', 'REPAIRING',
                                                      'SUSPENDING', 'SUSPENDED', 'TERMINATED']}
 
@@ -55,306 +136,312 @@ class GoogleCloudComputeConnector(BaseConnector):
             query.update({'filter': [status_filter]})
 
         query = self.generate_key_query('filter', self._get_filter_to_params(**query), '', is_default=True, **query)
+        return self._iter_aggregated('instances', **query)
 
-        instance_list = []
-        query.update({'project': self.project_id})
-        request = self.client.instances().aggregatedList(**query)
-
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, _instance_list in response['items'].items():
-                    if 'instances' in _instance_list:
-                        instance_list.extend(_instance_list.get('instances'))
-                request = self.client.instances().aggregatedList_next(previous_request=request,
-                                                                      previous_response=response)
-            except Exception as e:
-                request = None
-                print(e)
+    def list_operations(self, **query):
+        """ zone, region and global operations of the project, globalOperations().aggregatedList covers the three.
+        A failed page raises, an incomplete history can not tell which resources did not change.
+        """
+        return self._flatten(self._iter_aggregated('globalOperations', skip_error=False, items_key='operations',
+                                                   **query))
 
+    def list_machine_types(self, **query):
+        return self._list_aggregated('machineTypes', **query)
 
-        return instance_list
+    def iter_machine_types(self, **query):
+        return self._iter_aggregated('machineTypes', **query)
 
-    def list_machine_types(self, **query):
-        machine_type_list = []
-        query.update({'project': self.project_id})
-        request = self.client.machineTypes().aggregatedList(**query)
-        while request is not None:
+    def get_machine_type_index(self):
+        """
+        MachineTypeIndex of MACHINE_TYPE_CATALOGUE, which replaces list_machine_types in a collect.
+        The aggregated list of every zone is requested only when the catalogue is expired,
+        by one caller at a time, and no sooner than retry_interval after a failed request.
+        """
+        if MACHINE_TYPE_CATALOGUE.begin_refresh():
             try:
-                response = request.execute()
-                for key, machine_type in response['items'].items():
-                    if 'machineTypes' in machine_type:
-                        machine_type_list.extend(machine_type.get('machineTypes'))
-                request = self.client.machineTypes().aggregatedList_next(previous_request=request,
-                                                                         previous_response=response)
+                machine_types = self._flatten(self._iter_aggregated('machineTypes', skip_error=False))
             except Exception as e:
-                request = None
-                print(e)
+                MACHINE_TYPE_CATALOGUE.fail_refresh()
+                _LOGGER.error(f'[GoogleCloudComputeConnector] machineTypes().aggregatedList failed, '
+                              f'catalogue is not refreshed: {e}')
+            else:
+                MACHINE_TYPE_CATALOGUE.refresh(machine_types)
 
-        return machine_type_list
+        return MACHINE_TYPE_CATALOGUE.get_index()
 
     def list_url_maps(self, **query):
-        url_map_list = []
-        query.update({'project': self.project_id})
-        request = self.client.urlMaps().aggregatedList(**query)
+        return self._list_aggregated('urlMaps', **query)
 
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, url_scoped_list in response['items'].items():
-                    if 'urlMaps' in url_scoped_list:
-                        url_map_list.extend(url_scoped_list.get('urlMaps'))
-                request = self.client.urlMaps().aggregatedList_next(previous_request=request, previous_response=response)
-            except Exception as e:
-                request = None
-                print(e)
-        return url_map_list
+    def iter_url_maps(self, **query):
+        return self._iter_aggregated('urlMaps', **query)
 
     def list_back_end_services(self, **query):
-        backend_svc_list = []
-        query.update({'project': self.project_id})
-        request = self.client.backendServices().aggregatedList(**query)
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, url_scoped_list in response['items'].items():
-                    if 'backendServices' in url_scoped_list:
-                        backend_svc_list.extend(url_scoped_list.get('backendServices'))
-                request = self.client.backendServices().aggregatedList_next(previous_request=request,
-                                                                            previous_response=response)
-            except Exception as e:
-                request = None
-                print(e)
-        return backend_svc_list
+        return self._list_aggregated('backendServices', **query)
+
+    def iter_back_end_services(self, **query):
+        return self._iter_aggregated('backendServices', **query)
 
     def list_disks(self, **query):
-        disk_list = []
-        query.update({'project': self.project_id})
-        request = self.client.disks().aggregatedList(**query)
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, _disk in response['items'].items():
-                    if 'disks' in _disk:
-                        disk_list.extend(_disk.get('disks'))
-                request = self.client.disks().aggregatedList_next(previous_request=request,
-                                                                  previous_response=response)
-            except Exception as e:
-                request = None
-                print(f'Error occurred at DiskConnector: disks().aggregatedList(**query) : skipped \n {e}')
+        return self._list_aggregated('disks', **query)
 
-        return disk_list
+    def iter_disks(self, **query):
+        return self._iter_aggregated('disks', **query)
 
     def list_autoscalers(self, **query):
-        autoscaler_list = []
-        query.update({'project': self.project_id})
-        request = self.client.autoscalers().aggregatedList(**query)
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, _autoscaler_list in response['items'].items():
-                    if 'autoscalers' in _autoscaler_list:
-                        autoscaler_list.extend(_autoscaler_list.get('autoscalers'))
-                request = self.client.autoscalers().aggregatedList_next(previous_request=request,
-                                                                        previous_response=response)
-            except Exception as e:
-                request = None
-                print(f'Error occurred at AutoScalerConnector: autoscalers().aggregatedList(**query) : skipped \n {e}')
+        return self._list_aggregated('autoscalers', **query)
 
-        return autoscaler_list
+    def iter_autoscalers(self, **query):
+        return self._iter_aggregated('autoscalers', **query)
 
     def list_firewall(self, **query):
-        firewalls_list = []
-        query.update({'project': self.project_id})
-        request = self.client.firewalls().list(**query)
+        return self._list('firewalls', **query)
 
-        while request is not None:
-            try:
-                response = request.execute()
-                for backend_bucket in response.get('items', []):
-                    firewalls_list.append(backend_bucket)
-                request = self.client.firewalls().list_next(previous_request=request, previous_response=response)
-            except Exception as e:
-                request = None
-                print(f'Error occurred at FirewallConnector: firewalls().list(**query) : skipped \n {e}')
-
-        return firewalls_list
+    def iter_firewall(self, **query):
+        return self._iter_list('firewalls', **query)
 
     def list_images(self, public_id, **query) -> dict:
-        public_images = {}
-        public_image_list = [
-            {'key': 'centos', 'value': 'centos-cloud'},
-            {'key': 'coreos', 'value': 'coreos-cloud'},
-            {'key': 'debian', 'value': 'debian-cloud'},
-            {'key': 'google', 'value': 'google-containers'},
-            {'key': 'opensuse', 'value': 'opensuse-cloud'},
-            {'key': 'rhel', 'value': 'rhel-cloud'},
-            {'key': 'suse', 'value': 'suse-cloud'},
-            {'key': 'ubuntu', 'value': 'ubuntu-os-cloud'},
-            {'key': 'windows', 'value': 'windows-cloud'},
-            {'key': 'custom', 'value': public_id}
-        ]
-
-        for public_image in public_image_list:
-            query.update({'project': public_image.get('value'),
-                          'orderBy': 'creationTimestamp desc'}
-                         )
-            response = self.client.images().list(**query).execute()
-            public_images[public_image.get('key')] = response.get('items', [])
-
-        return public_images
+        """
+        Images of every public image project and the custom images of public_id (key: 'custom').
+        Both come from IMAGE_CATALOGUE while they are fresh, otherwise every page is listed again.
+        """
+        query = self._set_fields('images', 'list', **query)
+        query.update({'orderBy': 'creationTimestamp desc'})
+        fields = query.get('fields')
+
+        with IMAGE_CATALOGUE.lock:
+            public_images = IMAGE_CATALOGUE.get_public_images(fields)
+            if public_images is None:
+                public_images, failed = {}, False
+                for key, project in PUBLIC_IMAGE_PROJECTS.items():
+                    public_images[key], _failed = self._list_images(project, **query)
+                    failed = failed or _failed
+
+                # a partial catalogue is used by this collect only
+                if not failed:
+                    IMAGE_CATALOGUE.set_public_images(public_images, fields)
+
+        custom_images = IMAGE_CATALOGUE.get_custom_images(public_id, fields)
+        if custom_images is None:
+            custom_images, failed = self._list_images(public_id, **query)
+            if not failed:
+                IMAGE_CATALOGUE.set_custom_images(public_id, custom_images, fields)
+
+        return {**public_images, 'custom': custom_images}
+
+    def _list_images(self, image_project, **query):
+        """ (every page of images in image_project, True if the listing failed) """
+        try:
+            return self._flatten(self._iter_list('images', skip_error=False, project=image_project, **query)), False
+        except Exception as e:
+            _LOGGER.error(f'[GoogleCloudComputeConnector] images().list(project={image_project}) skipped: {e}')
+            return [], True
 
     def list_instance_groups(self, **query):
-        instance_group_list = []
-        query.update({'project': self.project_id})
-        request = self.client.instanceGroups().aggregatedList(**query)
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, _instance_group_list in response['items'].items():
-                    if 'instanceGroups' in _instance_group_list:
-                        instance_group_list.extend(_instance_group_list.get('instanceGroups'))
-                request = self.client.instanceGroups().aggregatedList_next(previous_request=request,
-                                                                           previous_response=response)
-            except Exception as e:
-                request = None
-                print(f'Error occurred at FirewallConnector: instanceGroups().aggregatedList(**query) : skipped \n {e}')
+        return self._list_aggregated('instanceGroups', **query)
 
-        return instance_group_list
+    def iter_instance_groups(self, **query):
+        return self._iter_aggregated('instanceGroups', **query)
 
     def get_machine_type(self, zone, machine_type, **query):
+        if (zone, machine_type) in self._machine_types:
+            return self._machine_types[(zone, machine_type)]
+
         response = {}
+        query = self._set_fields('machineTypes', 'get', **query)
         query.update({'project': self.project_id, 'zone': zone, 'machineType': machine_type})
         try:
-            response = self.client.machineTypes().get(**query).execute()
+            response = self._execute(self.client.machineTypes().get(**query), family='get')
         except Exception as e:
             print(e)
 
+        self._machine_types[(zone, machine_type)] = response
         return response
 
     def list_instance_from_instance_groups(self, instance_group_name, key, loc, **query):
         query = self.generate_query(**query)
         query.update({key: loc, 'instanceGroup': instance_group_name})
+        query = self._set_fields('instanceGroupInstances', 'list', **query)
         response = []
 
         try:
-            request = self.client.instanceGroups().listInstances(**query).execute() if key == 'zone' else \
-                self.client.regionInstanceGroups().listInstances(**query).execute()
-            response = request.get('items', [])
+            request = self.client.instanceGroups().listInstances(**query) if key == 'zone' else \
+                self.client.regionInstanceGroups().listInstances(**query)
+            request = self._execute(request)
+            response = self._mask('instanceGroupInstances', request.get('items', []))
 
         except Exception as e:
             print(f'Error occurred at list_instance: listInstances().execute(**query) : skipped \n {e}')
 
-
         return response
 
     def list_instance_group_managers(self, **query):
-        instance_group_manager_list = []
-        query.update({'project': self.project_id})
-        request = self.client.instanceGroupManagers().aggregatedList(**query)
+        return self._list_aggregated('instanceGroupManagers', **query)
 
-        while request is not None:
-            try:
-                response = request.execute()
-                for key, _instance_group_manager_list in response['items'].items():
-                    if 'instanceGroupManagers' in _instance_group_manager_list:
-                        instance_group_manager_list.extend(_instance_group_manager_list.get('instanceGroupManagers'))
-                request = self.client.instanceGroupManagers().aggregatedList_next(previous_request=request,
-                                                                                  previous_response=response)
-            except Exception as e:
-                request = None
-                print(e)
-
-        return instance_group_manager_list
+    def iter_instance_group_managers(self, **query):
+        return self._iter_aggregated('instanceGroupManagers', **query)
 
     def list_vpcs(self, **query):
-        network_list = []
-        query.update({'project': self.project_id})
-        request = self.client.networks().list(**query)
-        while request is not None:
-            try:
-                response = request.execute()
-                for network in response.get('items', []):
-                    network_list.append(network)
-                request = self.client.networks().list_next(previous_request=request, previous_response=response)
-            except Exception as e:
-                request = None
-                print(f'Error occurred at networks().list(**query) : skipped \n {e}')
+        return self._list('networks', **query)
 
-        return network_list
+    def iter_vpcs(self, **query):
+        return self._iter_list('networks', **query)
 
     def list_subnetworks(self, **query):
-        subnetworks_list = []
-        query = self.generate_query(**query)
-        request = self.client.subnetworks().aggregatedList(**query)
-        while request is not None:
-            try:
-                response = request.execute()
-                for name, _sbworks_list in response['items'].items():
-                    if 'subnetworks' in _sbworks_list:
-                        subnetworks_list.extend(_sbworks_list.get('subnetworks'))
-                request = self.client.addresses().aggregatedList_next(previous_request=request,
-                                                                      previous_response=response)
-            except Exception as e:
-                request = None
-                print(f'Error occurred at subnetworks().list(**query) : skipped \n {e}')
-
+        return self._list_aggregated('subnetworks', **query)
 
-        return subnetworks_list
+    def iter_subnetworks(self, **query):
+        return self._iter_aggregated('subnetworks', **query)
 
     def list_target_pools(self, **query):
-        target_pool_list = []
-        query.update({'project': self.project_id})
-        request = self.client.targetPools().aggregatedList(**query)
+        return self._list_aggregated('targetPools', **query)
+
+    def iter_target_pools(self, **query):
+        return self._iter_aggregated('targetPools', **query)
+
+    def list_forwarding_rules(self, **query):
+        return self._list_aggregated('forwardingRules', **query)
+
+    def iter_forwarding_rules(self, **query):
+        return self._iter_aggregated('forwardingRules', **query)
+
+    def list_instances_in_groups(self, instance_group_managers, **query):
+        """
+        listInstances of every zonal / regional instance group, merged into batch requests
+        of up to BATCH_SIZE sub requests per round trip.
+
+        Returns: dict of instance group manager selfLink -> list of instances in the group
+        """
+        members = {}
+        pending = []
+        query = self._set_fields('instanceGroupInstances', 'list', **query)
+
+        for instance_group in instance_group_managers:
+            key, loc = self._get_loc_from(instance_group)
+            self_link = instance_group.get('selfLink', '')
+            _query = self.generate_query(**query)
+            _query.update({key: loc, 'instanceGroup': self._get_instance_group_name(instance_group)})
+            resource = self.client.instanceGroups() if key == 'zone' else self.client.regionInstanceGroups()
+            members[self_link] = []
+            pending.append((self_link, resource, resource.listInstances(**_query), 0))
+
+        while pending:
+            chunk, pending = pending[:BATCH_SIZE], pending[BATCH_SIZE:]
+            retry_delays = []
+
+            def _callback(request_id, response, exception):
+                self_link, resource, request, attempt = chunk[int(request_id)]
+                if exception is not None:
+                    # throttled sub requests are sent again in the next batch
+                    delay = RATE_LIMITER.get_retry_delay(self.project_id, 'list', exception, attempt)
+                    if delay is not None:
+                        retry_delays.append(delay)
+                        pending.append((self_link, resource, request, attempt + 1))
+                    else:
+                        _LOGGER.error(f'[GoogleCloudComputeConnector] listInstances({self_link}) skipped: {exception}')
+                    return
+
+                members[self_link].extend(self._mask('instanceGroupInstances', response.get('items', [])))
+                next_request = resource.listInstances_next(previous_request=request, previous_response=response)
+                if next_request is not None:
+                    pending.append((self_link, resource, next_request, 0))
+
+            batch = self.client.new_batch_http_request(callback=_callback)
+            for idx, (self_link, resource, request, attempt) in enumerate(chunk):
+                batch.add(request, request_id=str(idx))
 
-        while request is not None:
             try:
-                response = request.execute()
-                for key, pool_scoped_list in response['items'].items():
-                    if 'targetPools' in pool_scoped_list:
-                        target_pool_list.extend(pool_scoped_list.get('targetPools'))
-                request = self.client.targetPools().aggregatedList_next(previous_request=request,
-                                                                        previous_response=response)
+                RATE_LIMITER.execute(self.project_id, 'list', batch, self._get_http(), tokens=len(chunk))
             except Exception as e:
-                request = None
-                print(f'Error occurred at subnetworks().list(**query) : skipped \n {e}')
+                _LOGGER.error(f'[GoogleCloudComputeConnector] batch listInstances skipped: {e}')
 
+            if retry_delays:
+                time.sleep(max(retry_delays))
 
-        return target_pool_list
-
-    def list_forwarding_rules(self, **query):
-        forwarding_rule_list = []
-        query.update({'project': self.project_id})
-        request = self.client.forwardingRules().aggregatedList(**query)
-        while request is not None:
-            response = request.execute()
-            for key, forwarding_scoped_list in response['items'].items():
-                if 'forwardingRules' in forwarding_scoped_list:
-                    forwarding_rule_list.extend(forwarding_scoped_list.get('forwardingRules'))
-            request = self.client.forwardingRules().aggregatedList_next(previous_request=request,
-                                                                        previous_response=response)
-        return forwarding_rule_list
+        return members
 
     def set_instance_into_instance_group_managers(self, instance_group_managers):
+        members = self.list_instances_in_groups(instance_group_managers)
         for instance_group in instance_group_managers:
-            key, loc = self._get_loc_from(instance_group)
-            instance_group_name = instance_group.get('baseInstanceName', '')
-            inst_list = self.list_instance_from_instance_groups(instance_group_name, key, loc)
             instance_group.update({
-                'instance_list': inst_list
+                'instance_list': members.get(instance_group.get('selfLink', ''), [])
             })
 
-    def get_instance_in_group(self, key, value, instance_group, **query):
-        query.update({'project': self.project_id, key: value, 'instanceGroup': instance_group})
-        try:
+    def _list_aggregated(self, resource, scopes=None, **query):
+        """ All items of _iter_aggregated in one list """
+        return self._flatten(self._iter_aggregated(resource, scopes=scopes, **query))
 
-            response = self.client.instanceGroups().listInstances(**query).execute() if key == 'zone' else \
-                self.client.regionInstanceGroups().listInstances(**query).execute()
+    def _list(self, resource, **query):
+        """ All items of _iter_list in one list """
+        return self._flatten(self._iter_list(resource, **query))
 
-        except Exception as e:
-            _LOGGER.error(f'[InstanceGroupConnector] list_instance_in_group error: {e}')
+    def _iter_aggregated(self, resource, scopes=None, skip_error=True, items_key=None, **query):
+        """
+        Pages of <resource>().aggregatedList, each flattened over every zone / region scope.
+        A page is requested only when the previous one is consumed, so memory is bounded by the page size.
+        scopes(dict): {'zone': [zone, ...], 'region': [region, ...]} limits the result to these locations,
+                      resources in SCOPED_RESOURCES are listed per location instead.
+        skip_error: stop at a failed page (True) or raise its error (False)
+        items_key: key of the scoped lists when it is not the resource (ex. operations of globalOperations)
+        """
+        if scopes is not None and resource in SCOPED_RESOURCES:
+            scope_key = SCOPED_RESOURCES[resource]
+            for location in sorted(scopes.get(scope_key, [])):
+                yield from self._iter_list(resource, skip_error, **{scope_key: location}, **query)
+            return
 
-        return response
+        query = self._set_fields(resource, 'aggregatedList', items_key=items_key, **query)
+        query.update({'project': self.project_id})
+        collection = getattr(self.client, resource)()
+        request = collection.aggregatedList(**query)
+
+        while request is not None:
+            try:
+                response = self._execute(request)
+                request = collection.aggregatedList_next(previous_request=request, previous_response=response)
+            except Exception as e:
+                if not skip_error:
+                    raise
+                _LOGGER.error(f'[GoogleCloudComputeConnector] {resource}().aggregatedList skipped: {e}')
+                return
+
+            page = [item for key, scoped_list in response.get('items', {}).items()
+                    if self._is_in_scopes(key, scopes) for item in scoped_list.get(items_key or resource, [])]
+            if page:
+                yield self._mask(resource, page)
+
+    def _iter_list(self, resource, skip_error=True, **query):
+        """ Pages of <resource>().list, global or in the zone / region of query
+        skip_error: stop at a failed page (True) or raise its error (False)
+        """
+        query.pop('scopes', None)
+        query = self._set_fields(resource, 'list', **query)
+        query.setdefault('project', self.project_id)
+        collection = getattr(self.client, resource)()
+        request = collection.list(**query)
+
+        while request is not None:
+            try:
+                response = self._execute(request)
+                request = collection.list_next(previous_request=request, previous_response=response)
+            except Exception as e:
+                if not skip_error:
+                    raise
+                _LOGGER.error(f'[GoogleCloudComputeConnector] {resource}().list skipped: {e}')
+                return
+
+            page = response.get('items', [])
+            if page:
+                yield self._mask(resource, page)
+
+    def _set_fields(self, resource, list_type, items_key=None, **query):
+        if self.field_mask and 'fields' not in query:
+            fields = get_fields(resource, list_type, items_key)
+            if fields is not None:
+                query.update({'fields': fields})
+        return query
+
+    def _mask(self, resource, items):
+        return mask_resources(resource, items) if self.field_mask_debug else items
 
     def _get_filter_to_params(self, **query):
         filtering_list = []
@@ -387,12 +474,30 @@ class GoogleCloudComputeConnector(BaseConnector):
 
         return query
 
+    @staticmethod
+    def _flatten(pages):
+        return [item for page in pages for item in page]
+
     @staticmethod
     def get_region(zone):
         index = zone.find('-')
         region = zone[0:index] if index > -1 else ''
         return region
 
+    @staticmethod
+    def _is_in_scopes(scope, scopes):
+        # scope of aggregatedList: 'global' | 'zones/<zone>' | 'regions/<region>'
+        if scopes is None or scope == 'global':
+            return True
+        scope_type, _, location = scope.partition('/')
+        return location in scopes.get('zone' if scope_type == 'zones' else 'region', [])
+
+    @staticmethod
+    def _get_instance_group_name(instance_group_manager):
+        instance_group = instance_group_manager.get('instanceGroup', '')
+        return instance_group[instance_group.rfind('/') + 1:] if instance_group != '' \
+            else instance_group_manager.get('name', '')
+
     @staticmethod
     def _get_loc_from(instance_group):
         key = 'region' if instance_group.get('region') else 'zone'
@@ -4,3 +4,6 @@ from spaceone.core.error import ERROR_BASE
 class ERROR_PLUGIN_VERIFY_FAILED(ERROR_BASE):
     _message = '{plugin} failed to verify with {secret}'
 
+
+class ERROR_FIELD_MASKED(ERROR_BASE):
+    _message = '{resource}.{key} is read, but it is masked out by the field mask'
@@ -0,0 +1,92 @@
+__all__ = ['CredentialCache', 'CREDENTIAL_CACHE']
+
+import hashlib
+import logging
+import datetime
+import threading
+from collections import OrderedDict
+import httplib2
+import google.oauth2.service_account
+import google_auth_httplib2
+from spaceone.core import config
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_CREDENTIAL_CACHE = {'max_size': 256, 'refresh_margin': 300}
+
+
+class CredentialCache(object):
+    """
+    Process-wide LRU cache of service account credentials, keyed by client_email + private key fingerprint.
+    Cached credentials keep their access token between transactions, so a collect of a known service account
+    neither signs a new assertion nor exchanges a token, unless the token is about to expire.
+
+    Cache settings come from the global config (CREDENTIAL_CACHE)
+        CREDENTIAL_CACHE = {
+            'max_size': 256,            # number of service accounts kept
+            'refresh_margin': 300       # seconds before the expiry a cached token is refreshed
+        }
+    """
+
+    def __init__(self):
+        self._credentials = OrderedDict()
+        self._counters = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+        self._lock = threading.Lock()
+
+    def get_credentials(self, secret_data):
+        """ Credentials of secret_data, reused from the cache when the same key was seen before """
+        settings = {**DEFAULT_CREDENTIAL_CACHE, **config.get_global('CREDENTIAL_CACHE', {})}
+        key = self.get_key(secret_data)
+
+        with self._lock:
+            credentials = self._credentials.get(key)
+            if credentials is not None:
+                self._credentials.move_to_end(key)
+                self._counters['hits'] += 1
+            else:
+                self._counters['misses'] += 1
+
+        if credentials is None:
+            credentials = google.oauth2.service_account.Credentials.from_service_account_info(secret_data)
+            with self._lock:
+                credentials = self._credentials.setdefault(key, credentials)
+                self._credentials.move_to_end(key)
+                while len(self._credentials) > settings['max_size']:
+                    self._credentials.popitem(last=False)
+                    self._counters['evictions'] += 1
+
+        self._refresh_if_expiring(credentials, settings['refresh_margin'])
+        return credentials
+
+    def get_counters(self):
+        with self._lock:
+            return dict(self._counters, size=len(self._credentials))
+
+    def reset(self):
+        with self._lock:
+            self._credentials = OrderedDict()
+            self._counters = {'hits': 0, 'misses': 0, 'refreshes': 0, 'evictions': 0}
+
+    def _refresh_if_expiring(self, credentials, refresh_margin):
+        # credentials without a token yet get it on their first request
+        if credentials.token is None or credentials.expiry is None:
+            return
+
+        if credentials.expiry - datetime.datetime.utcnow() > datetime.timedelta(seconds=refresh_margin):
+            return
+
+        try:
+            credentials.refresh(google_auth_httplib2.Request(httplib2.Http()))
+            with self._lock:
+                self._counters['refreshes'] += 1
+        except Exception as e:
+            # the transport refreshes it again on the first request
+            _LOGGER.error(f'[CredentialCache] refresh of {credentials.service_account_email} failed: {e}')
+
+    @staticmethod
+    def get_key(secret_data):
+        fingerprint = hashlib.sha256(secret_data.get('private_key', '').encode('utf-8')).hexdigest()
+        return secret_data.get('client_email', ''), fingerprint
+
+
+CREDENTIAL_CACHE = CredentialCache()
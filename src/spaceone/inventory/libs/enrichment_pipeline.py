@@ -0,0 +1,78 @@
+__all__ = ['Enricher', 'EnrichmentPipeline']
+
+import time
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Enricher(object):
+    """
+    One stage of the EnrichmentPipeline.
+        name: key of the stage, used by options['disabled_enrichers']
+        enrich: callable(record, resource_index) which adds its part to the record of an instance
+        requires: global resource kinds it reads, they are not fetched when every enricher needing them is disabled
+        required: the stage can not be disabled
+        prepare: optional callable(resource_index) which builds the lookups of the stage ahead of the first record
+    """
+
+    def __init__(self, name, enrich, requires=(), required=False, prepare=None):
+        self.name = name
+        self.enrich = enrich
+        self.requires = tuple(requires)
+        self.required = required
+        self.prepare = prepare
+
+
+class EnrichmentPipeline(object):
+    """
+    Enrichers registered once per collect and run stage by stage over batches of instance records.
+    A record is a dict which starts with {'instance': ..., 'zone_info': ...} and is filled by every stage.
+    A stage which fails for a record sets record['error'] and the later stages skip that record,
+    so one broken instance does not stop the rest of its batch.
+
+    Time spent by every stage is summed over the collect, get_timings() returns it.
+    """
+
+    def __init__(self, enrichers, disabled=None):
+        disabled = set(disabled or [])
+        unknown = disabled - set([enricher.name for enricher in enrichers])
+        if unknown:
+            _LOGGER.warning(f'[EnrichmentPipeline] unknown enrichers are ignored: {sorted(unknown)}')
+
+        self.stages = [enricher for enricher in enrichers if enricher.required or enricher.name not in disabled]
+        self.timings = {enricher.name: 0.0 for enricher in self.stages}
+
+    def get_required_resources(self):
+        """ global resource kinds read by the enabled stages """
+        return set([kind for enricher in self.stages for kind in enricher.requires])
+
+    def prepare(self, resource_index):
+        """ build the lazy lookups of the enabled stages now, e.g. before worker processes are forked """
+        for stage in self.stages:
+            if stage.prepare is not None:
+                start_time = time.perf_counter()
+                stage.prepare(resource_index)
+                self.timings[stage.name] += time.perf_counter() - start_time
+
+    def run(self, records, resource_index):
+        for stage in self.stages:
+            start_time = time.perf_counter()
+            for record in records:
+                if record.get('error') is not None:
+                    continue
+                try:
+                    stage.enrich(record, resource_index)
+                except Exception as e:
+                    record['error'] = e
+            self.timings[stage.name] += time.perf_counter() - start_time
+        return records
+
+    def add_timings(self, timings):
+        """ sum the time spent by the stages of the same pipeline in another process """
+        for name, elapsed in timings.items():
+            if name in self.timings:
+                self.timings[name] += elapsed
+
+    def get_timings(self):
+        return {name: round(elapsed, 3) for name, elapsed in self.timings.items()}
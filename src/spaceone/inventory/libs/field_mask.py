@@ -0,0 +1,210 @@
+__all__ = ['FIELD_MASKS', 'get_fields', 'mask_resources', 'MaskedResource']
+
+from spaceone.inventory.error.custom import ERROR_FIELD_MASKED
+
+'''
+Partial response (fields=) of every list call, derived from what each manager reads.
+    key: None -> the whole value (maps and small objects)
+    key: {...} -> only these sub keys (objects or lists of objects)
+
+Keep this registry in sync with manager/compute_engine, collect with options.field_mask_debug to find
+the keys a manager reads but are masked out here.
+'''
+FIELD_MASKS = {
+    'instances': {
+        'id': None,
+        'name': None,
+        'zone': None,
+        'status': None,
+        'selfLink': None,
+        'fingerprint': None,
+        'machineType': None,
+        'cpuPlatform': None,
+        'creationTimestamp': None,
+        'deletionProtection': None,
+        'labels': None,
+        'tags': None,
+        'reservationAffinity': None,
+        'scheduling': None,
+        'disks': {'index': None, 'diskSizeGb': None, 'source': None, 'licenses': None},
+        'networkInterfaces': {'network': None, 'subnetwork': None, 'networkIP': None,
+                              'accessConfigs': {'natIP': None}},
+        'serviceAccounts': {'email': None}
+    },
+    'disks': {
+        'id': None,
+        'name': None,
+        'description': None,
+        'selfLink': None,
+        'type': None,
+        'sizeGb': None,
+        'labels': None,
+        'sourceImage': None
+    },
+    'autoscalers': {
+        'id': None,
+        'name': None,
+        'selfLink': None
+    },
+    'machineTypes': {
+        'name': None,
+        'selfLink': None,
+        'guestCpus': None,
+        'memoryMb': None
+    },
+    'images': {
+        'name': None,
+        'selfLink': None,
+        'description': None,
+        'licenses': None
+    },
+    'instanceGroupManagers': {
+        'id': None,
+        'name': None,
+        'selfLink': None,
+        'zone': None,
+        'region': None,
+        'instanceGroup': None,
+        'instanceTemplate': None,
+        'status': {'autoscaler': None, 'stateful': {'hasStatefulConfig': None}}
+    },
+    'instanceGroupInstances': {
+        'instance': None
+    },
+    'networks': {
+        'id': None,
+        'name': None,
+        'description': None,
+        'selfLink': None,
+        'subnetworks': None
+    },
+    'subnetworks': {
+        'id': None,
+        'name': None,
+        'selfLink': None,
+        'network': None,
+        'ipCidrRange': None,
+        'gatewayAddress': None
+    },
+    'firewalls': {
+        'id': None,
+        'name': None,
+        'description': None,
+        'network': None,
+        'priority': None,
+        'direction': None,
+        'targetTags': None,
+        'targetServiceAccounts': None,
+        'sourceRanges': None,
+        'sourceTags': None,
+        'allowed': None,
+        'denied': None
+    },
+    'forwardingRules': {
+        'target': None,
+        'IPProtocol': None,
+        'portRange': None,
+        'loadBalancingScheme': None
+    },
+    'targetPools': {
+        'name': None,
+        'selfLink': None,
+        'instances': None
+    },
+    'urlMaps': {
+        'name': None,
+        'defaultService': None
+    },
+    'backendServices': {
+        'selfLink': None,
+        'protocol': None,
+        'port': None,
+        'loadBalancingScheme': None,
+        'backends': {'group': None}
+    },
+    'regions': {
+        'name': None,
+        'zones': None
+    },
+    'globalOperations': {
+        'targetLink': None,
+        'operationType': None,
+        'status': None,
+        'insertTime': None,
+        'endTime': None
+    },
+    'zones': {
+        'name': None,
+        'region': None
+    }
+}
+
+
+def get_fields(resource, list_type='list', items_key=None):
+    """ fields= parameter of a call
+    Args:
+        resource (str): key of FIELD_MASKS
+        list_type (str): 'aggregatedList' | 'list' | 'get'
+        items_key (str): key of the scoped list in aggregatedList (default: resource)
+
+    Returns: partial response selector, None if the resource is not registered
+    """
+    mask = FIELD_MASKS.get(resource)
+    if mask is None:
+        return None
+
+    selector = _get_selector(mask)
+    if list_type == 'aggregatedList':
+        return f'items/*/{items_key or resource}({selector}),nextPageToken'
+    elif list_type == 'list':
+        return f'items({selector}),nextPageToken'
+    return selector
+
+
+def mask_resources(resource, items):
+    """ Wrap items into MaskedResource, so reading a masked out key raises ERROR_FIELD_MASKED """
+    mask = FIELD_MASKS.get(resource)
+    if mask is None:
+        return items
+    return [MaskedResource(resource, mask, item) for item in items]
+
+
+def _get_selector(mask):
+    return ','.join([key if sub_mask is None else f'{key}({_get_selector(sub_mask)})'
+                     for key, sub_mask in mask.items()])
+
+
+class MaskedResource(dict):
+    """ dict of a partial response, which raises ERROR_FIELD_MASKED when a key out of the field mask is read """
+
+    def __init__(self, resource, mask, item):
+        super().__init__({key: self._wrap(resource, mask.get(key), value) for key, value in item.items()})
+        self._resource = resource
+        self._mask = mask
+
+    def __getitem__(self, key):
+        self._check(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key):
+        self._check(key)
+        return super().__contains__(key)
+
+    def get(self, key, default=None):
+        self._check(key)
+        return super().get(key, default)
+
+    def _check(self, key):
+        # keys set after the fetch (ex. instance_list, lb_info) are not part of the response
+        if key not in self._mask and not super().__contains__(key):
+            raise ERROR_FIELD_MASKED(resource=self._resource, key=key)
+
+    @classmethod
+    def _wrap(cls, resource, mask, value):
+        if mask is None:
+            return value
+        elif isinstance(value, dict):
+            return cls(resource, mask, value)
+        elif isinstance(value, list):
+            return [cls(resource, mask, v) if isinstance(v, dict) else v for v in value]
+        return value
@@ -0,0 +1,79 @@
+__all__ = ['FirewallIndex', 'ALL_INSTANCES_TAG']
+
+# a target tag containing this applies the firewall to every instance of its network
+ALL_INSTANCES_TAG = 'allow-all-instance'
+
+
+class FirewallIndex(object):
+    """
+    Firewalls compiled once per collect.
+        network -> target tag -> firewalls
+        network -> firewalls of every instance (no target tag nor service account, or an 'allow-all-instance' tag)
+        target service account -> firewalls (applied to the instances of the firewall network)
+
+    The rule rows of a firewall are compiled once by compile_rules(firewall) and shared, and the rows of
+    a (networks, tags, service accounts) signature are memoized, so instances with the same signature
+    share one result. Rows come in the order of the firewall list, and a firewall is repeated for every
+    target tag / service account it matches, same as the loop over every firewall it replaces.
+    """
+
+    def __init__(self, firewalls, compile_rules):
+        self._compile_rules = compile_rules
+        self._rules = {}
+        self._by_network_tag = {}
+        self._all_instances = {}
+        self._by_service_account = {}
+        self._memo = {}
+
+        for position, firewall in enumerate(firewalls):
+            network = firewall.get('network', '')
+            if not firewall.get('targetTags') and not firewall.get('targetServiceAccounts'):
+                # a firewall without target applies to every instance of its network
+                self._all_instances.setdefault(network, []).append(position)
+
+            for target_tag in firewall.get('targetTags', []):
+                if ALL_INSTANCES_TAG in target_tag:
+                    self._all_instances.setdefault(network, []).append(position)
+                else:
+                    self._by_network_tag.setdefault((network, target_tag), []).append(position)
+
+            if 'targetServiceAccounts' in firewall:
+                for service_account in firewall.get('targetServiceAccounts', []):
+                    self._by_service_account.setdefault(service_account, []).append((position, network))
+
+        self._firewalls = firewalls
+
+    def get_rules(self, networks, tags, service_accounts):
+        """ rule rows of an instance, raises the error of a matched firewall whose rules failed to compile """
+        signature = (tuple(networks), tuple(tags), tuple(service_accounts))
+        if signature not in self._memo:
+            self._memo[signature] = self._match(networks, tags, service_accounts)
+        return list(self._memo[signature])
+
+    def _match(self, networks, tags, service_accounts):
+        matched = []
+        for network in set(networks):
+            matched.extend(self._all_instances.get(network, []))
+            for tag in set(tags):
+                matched.extend(self._by_network_tag.get((network, tag), []))
+
+        for service_account in set(service_accounts):
+            matched.extend([position for position, network in self._by_service_account.get(service_account, [])
+                            if network in networks])
+
+        rules = []
+        for position in sorted(matched):
+            rules.extend(self._get_compiled(position))
+        return rules
+
+    def _get_compiled(self, position):
+        if position not in self._rules:
+            try:
+                self._rules[position] = (self._compile_rules(self._firewalls[position]), None)
+            except Exception as e:
+                self._rules[position] = (None, e)
+
+        rules, error = self._rules[position]
+        if error is not None:
+            raise error
+        return rules
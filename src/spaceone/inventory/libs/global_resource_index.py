@@ -0,0 +1,115 @@
+__all__ = ['GlobalResourceIndex']
+
+import threading
+from spaceone.inventory.libs.firewall_index import FirewallIndex
+from spaceone.inventory.libs.instance_group_membership import InstanceGroupMembership
+from spaceone.inventory.libs.lazy_resources import LazyResources
+from spaceone.inventory.libs.load_balancer_topology import LoadBalancerTopology
+from spaceone.inventory.libs.os_image_index import OSImageIndex
+
+
+class GlobalResourceIndex(object):
+    """
+    Hash lookups over the zone independent resources of a collect, built once per collect,
+    so matching an instance costs O(its disks / NICs) instead of O(resources).
+    A lookup returns the first match in the listed order, same as the linear scans it replaces.
+
+    Every index is built by its first lookup, so with LazyResources a lookup only waits for the resource it reads.
+    Resources which are not indexed are still read as lists by get(key, default).
+    """
+
+    def __init__(self, global_resources):
+        self.global_resources = global_resources
+        self._indexes = {}
+        self._lock = threading.RLock()
+
+    @property
+    def membership(self):
+        return self._get_index('membership', lambda: InstanceGroupMembership(self.get('instance_group', [])))
+
+    def get(self, key, default=None):
+        return self.global_resources.get(key, default)
+
+    def load(self):
+        """ build every index now, waiting for every resource when they are fetched lazily """
+        if isinstance(self.global_resources, LazyResources):
+            self.global_resources.load()
+        for build in [self._get_disks, self._get_subnets, self._get_vpcs, self._get_auto_scalers]:
+            build()
+        return self.membership
+
+    def get_disk(self, self_link):
+        return self._get_disks()[0].get(self_link)
+
+    def get_disk_by_name(self, name):
+        return self._get_disks()[1].get(name)
+
+    def get_subnet(self, subnetwork_links):
+        """ subnet listed first among the subnetworks of an instance """
+        subnets_by_self_link = self._get_subnets()
+        matched = [subnets_by_self_link[link] for link in subnetwork_links if link in subnets_by_self_link]
+        return min(matched, key=lambda matched_subnet: matched_subnet[0])[1] if matched else None
+
+    def get_vpc(self, subnetwork):
+        return self._get_vpcs().get(subnetwork)
+
+    def get_auto_scaler(self, self_link):
+        return self._get_auto_scalers().get(self_link)
+
+    def get_instance_group(self, self_link):
+        return self.membership.get_group(self_link)
+
+    def is_managed_instance(self, self_link):
+        return self.membership.is_managed_stateless(self_link)
+
+    def get_os_image_index(self):
+        """ OSImageIndex of public_images, built by the first instance which asks for it """
+        return self._get_index('os_image', lambda: OSImageIndex(self.get('public_images', {})))
+
+    def get_firewall_index(self, compile_rules):
+        """ FirewallIndex of the firewalls, compiled by the first instance which asks for it """
+        return self._get_index('firewall', lambda: FirewallIndex(self.get('fire_walls', []), compile_rules))
+
+    def get_load_balancer_topology(self, compile_http_row, compile_target_pool_row):
+        """ LoadBalancerTopology of the load balancing resources, built by the first instance which asks for it """
+        return self._get_index('load_balancer', lambda: LoadBalancerTopology(
+            self.global_resources, self.membership, compile_http_row, compile_target_pool_row))
+
+    def _get_index(self, name, build):
+        if name not in self._indexes:
+            with self._lock:
+                if name not in self._indexes:
+                    self._indexes[name] = build()
+        return self._indexes[name]
+
+    def _get_disks(self):
+        def _build():
+            disks_by_self_link, disks_by_name = {}, {}
+            for disk in self.get('disk', []):
+                disks_by_self_link.setdefault(disk.get('selfLink', ''), disk)
+                disks_by_name.setdefault(disk.get('name', ''), disk)
+            return disks_by_self_link, disks_by_name
+        return self._get_index('disk', _build)
+
+    def _get_subnets(self):
+        def _build():
+            subnets_by_self_link = {}
+            for position, subnet in enumerate(self.get('subnets', [])):
+                subnets_by_self_link.setdefault(subnet.get('selfLink', ''), (position, subnet))
+            return subnets_by_self_link
+        return self._get_index('subnets', _build)
+
+    def _get_vpcs(self):
+        def _build():
+            vpcs_by_subnetwork = {}
+            for vpc in self.get('vpcs', []):
+                for subnetwork in vpc.get('subnetworks', []):
+                    vpcs_by_subnetwork.setdefault(subnetwork, vpc)
+            return vpcs_by_subnetwork
+        return self._get_index('vpcs', _build)
+
+    def _get_auto_scalers(self):
+        def _build():
+            return {auto_scaler.get('selfLink', ''): auto_scaler
+                    for auto_scaler in reversed(self.get('auto_scaler', []))}
+        return self._get_index('auto_scaler', _build)
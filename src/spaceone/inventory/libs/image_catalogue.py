@@ -0,0 +1,131 @@
+__all__ = ['ImageCatalogue', 'IMAGE_CATALOGUE', 'PUBLIC_IMAGE_PROJECTS']
+
+import os
+import json
+import time
+import logging
+import tempfile
+import threading
+from spaceone.core import config
+
+_LOGGER = logging.getLogger(__name__)
+
+# key of public_images -> image project, the key is matched against the license of the boot disk
+PUBLIC_IMAGE_PROJECTS = {
+    'centos': 'centos-cloud',
+    'coreos': 'coreos-cloud',
+    'debian': 'debian-cloud',
+    'google': 'google-containers',
+    'opensuse': 'opensuse-cloud',
+    'rhel': 'rhel-cloud',
+    'suse': 'suse-cloud',
+    'ubuntu': 'ubuntu-os-cloud',
+    'windows': 'windows-cloud'
+}
+DEFAULT_IMAGE_CATALOGUE = {
+    'ttl': 86400,
+    'custom_ttl': 3600,
+    'cache_dir': os.path.join(tempfile.gettempdir(), 'spaceone-google-cloud-compute')
+}
+CACHE_FILE_NAME = 'public_images.json'
+
+
+class ImageCatalogue(object):
+    """
+    Process-wide catalogue of images.
+    Public images are the same for every tenant, so they are shared by all collects and persisted on disk
+    to survive restarts. Custom images of a project are kept in memory only, separately per project.
+    Both are keyed by the fields selector they were listed with, so a different field mask lists them again.
+
+    Settings come from the global config (IMAGE_CATALOGUE)
+        IMAGE_CATALOGUE = {
+            'ttl': 86400,               # seconds a public image catalogue is used
+            'custom_ttl': 3600,         # seconds custom images of a project are used
+            'cache_dir': '/tmp/...'     # directory of the on-disk catalogue, '' to keep it in memory only
+        }
+    """
+
+    def __init__(self):
+        self.lock = threading.RLock()
+        self._public = None
+        self._custom = {}
+
+    def get_public_images(self, fields=None):
+        """ dict of key -> images, None if there is no fresh catalogue listed with these fields """
+        settings = self._get_settings()
+        with self.lock:
+            if self._public is None:
+                self._public = self._load(settings['cache_dir'])
+
+            if self._is_fresh(self._public, fields, settings['ttl']):
+                return self._public['images']
+        return None
+
+    def set_public_images(self, images, fields=None):
+        settings = self._get_settings()
+        catalogue = {'fields': fields, 'updated_at': time.time(), 'images': images}
+        with self.lock:
+            self._public = catalogue
+            self._save(settings['cache_dir'], catalogue)
+
+    def get_custom_images(self, project_id, fields=None):
+        """ custom images of project_id, None if they are not cached or expired """
+        settings = self._get_settings()
+        with self.lock:
+            catalogue = self._custom.get(project_id)
+            if self._is_fresh(catalogue, fields, settings['custom_ttl']):
+                return catalogue['images']
+        return None
+
+    def set_custom_images(self, project_id, images, fields=None):
+        settings = self._get_settings()
+        now = time.time()
+        with self.lock:
+            # drop expired projects, so tenants which are not collected anymore do not pile up
+            self._custom = {key: value for key, value in self._custom.items()
+                            if now - value['updated_at'] < settings['custom_ttl']}
+            self._custom[project_id] = {'fields': fields, 'updated_at': now, 'images': images}
+
+    def reset(self):
+        with self.lock:
+            self._public = None
+            self._custom = {}
+
+    @staticmethod
+    def _is_fresh(catalogue, fields, ttl):
+        return catalogue is not None and catalogue.get('fields') == fields and \
+            time.time() - catalogue.get('updated_at', 0) < ttl
+
+    @staticmethod
+    def _get_settings():
+        return {**DEFAULT_IMAGE_CATALOGUE, **config.get_global('IMAGE_CATALOGUE', {})}
+
+    @staticmethod
+    def _load(cache_dir):
+        if not cache_dir or not os.path.exists(os.path.join(cache_dir, CACHE_FILE_NAME)):
+            return None
+
+        try:
+            with open(os.path.join(cache_dir, CACHE_FILE_NAME)) as f:
+                return json.load(f)
+        except Exception as e:
+            _LOGGER.error(f'[ImageCatalogue] failed to load {cache_dir}/{CACHE_FILE_NAME}: {e}')
+            return None
+
+    @staticmethod
+    def _save(cache_dir, catalogue):
+        if not cache_dir:
+            return
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # write to a temporary file first, so other processes never read a partial catalogue
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(catalogue, f)
+            os.replace(tmp_path, os.path.join(cache_dir, CACHE_FILE_NAME))
+        except Exception as e:
+            _LOGGER.error(f'[ImageCatalogue] failed to save {cache_dir}/{CACHE_FILE_NAME}: {e}')
+
+
+IMAGE_CATALOGUE = ImageCatalogue()
@@ -0,0 +1,281 @@
+__all__ = ['IncrementalCollection', 'CollectionStateStore', 'COLLECTION_STATE_STORE', 'get_touched_resources',
+           'FULL', 'WIDE', 'NARROW', 'UNCHANGED']
+
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+import threading
+from datetime import datetime, timezone
+from google.protobuf import struct_pb2
+from spaceone.core import config
+from spaceone.inventory.libs.instance_group_membership import get_link_key
+from spaceone.inventory.libs.struct_serializer import to_struct
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_INCREMENTAL_COLLECTION = {
+    'full_resweep_interval': 21600,
+    'operation_margin': 300,
+    'cache_dir': os.path.join(tempfile.gettempdir(), 'spaceone-google-cloud-compute')
+}
+# modes of an incremental collect
+FULL, WIDE, NARROW, UNCHANGED = 'full', 'wide', 'narrow', 'unchanged'
+# operation targets which only change the servers referring to them,
+# any other target (firewall rules, load balancing, instance groups, unknown types) may change every server
+NARROW_TARGETS = ['instances', 'disks', 'subnetworks', 'networks']
+# global resource kind listed again in a narrow collect when its operation target type was touched
+TOUCHED_RESOURCE_KINDS = {'disks': 'disk', 'subnetworks': 'subnets', 'networks': 'vpcs'}
+# insertTime / endTime are in the offset of the zone of the operation, the history is filtered from a day earlier
+# and get_touched_resources checks the exact time
+OPERATION_FILTER_SLACK = 86400
+# above this number of touched instances, instances are listed without a name filter
+MAX_NAME_FILTER = 50
+
+
+def get_touched_resources(operations, since):
+    """ target type (instances, disks, ...) -> link keys of the targets of operations which ran after since (epoch)
+    An operation which is not DONE yet counts as well, whenever it was inserted.
+    """
+    touched = {}
+    for operation in operations:
+        target_link = operation.get('targetLink', '')
+        if not target_link:
+            continue
+
+        if operation.get('status') == 'DONE' and _get_epoch(operation.get('endTime') or
+                                                            operation.get('insertTime')) < since:
+            continue
+
+        target_type = target_link.rstrip('/').split('/')[-2]
+        touched.setdefault(target_type, set()).add(get_link_key(target_link))
+    return touched
+
+
+def _get_epoch(timestamp):
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except (TypeError, ValueError):
+        # an unreadable timestamp is taken as recent, the worst case is one server emitted again
+        return float('inf')
+
+
+class CollectionStateStore(object):
+    """
+    Process-wide store of the state of incremental collects, one JSON file per state key in cache_dir,
+    written the same way as the public image catalogue so it survives restarts.
+    The global resources of the last collect of a state key are kept in memory only (get_resources).
+        {
+            'watermark': 1667376000.0,          # start of the last finished collect (epoch)
+            'full_resweep_at': 1667350000.0,    # start of the last full collect (epoch)
+            'fingerprints': {instance link key: digest of its Server}
+        }
+
+    Settings come from the global config (INCREMENTAL_COLLECTION)
+        INCREMENTAL_COLLECTION = {
+            'full_resweep_interval': 21600,     # seconds between full collects
+            'operation_margin': 300,            # seconds the operation history is read before the watermark
+            'cache_dir': '/tmp/...'             # directory of the states, '' to keep them in memory only
+        }
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self._states = {}
+        self._resources = {}
+
+    def get_state(self, state_key):
+        settings = self.get_settings()
+        with self.lock:
+            if state_key not in self._states:
+                self._states[state_key] = self._load(settings['cache_dir'], state_key)
+            return self._states[state_key]
+
+    def set_state(self, state_key, state):
+        settings = self.get_settings()
+        with self.lock:
+            self._states[state_key] = state
+            self._save(settings['cache_dir'], state_key, state)
+
+    def get_resources(self, state_key):
+        with self.lock:
+            return self._resources.get(state_key, {})
+
+    def set_resources(self, state_key, resources):
+        with self.lock:
+            self._resources[state_key] = resources
+
+    def reset(self):
+        with self.lock:
+            self._states = {}
+            self._resources = {}
+
+    @staticmethod
+    def get_settings():
+        return {**DEFAULT_INCREMENTAL_COLLECTION, **config.get_global('INCREMENTAL_COLLECTION', {})}
+
+    @staticmethod
+    def _get_file_name(state_key):
+        return f'collection_state_{state_key}.json'
+
+    def _load(self, cache_dir, state_key):
+        path = os.path.join(cache_dir, self._get_file_name(state_key)) if cache_dir else ''
+        if not path or not os.path.exists(path):
+            return None
+
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except Exception as e:
+            _LOGGER.error(f'[CollectionStateStore] failed to load {path}: {e}')
+            return None
+
+    def _save(self, cache_dir, state_key, state):
+        if not cache_dir:
+            return
+
+        path = os.path.join(cache_dir, self._get_file_name(state_key))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            _LOGGER.error(f'[CollectionStateStore] failed to save {path}: {e}')
+
+
+COLLECTION_STATE_STORE = CollectionStateStore()
+
+
+class IncrementalCollection(object):
+    """
+    One incremental collect of a project, from the operation history since the watermark of the last one.
+        full:       no watermark yet, or the last full collect is older than full_resweep_interval
+        unchanged:  no operation since the watermark, nothing is listed nor emitted
+        narrow:     only instances, disks, subnetworks or networks changed, only the instances using them
+                    are transformed, and only the global resources of the touched types are listed again
+                    (the others are the ones of the last collect, when it ran in this process)
+        wide:       any other resource changed, shared by many servers (firewall, load balancing, instance group)
+                    or of a type this collector does not know, every instance is transformed
+    Except in full mode, a server is emitted only when it differs from the one emitted before (is_changed).
+
+    The state is saved by finish() only, so a collect which fails reads the same operations again next time.
+    Deleted instances are not reported, the inventory removes them after the next full collect.
+    """
+
+    def __init__(self, state_key, full_resweep_interval=None, store=None, now=None):
+        self.store = store or COLLECTION_STATE_STORE
+        self.state_key = state_key
+        self.started_at = now or time.time()
+        self.touched = {}
+        self.fingerprints = {}
+
+        settings = self.store.get_settings()
+        self.operation_margin = settings['operation_margin']
+        full_resweep_interval = full_resweep_interval or settings['full_resweep_interval']
+
+        self.state = self.store.get_state(state_key) or {}
+        if 'watermark' not in self.state or \
+                self.started_at - self.state.get('full_resweep_at', 0) >= full_resweep_interval:
+            self.mode = FULL
+        else:
+            self.mode = None
+
+    def get_operation_filter(self):
+        """ filter of list_operations which skips the history finished before the watermark, None in a full collect """
+        if self.mode == FULL:
+            return None
+
+        since = datetime.fromtimestamp(self.state['watermark'] - self.operation_margin - OPERATION_FILTER_SLACK,
+                                       timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        return f'(insertTime > "{since}") OR (endTime > "{since}") OR (status != "DONE")'
+
+    def set_operations(self, operations):
+        """ operations of the project (connector.list_operations), decides the mode of a collect which is not full.
+        None (the history could not be read) makes it a full collect.
+        """
+        if operations is None:
+            self.mode = FULL
+        if self.mode == FULL:
+            return self.mode
+
+        self.touched = get_touched_resources(operations, self.state['watermark'] - self.operation_margin)
+        if any(target_type not in NARROW_TARGETS for target_type in self.touched):
+            self.mode = WIDE
+        elif self.touched:
+            self.mode = NARROW
+        else:
+            self.mode = UNCHANGED
+        return self.mode
+
+    def get_instance_names(self):
+        """ names of the touched instances when nothing else can change a server, None to list every instance """
+        instances = self.touched.get('instances', set())
+        if self.mode != NARROW or set(self.touched.keys()) & set(NARROW_TARGETS) != {'instances'} or \
+                len(instances) > MAX_NAME_FILTER:
+            return None
+        return sorted(set([link[link.rfind('/') + 1:] for link in instances]))
+
+    def get_cached_resources(self, resource_kinds):
+        """ global resources of the last collect this one reads instead of listing them again,
+        every kind of resource_kinds except the touched ones in a narrow collect, none in another mode
+        """
+        if self.mode != NARROW:
+            return {}
+
+        resources = self.store.get_resources(self.state_key)
+        touched_kinds = self._get_touched_kinds()
+        return {kind: resources[kind] for kind in resource_kinds if kind in resources and kind not in touched_kinds}
+
+    def _get_touched_kinds(self):
+        return set([TOUCHED_RESOURCE_KINDS[target_type] for target_type in self.touched
+                    if target_type in TOUCHED_RESOURCE_KINDS])
+
+    def is_selected(self, instance):
+        """ the instance has to be transformed in this collect """
+        if self.mode != NARROW:
+            return self.mode != UNCHANGED
+
+        if get_link_key(instance.get('selfLink', '')) in self.touched.get('instances', set()):
+            return True
+        elif any(get_link_key(disk.get('source', '')) in self.touched.get('disks', set())
+                 for disk in instance.get('disks', [])):
+            return True
+        return any(get_link_key(nic.get('subnetwork', '')) in self.touched.get('subnetworks', set()) or
+                   get_link_key(nic.get('network', '')) in self.touched.get('networks', set())
+                   for nic in instance.get('networkInterfaces', []))
+
+    def is_changed(self, server):
+        """ records the fingerprint of a server (model, record or Struct), False if it is the one emitted before """
+        struct = server if isinstance(server, struct_pb2.Struct) else to_struct(server)
+        self_link = struct['reference']['resource_id'] if 'reference' in struct else ''
+        fingerprint = hashlib.sha1(struct.SerializeToString(deterministic=True)).hexdigest()
+
+        self.fingerprints[get_link_key(self_link)] = fingerprint
+        return self.mode == FULL or self.state.get('fingerprints', {}).get(get_link_key(self_link)) != fingerprint
+
+    def finish(self, resources=None):
+        """ save the watermark and the fingerprints once every server of the collect is emitted
+        resources: global resources of this collect (kind -> resources) the next narrow collect may read again
+        """
+        fingerprints = self.fingerprints
+        if self.mode in (NARROW, UNCHANGED):
+            # only part of the instances was seen, the others keep their fingerprint
+            fingerprints = {**self.state.get('fingerprints', {}), **self.fingerprints}
+
+        resources = resources or {}
+        if self.mode == NARROW:
+            # kinds of the touched types are only valid if they were listed again
+            resources = {**{kind: value for kind, value in self.store.get_resources(self.state_key).items()
+                            if kind not in self._get_touched_kinds()}, **resources}
+        if self.mode != UNCHANGED:
+            self.store.set_resources(self.state_key, resources)
+
+        self.store.set_state(self.state_key, {
+            'watermark': self.started_at,
+            'full_resweep_at': self.started_at if self.mode == FULL else self.state.get('full_resweep_at', 0),
+            'fingerprints': fingerprints
+        })
@@ -0,0 +1,55 @@
+__all__ = ['InstanceGroupMembership', 'get_link_key']
+
+
+def get_link_key(link):
+    """ part of a resource link from '/projects/', so an API version prefix does not matter """
+    return link[link.find('/projects/'):] if '/projects/' in link else link
+
+
+class InstanceGroupMembership(object):
+    """
+    Inverted index of the managed instance groups of a collect, built once from their instance_list.
+        instance selfLink -> instance groups (in the listed order, each group once)
+        instance selfLink -> autoscaler link of its first group
+        instance selfLink -> member of a stateless group (status.stateful.hasStatefulConfig is False)
+
+    AutoScalerManager, LoadBalancerTopology and VMInstanceManager read the membership from here
+    instead of scanning every group's members for every instance.
+    """
+
+    def __init__(self, instance_groups):
+        self.instance_groups = instance_groups
+        self._groups_by_instance = {}
+        self._stateless_instances = set()
+
+        for position, instance_group in enumerate(instance_groups):
+            stateless = instance_group.get('status', {}).get('stateful', {}).get('hasStatefulConfig') == False
+            for member in instance_group.get('instance_list', []):
+                if 'instance' not in member:
+                    continue
+
+                instance = get_link_key(member['instance'])
+                positions = self._groups_by_instance.setdefault(instance, [])
+                if position not in positions:
+                    positions.append(position)
+                if stateless:
+                    self._stateless_instances.add(instance)
+
+    def get_group_positions(self, self_link):
+        """ positions in instance_groups of the groups an instance belongs to """
+        return self._groups_by_instance.get(get_link_key(self_link), [])
+
+    def get_groups(self, self_link):
+        return [self.instance_groups[position] for position in self.get_group_positions(self_link)]
+
+    def get_group(self, self_link):
+        """ first instance group of an instance, None when it is not managed by a group """
+        positions = self.get_group_positions(self_link)
+        return self.instance_groups[positions[0]] if positions else None
+
+    def get_auto_scaler_link(self, self_link):
+        instance_group = self.get_group(self_link)
+        return instance_group.get('status', {}).get('autoscaler', '') if instance_group is not None else ''
+
+    def is_managed_stateless(self, self_link):
+        return get_link_key(self_link) in self._stateless_instances
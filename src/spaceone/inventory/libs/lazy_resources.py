@@ -0,0 +1,78 @@
+__all__ = ['LazyResources']
+
+import time
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LazyResources(object):
+    """
+    Zone independent resources of a collect, every kind fetched on its own worker from the start of the collect.
+    get(kind) waits for that kind only, so instances are listed and transformed while the other kinds
+    are still loading. A failed fetch reads as defaults.get(kind, []), same as fetch_concurrently.
+
+        with LazyResources(fetchers, number_of_concurrent, defaults) as global_resources:
+            global_resources.get('disk', [])
+
+    get_wait_times() is the time the transform spent waiting for every kind it read.
+    """
+
+    def __init__(self, fetchers, number_of_concurrent, defaults=None):
+        self._defaults = defaults or {}
+        self._results = {}
+        self._wait_times = {}
+        self._executor = ThreadPoolExecutor(max_workers=max(1, min(int(number_of_concurrent), len(fetchers))))
+        self._futures = {kind: self._executor.submit(self._fetch, kind, fetcher) for kind, fetcher in fetchers.items()}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        # a collect which stops early does not wait for the listings nobody reads any more
+        # (cancelled one by one, shutdown(cancel_futures=True) is python 3.9+)
+        for future in self._futures.values():
+            future.cancel()
+        self._executor.shutdown(wait=False)
+
+    def _fetch(self, kind, fetcher):
+        start_time = time.time()
+        try:
+            result = fetcher()
+            _LOGGER.info(f'[LazyResources] {kind} finished in {time.time() - start_time:.2f} Seconds')
+        except Exception as e:
+            _LOGGER.error(f'[LazyResources] {kind} failed after {time.time() - start_time:.2f} Seconds: {e}')
+            result = None
+        return result if result or kind not in self._defaults else self._defaults[kind]
+
+    def get(self, kind, default=None):
+        if kind not in self._results:
+            if kind not in self._futures:
+                return default
+
+            start_time = time.time()
+            result = self._futures[kind].result()
+            self._wait_times[kind] = round(time.time() - start_time, 3)
+            self._results[kind] = [] if result is None else result
+        return self._results[kind]
+
+    def __contains__(self, kind):
+        return kind in self._futures
+
+    def is_ready(self, kind):
+        return kind in self._results or kind not in self._futures or self._futures[kind].done()
+
+    def load(self):
+        """ wait for every kind """
+        return {kind: self.get(kind) for kind in self._futures}
+
+    def get_loaded(self):
+        """ kinds read so far, without waiting for the others """
+        return dict(self._results)
+
+    def get_wait_times(self):
+        return dict(self._wait_times)
@@ -0,0 +1,88 @@
+__all__ = ['LoadBalancerTopology']
+
+from types import MappingProxyType
+from spaceone.inventory.libs.instance_group_membership import get_link_key
+
+HTTP_PROTOCOLS = ['HTTP', 'HTTPS']
+
+
+class LoadBalancerTopology(object):
+    """
+    Load balancers of every instance, resolved once per collect from
+        instance groups (members) -> backend services (backends.group) -> url maps (defaultService)
+        target pools (instances) -> forwarding rules (target)
+
+    Rows are compiled once by compile_http_row(backend_svc, url_map) and
+    compile_target_pool_row(forwarding_rule, target_pool) and kept read-only, no resource dict is changed.
+    Rows of an instance come in the order of its instance groups then target pools, same as the scans
+    this replaces. Links are compared from '/projects/', so an API version prefix does not matter.
+    The instance groups of an instance are read from its InstanceGroupMembership.
+    """
+
+    def __init__(self, global_resources, membership, compile_http_row, compile_target_pool_row):
+        # group position -> (rows, error), instance link key -> (rows, errors) of its target pools
+        self._membership = membership
+        self._group_rows = []
+        self._pool_rows = {}
+
+        backend_svcs = global_resources.get('backend_svcs', [])
+        url_maps = global_resources.get('url_maps', [])
+        target_pools = global_resources.get('target_pools', [])
+        forwarding_rules = global_resources.get('forwarding_rules', [])
+
+        url_map_by_service = {}
+        for url_map in url_maps:
+            url_map_by_service.setdefault(url_map.get('defaultService', ''), url_map)
+
+        # HTTP(S) backend services with a url map, by the instance group of their backends
+        http_svcs_by_group = {}
+        for backend_svc in backend_svcs:
+            url_map = url_map_by_service.get(backend_svc.get('selfLink', ''))
+            if backend_svc.get('protocol', '') in HTTP_PROTOCOLS and url_map is not None:
+                for group in set([get_link_key(b.get('group', '')) for b in backend_svc.get('backends', [])
+                                  if b.get('group', '') != '']):
+                    http_svcs_by_group.setdefault(group, []).append((backend_svc, url_map))
+
+        rules_by_target = {}
+        for forwarding_rule in forwarding_rules:
+            rules_by_target.setdefault(forwarding_rule.get('target', ''), []).append(forwarding_rule)
+
+        for instance_group in membership.instance_groups:
+            self._group_rows.append(self._compile(compile_http_row, http_svcs_by_group.get(
+                get_link_key(instance_group.get('instanceGroup', '')), [])))
+
+        for target_pool in target_pools:
+            rows = self._compile(compile_target_pool_row, [
+                (forwarding_rule, target_pool)
+                for forwarding_rule in rules_by_target.get(target_pool.get('selfLink', ''), [])])
+            for member in set([get_link_key(link) for link in target_pool.get('instances', [])]):
+                self._add(self._pool_rows, member, rows)
+
+    def get_rows(self, self_link):
+        """ read-only rows of the load balancers in front of an instance """
+        rows = []
+        for position in self._membership.get_group_positions(self_link):
+            group_rows, error = self._group_rows[position]
+            if error is not None:
+                raise error
+            rows.extend(group_rows)
+
+        pool_rows, pool_errors = self._pool_rows.get(get_link_key(self_link), ([], []))
+        if pool_errors:
+            raise pool_errors[0]
+        return rows + pool_rows
+
+    @staticmethod
+    def _add(rows_by_instance, member, compiled):
+        rows, error = compiled
+        instance_rows, instance_errors = rows_by_instance.setdefault(member, ([], []))
+        instance_rows.extend(rows)
+        if error is not None:
+            instance_errors.append(error)
+
+    @staticmethod
+    def _compile(compile_row, edges):
+        try:
+            return [MappingProxyType(compile_row(*edge)) for edge in edges], None
+        except Exception as e:
+            return [], e
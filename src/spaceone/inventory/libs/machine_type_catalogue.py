@@ -0,0 +1,227 @@
+__all__ = ['MachineTypeCatalogue', 'MachineTypeIndex', 'MACHINE_TYPE_CATALOGUE', 'INSTANCE_TYPE_FILE',
+           'parse_custom_machine_type']
+
+import os
+import re
+import json
+import time
+import logging
+import tempfile
+import threading
+from spaceone.core import config
+
+_LOGGER = logging.getLogger(__name__)
+
+# bundled snapshot, regenerated by bin/update_machine_types.py
+INSTANCE_TYPE_FILE = '%s/conf/%s' % (os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'instances.json')
+DEFAULT_MACHINE_TYPE_CATALOGUE = {
+    'ttl': 604800,
+    'retry_interval': 3600,
+    'cache_dir': os.path.join(tempfile.gettempdir(), 'spaceone-google-cloud-compute')
+}
+CACHE_FILE_NAME = 'machine_types.json'
+# [<family>-]custom-<vCPUs>-<memory MB>[-ext], ex. custom-4-8192, n2-custom-8-32768, e2-custom-2-4096-ext
+CUSTOM_MACHINE_TYPE = re.compile(r'^(?:(?P<family>[a-z][a-z0-9]*)-)?custom-(?P<cpus>\d+)-(?P<memory>\d+)(?:-ext)?$')
+
+
+def parse_custom_machine_type(name):
+    """ Machine type of a custom shape from its name, None if the name is not a custom shape the parser knows
+    (shared core shapes like e2-custom-medium-4096 are left to the API)
+    """
+    matched = CUSTOM_MACHINE_TYPE.match(name)
+    if matched is None:
+        return None
+
+    return {'name': name, 'guestCpus': int(matched.group('cpus')), 'memoryMb': int(matched.group('memory'))}
+
+
+class MachineTypeIndex(object):
+    """
+    O(1) lookup of machine types by (zone, name) and by selfLink.
+    A name which is not listed in the zone (ex. zones are unknown in the bundled snapshot) falls back to the name.
+    """
+
+    def __init__(self, families=None):
+        self._by_name = {}
+        self._by_zone = {}
+        for machine_types in (families or {}).values():
+            for name, machine_type in machine_types.items():
+                self.add(dict(machine_type, name=name), machine_type.get('zones'))
+
+    def add(self, machine_type, zones=None):
+        name = machine_type.get('name', '')
+        # cores and memory of a name are the same in every zone, zones only tell where it is offered
+        self._by_name.setdefault(name, machine_type)
+        for zone in zones or []:
+            self._by_zone[(zone, name)] = machine_type
+
+    def get(self, zone, name):
+        return self._by_zone.get((zone, name)) or self._by_name.get(name)
+
+    def get_by_self_link(self, self_link):
+        # .../projects/<project>/zones/<zone>/machineTypes/<name>
+        zone, name = self.parse_self_link(self_link)
+        return self.get(zone, name)
+
+    @staticmethod
+    def parse_self_link(self_link):
+        parts = self_link.split('/')
+        zone = parts[parts.index('zones') + 1] if 'zones' in parts[:-1] else ''
+        return zone, parts[-1]
+
+
+class MachineTypeCatalogue(object):
+    """
+    Process-wide catalogue of machine types, deduplicated by family and name.
+        {
+            'updated_at': epoch seconds,
+            'families': {
+                'e2': {'e2-medium': {'guestCpus': 2, 'memoryMb': 4096, 'zones': [zone, ...]}, ...},
+                ...
+            }
+        }
+    Machine types are the same in every zone they are offered, so one entry per name replaces
+    the aggregated list of every zone. The catalogue starts from the bundled snapshot (INSTANCE_TYPE_FILE),
+    and is refreshed from the API and persisted in cache_dir when it is older than the ttl.
+
+    The lock is never held while the API is called, a connector refreshes the catalogue with
+        if catalogue.begin_refresh():
+            try:
+                machine_types = <aggregatedList of machineTypes>
+            except Exception:
+                catalogue.fail_refresh()
+            else:
+                catalogue.refresh(machine_types)
+    Other callers keep using the current index meanwhile, and a failed refresh is tried again after retry_interval.
+
+    Settings come from the global config (MACHINE_TYPE_CATALOGUE)
+        MACHINE_TYPE_CATALOGUE = {
+            'ttl': 604800,              # seconds the catalogue is used before it is refreshed
+            'retry_interval': 3600,     # seconds before a failed refresh is tried again
+            'cache_dir': '/tmp/...'     # directory of the refreshed catalogue, '' to keep it in memory only
+        }
+    """
+
+    def __init__(self, snapshot_file=INSTANCE_TYPE_FILE):
+        self.lock = threading.RLock()
+        self._snapshot_file = snapshot_file
+        self._catalogue = None
+        self._index = None
+        self._refreshing = False
+        self._failed_at = 0.0
+
+    def is_expired(self):
+        settings = self._get_settings()
+        with self.lock:
+            catalogue = self._get_catalogue(settings)
+            return time.time() - catalogue.get('updated_at', 0) >= settings['ttl']
+
+    def begin_refresh(self):
+        """ True if the caller has to list machine types and hand them to refresh() (or call fail_refresh()),
+        False if the catalogue is fresh, another caller is refreshing it or the last refresh failed recently
+        """
+        settings = self._get_settings()
+        with self.lock:
+            now = time.time()
+            if self._refreshing or now - self._failed_at < settings['retry_interval'] or \
+                    now - self._get_catalogue(settings).get('updated_at', 0) < settings['ttl']:
+                return False
+            self._refreshing = True
+            return True
+
+    def fail_refresh(self):
+        with self.lock:
+            self._refreshing = False
+            self._failed_at = time.time()
+
+    def get_index(self):
+        with self.lock:
+            if self._index is None:
+                self._index = MachineTypeIndex(self._get_catalogue(self._get_settings()).get('families', {}))
+            return self._index
+
+    def refresh(self, machine_types):
+        """ Merge machine types listed from the API (aggregatedList of machineTypes) into the catalogue """
+        settings = self._get_settings()
+        with self.lock:
+            families = {family: dict(types) for family, types in
+                        self._get_catalogue(settings).get('families', {}).items()}
+            for family, types in self.group_by_family(machine_types).items():
+                families.setdefault(family, {}).update(types)
+
+            self._catalogue = {'updated_at': time.time(), 'families': families}
+            self._index = None
+            self._refreshing = False
+            self._save(settings['cache_dir'], self._catalogue)
+
+    def reset(self):
+        with self.lock:
+            self._catalogue = None
+            self._index = None
+            self._refreshing = False
+            self._failed_at = 0.0
+
+    @staticmethod
+    def group_by_family(machine_types):
+        """ machine types of every zone -> {family: {name: {'guestCpus', 'memoryMb', 'zones'}}} """
+        families = {}
+        for machine_type in machine_types:
+            name = machine_type.get('name', '')
+            zone, _ = MachineTypeIndex.parse_self_link(machine_type.get('selfLink', ''))
+            entry = families.setdefault(name.split('-')[0], {}).setdefault(name, {
+                'guestCpus': machine_type.get('guestCpus', 0),
+                'memoryMb': machine_type.get('memoryMb', 0),
+                'zones': []
+            })
+            if zone and zone not in entry['zones']:
+                entry['zones'].append(zone)
+
+        for types in families.values():
+            for entry in types.values():
+                entry['zones'].sort()
+        return families
+
+    def _get_catalogue(self, settings):
+        if self._catalogue is None:
+            snapshot = self._load(self._snapshot_file) or {}
+            cached = self._load(os.path.join(settings['cache_dir'], CACHE_FILE_NAME)) if settings['cache_dir'] \
+                else None
+            # the refreshed catalogue of an earlier process, unless the bundled snapshot is newer
+            if cached and cached.get('updated_at', 0) > snapshot.get('updated_at', 0):
+                self._catalogue = cached
+            else:
+                self._catalogue = snapshot
+        return self._catalogue
+
+    @staticmethod
+    def _get_settings():
+        return {**DEFAULT_MACHINE_TYPE_CATALOGUE, **config.get_global('MACHINE_TYPE_CATALOGUE', {})}
+
+    @staticmethod
+    def _load(path):
+        if not os.path.exists(path):
+            return None
+
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except Exception as e:
+            _LOGGER.error(f'[MachineTypeCatalogue] failed to load {path}: {e}')
+            return None
+
+    @staticmethod
+    def _save(cache_dir, catalogue):
+        if not cache_dir:
+            return
+
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(catalogue, f)
+            os.replace(tmp_path, os.path.join(cache_dir, CACHE_FILE_NAME))
+        except Exception as e:
+            _LOGGER.error(f'[MachineTypeCatalogue] failed to save {cache_dir}/{CACHE_FILE_NAME}: {e}')
+
+
+MACHINE_TYPE_CATALOGUE = MachineTypeCatalogue()
@@ -0,0 +1,52 @@
+__all__ = ['OSImageIndex', 'ARCH_LIST', 'get_os_identity']
+
+# temp arch lists will be updated when full list has prepared.
+ARCH_LIST = ['x86_64', 'x86_32', 'x64', 'x86', 'amd64']
+
+
+def get_os_identity(licenses):
+    """ lower case name of the first license, the image keys are matched against it """
+    return licenses[0].split('/')[-1].lower() if len(licenses) > 0 else ''
+
+
+class OSImageIndex(object):
+    """
+    OS of a boot disk by its license list, from the images of public_images (key -> images).
+        licenses (tuple, in the listed order) -> the first image of every key carrying exactly these licenses
+
+    The OS of a license list is resolved on its first lookup: the first key (in public_images order)
+    contained in the OS identity that has such an image, same as the scan over every image it replaces.
+    Resolved OS data and license lists which match nothing are both memoized, so an instance costs a single
+    dict lookup once its license list was seen.
+    """
+
+    def __init__(self, public_images):
+        self._candidates = {}
+        self._resolved = {}
+
+        for key, images in public_images.items():
+            for image in images:
+                candidates = self._candidates.setdefault(tuple(image.get('licenses', [])), {})
+                candidates.setdefault(key, image)
+
+    def get_os_data(self, licenses):
+        licenses = tuple(licenses)
+        if licenses not in self._resolved:
+            self._resolved[licenses] = self._resolve(licenses)
+
+        os_data = self._resolved[licenses]
+        return dict(os_data) if os_data is not None else {'details': '', 'os_distro': '', 'os_arch': ''}
+
+    def _resolve(self, licenses):
+        os_identity = get_os_identity(licenses)
+        for key, image in self._candidates.get(licenses, {}).items():
+            if key in os_identity:
+                description = image.get('description', '')
+                os_arch = [arch for arch in ARCH_LIST if arch in description]
+                return {
+                    'details': description,
+                    'os_distro': 'windows-server' if key == 'windows' else key,
+                    'os_arch': os_arch[0] if len(os_arch) > 0 else ''
+                }
+        # negative cache, license lists of no public image (custom or deprecated images)
+        return None
@@ -0,0 +1,181 @@
+__all__ = ['RateLimiter', 'TokenBucket', 'RATE_LIMITER']
+
+import json
+import time
+import random
+import asyncio
+import logging
+import threading
+from spaceone.core import config
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_RATE_LIMIT = {'rate': 20.0, 'burst': 40}
+DEFAULT_RETRY = {'max_retries': 5, 'backoff_base': 1.0, 'backoff_max': 32.0}
+RETRYABLE_STATUS = (429, 500, 502, 503, 504)
+# a 403 with one of these reasons is a quota exceeded per user / project, not a denied permission
+RETRYABLE_FORBIDDEN_REASONS = ('rateLimitExceeded', 'userRateLimitExceeded')
+
+
+class TokenBucket(object):
+    """ Thread-safe token bucket, refilled with `rate` tokens per second up to `burst` """
+
+    def __init__(self, rate, burst):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens=1):
+        """ Take tokens (may go into debt) and return how many seconds the caller has to wait for them """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= tokens
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+class RateLimiter(object):
+    """
+    Process-wide limiter of Compute API calls, one token bucket per (project_id, method family).
+    Calls failed with 429 / 5xx, or 403 rateLimitExceeded / userRateLimitExceeded, are retried
+    with exponential backoff and full jitter.
+
+    Rate and retry settings come from the global config (COMPUTE_API_RATE_LIMIT, COMPUTE_API_RETRY)
+        COMPUTE_API_RATE_LIMIT = {
+            'list': {'rate': 20, 'burst': 40},      # calls per second / burst size of each family
+            ...
+        }
+        COMPUTE_API_RETRY = {'max_retries': 5, 'backoff_base': 1.0, 'backoff_max': 32.0}
+    """
+
+    def __init__(self):
+        self._buckets = {}
+        self._counters = {}
+        self._lock = threading.Lock()
+
+    def execute(self, project_id, family, request, http=None, tokens=1):
+        """ request.execute(http=http) within the rate limit of project_id / family, retried on rate limit / 5xx """
+        attempt = 0
+        while True:
+            time.sleep(self._acquire(project_id, family, tokens))
+            try:
+                return request.execute(http=http)
+            except Exception as e:
+                delay = self.get_retry_delay(project_id, family, e, attempt)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+
+    async def execute_async(self, project_id, family, coroutine_function, tokens=1):
+        """ asyncio version of execute, coroutine_function is called again for every attempt """
+        attempt = 0
+        while True:
+            await asyncio.sleep(self._acquire(project_id, family, tokens))
+            try:
+                return await coroutine_function()
+            except Exception as e:
+                delay = self.get_retry_delay(project_id, family, e, attempt)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    def get_retry_delay(self, project_id, family, error, attempt):
+        """ Seconds to wait before retrying a failed call, None if it must not be retried """
+        retry = {**DEFAULT_RETRY, **config.get_global('COMPUTE_API_RETRY', {})}
+        _, counter = self._get_bucket(project_id, family)
+
+        if not self.is_retryable(error):
+            return None
+
+        if attempt >= retry['max_retries']:
+            with self._lock:
+                counter['failures'] += 1
+            return None
+
+        with self._lock:
+            counter['retries'] += 1
+
+        delay = random.uniform(0, min(retry['backoff_max'], retry['backoff_base'] * (2 ** attempt)))
+        _LOGGER.debug(f'[RateLimiter] {project_id}/{family} retry #{attempt + 1} in {delay:.2f} Seconds: {error}')
+        return delay
+
+    def get_counters(self, project_id=None):
+        """
+        Returns: dict of '<project_id>/<family>' -> {
+                    'requests': calls sent,
+                    'throttled': calls delayed by the bucket,
+                    'wait_seconds': total delay by the bucket,
+                    'retries': calls retried after rate limit / 5xx,
+                    'failures': calls given up
+                 }
+        """
+        with self._lock:
+            return {f'{key[0]}/{key[1]}': dict(counter) for key, counter in self._counters.items()
+                    if project_id is None or key[0] == project_id}
+
+    def reset(self):
+        with self._lock:
+            self._buckets = {}
+            self._counters = {}
+
+    def reset_after_fork(self):
+        """ In a forked process: locks held by another thread of the parent at fork would never be released """
+        self._lock = threading.Lock()
+        for bucket in self._buckets.values():
+            bucket._lock = threading.Lock()
+
+    def _acquire(self, project_id, family, tokens):
+        bucket, counter = self._get_bucket(project_id, family)
+        wait = bucket.reserve(tokens)
+        with self._lock:
+            counter['requests'] += tokens
+            if wait > 0:
+                counter['throttled'] += tokens
+                counter['wait_seconds'] = round(counter['wait_seconds'] + wait, 3)
+        return wait
+
+    def _get_bucket(self, project_id, family):
+        key = (project_id, family)
+        with self._lock:
+            if key not in self._buckets:
+                rate_limit = {**DEFAULT_RATE_LIMIT, **config.get_global('COMPUTE_API_RATE_LIMIT', {}).get(family, {})}
+                self._buckets[key] = TokenBucket(rate_limit['rate'], rate_limit['burst'])
+                self._counters[key] = {'requests': 0, 'throttled': 0, 'wait_seconds': 0.0, 'retries': 0,
+                                       'failures': 0}
+            return self._buckets[key], self._counters[key]
+
+    @classmethod
+    def is_retryable(cls, error):
+        status = cls._get_status(error)
+        if status == 403:
+            return bool(cls._get_reasons(error) & set(RETRYABLE_FORBIDDEN_REASONS))
+        return status in RETRYABLE_STATUS
+
+    @staticmethod
+    def _get_reasons(error):
+        # error body of googleapiclient HttpError (content) or of the async connector (message):
+        #   {"error": {"errors": [{"reason": "rateLimitExceeded", ...}], ...}}
+        body = getattr(error, 'content', None) if hasattr(error, 'resp') else getattr(error, 'message', None)
+        try:
+            errors = json.loads(body)['error'].get('errors', [])
+            return set([detail.get('reason') for detail in errors])
+        except (TypeError, ValueError, KeyError, AttributeError):
+            return set()
+
+    @staticmethod
+    def _get_status(error):
+        # googleapiclient HttpError (resp.status) or aiohttp ClientResponseError (status)
+        resp = getattr(error, 'resp', None)
+        status = getattr(resp, 'status', None) if resp is not None else getattr(error, 'status', None)
+        try:
+            return int(status)
+        except (TypeError, ValueError):
+            return None
+
+
+RATE_LIMITER = RateLimiter()
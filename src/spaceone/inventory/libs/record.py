@@ -0,0 +1,171 @@
+__all__ = ['Record', 'record_class', 'validate_choices']
+
+import threading
+from schematics.common import NONEMPTY, NOT_NONE, DEFAULT, DROP
+from schematics.types import BaseType, ModelType, ListType, DictType
+from schematics.undefined import Undefined
+
+_LEAF, _MODEL, _LIST, _DICT = range(4)
+_RECORD_CLASSES = {}
+_LOCK = threading.RLock()
+
+
+class Record(object):
+    """
+    Compact stand-in of a schematics Model, one __slots__ class per model (record_class(model_class)).
+    Fields, defaults, conversion of the input (same to_native of every schematics field) and to_primitive()
+    output are the ones of the model, without the per instance conversion state of schematics.
+    Choices are not checked per field but once for a whole record by validate_choices().
+
+    Like a model, a record is built by Record(raw_data, strict=False) and read by record[key], record.get(key)
+    or attributes, values set later are not converted.
+    """
+    __slots__ = ()
+    _model_class = None
+    _plan = ()
+
+    def __init__(self, raw_data=None, strict=False, **kwargs):
+        raw_data = raw_data or {}
+        for field_name, _, _, field_plan, field in self._plan:
+            value = raw_data.get(field_name, Undefined)
+            if value is Undefined:
+                value = field.default
+                if value is Undefined:
+                    value = None
+            object.__setattr__(self, field_name, _convert(field_plan, value))
+
+    def __getitem__(self, name):
+        return getattr(self, name)
+
+    def __setitem__(self, name, value):
+        setattr(self, name, value)
+
+    def get(self, name, default=None):
+        return getattr(self, name, default) if name in self.__slots__ else default
+
+    def to_primitive(self):
+        data = {}
+        for field_name, serialized_name, export_level, field_plan, _ in self._plan:
+            value = getattr(self, field_name, Undefined)
+            if export_level == DROP:
+                continue
+            elif value is Undefined:
+                if export_level <= DEFAULT:
+                    continue
+                value = None
+            elif value is not None:
+                value = _export(field_plan, value)
+
+            if value is None:
+                if export_level <= NOT_NONE:
+                    continue
+            elif field_plan[0] != _LEAF and len(value) == 0 and export_level <= NONEMPTY:
+                continue
+            data[serialized_name] = value
+        return data
+
+    def __repr__(self):
+        return f'<{type(self).__name__} record>'
+
+
+class _ExportContext(object):
+    export_level = None
+
+
+_CONTEXT = _ExportContext()
+
+
+def record_class(model_class):
+    """ Record class of a schematics Model class, created once """
+    if model_class not in _RECORD_CLASSES:
+        with _LOCK:
+            if model_class not in _RECORD_CLASSES:
+                fields = model_class._schema.fields
+                cls = type(model_class.__name__, (Record,), {
+                    '__slots__': tuple(fields.keys()),
+                    '__module__': __name__,
+                    '_model_class': model_class,
+                    # read by struct_serializer.to_struct, same as the model
+                    '_schema': model_class._schema,
+                    '_options': model_class._options
+                })
+                cls._plan = [(field_name, field.serialized_name or field_name, field.get_export_level(_CONTEXT),
+                              _compile_field(field), field) for field_name, field in fields.items()]
+                _RECORD_CLASSES[model_class] = cls
+    return _RECORD_CLASSES[model_class]
+
+
+def validate_choices(record, path=''):
+    """ (path, value, choices) of every value out of the choices of its field, through the nested records """
+    errors = []
+    for field_name, _, _, field_plan, _ in record._plan:
+        value = getattr(record, field_name, None)
+        if value is None:
+            continue
+        for key, item in _iter_items(field_plan, value):
+            item_path = f'{path}{field_name}{key}'
+            if isinstance(item, Record):
+                errors.extend(validate_choices(item, f'{item_path}.'))
+            elif item is not None and _get_choices(field_plan) is not None and item not in _get_choices(field_plan):
+                errors.append((item_path, item, _get_choices(field_plan)))
+    return errors
+
+
+def _compile_field(field):
+    if isinstance(field, ModelType):
+        return _MODEL, record_class(field.model_class), None
+    elif isinstance(field, (ListType, DictType)):
+        return _LIST if isinstance(field, ListType) else _DICT, _compile_field(field.field), \
+            field.field.get_export_level(_CONTEXT)
+    return _LEAF, field, field.choices
+
+
+def _convert(field_plan, value):
+    if value is None:
+        return None
+
+    kind, sub_plan, _ = field_plan
+    if kind == _LEAF:
+        return sub_plan.to_native(value)
+    elif kind == _MODEL:
+        return value if isinstance(value, sub_plan) else sub_plan(value)
+    elif kind == _LIST:
+        return [_convert(sub_plan, item) for item in value]
+    return {str(key): _convert(sub_plan, item) for key, item in value.items()}
+
+
+def _export(field_plan, value):
+    kind, sub_plan, item_export_level = field_plan
+    if kind == _LEAF:
+        return value if type(sub_plan).to_primitive is BaseType.to_primitive else sub_plan.to_primitive(value)
+    elif kind == _MODEL:
+        return value.to_primitive()
+
+    if item_export_level == DROP:
+        return [] if kind == _LIST else {}
+
+    items = []
+    for key, item in (enumerate(value) if kind == _LIST else value.items()):
+        shaped = _export(sub_plan, item) if item is not None else None
+        if shaped is None:
+            if item_export_level <= NOT_NONE:
+                continue
+        elif sub_plan[0] != _LEAF and len(shaped) == 0 and item_export_level <= NONEMPTY:
+            continue
+        items.append((key, shaped))
+    return [shaped for _, shaped in items] if kind == _LIST else dict(items)
+
+
+def _iter_items(field_plan, value):
+    kind = field_plan[0]
+    if kind == _LIST:
+        return [('[]', item) for item in value]
+    elif kind == _DICT:
+        return [(f'.{key}', item) for key, item in value.items()]
+    return [('', value)]
+
+
+def _get_choices(field_plan):
+    while field_plan[0] in (_LIST, _DICT):
+        field_plan = field_plan[1]
+    return field_plan[2] if field_plan[0] == _LEAF else None
@@ -0,0 +1,149 @@
+__all__ = ['ShardedTransform', 'get_zone_shards', 'is_fork_supported']
+
+import os
+import pickle
+import logging
+import itertools
+import threading
+import multiprocessing
+from spaceone.core.error import ERROR_BASE
+from spaceone.inventory.libs import record, struct_serializer
+
+_LOGGER = logging.getLogger(__name__)
+
+# pipeline, resource index, export and initializer of every open ShardedTransform by its key,
+# the forked workers find them here without pickling
+_WORKER_STATE = {}
+_KEYS = itertools.count()
+_LOCK = threading.Lock()
+
+
+def is_fork_supported():
+    return 'fork' in multiprocessing.get_all_start_methods()
+
+
+def get_zone_shards(records, shard_size):
+    """ records grouped by zone (in the listed order), a zone of more than shard_size records is cut into shards """
+    records_by_zone = {}
+    for record in records:
+        records_by_zone.setdefault(record['zone_info'].get('zone', ''), []).append(record)
+
+    return [zone_records[idx:idx + shard_size]
+            for zone_records in records_by_zone.values() for idx in range(0, len(zone_records), shard_size)]
+
+
+class ShardedTransform(object):
+    """
+    Runs an EnrichmentPipeline over shards of instance records in a pool of forked worker processes.
+    The pool is forked once the pipeline and the global resource index are built (and prepared),
+    so every worker reads them copy-on-write instead of receiving a pickled copy.
+    Only the records of a shard go to a worker, and only export(server) and the errors come back.
+
+    The pool is forked from a multithreaded process (gRPC server, lazy listings), so a worker starts by
+    replacing the locks it uses, then calls initializer() to reset the state of the caller
+    (thread-local connections, locks of process-wide caches).
+
+        with ShardedTransform(pipeline, resource_index, export, processes=4, initializer=reset) as transform:
+            for records in transform.run(shards):
+                ...
+
+    run() yields the records of every shard in completion order, record['result'] is export(server).
+    Stage timings of the workers are summed into the pipeline of the parent process.
+    """
+
+    def __init__(self, pipeline, resource_index, export, processes=None, initializer=None):
+        self.pipeline = pipeline
+        self.resource_index = resource_index
+        self.export = export
+        self.initializer = initializer
+        self.processes = max(1, int(processes or os.cpu_count() or 1))
+        self._key = None
+        self._pool = None
+
+    def __enter__(self):
+        with _LOCK:
+            self._key = next(_KEYS)
+            _WORKER_STATE[self._key] = (self.pipeline, self.resource_index, self.export, self.initializer)
+            self._pool = multiprocessing.get_context('fork').Pool(self.processes, initializer=_init_worker,
+                                                                  initargs=(self._key,))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        # workers only hold copies, nothing has to be flushed back
+        self._pool.terminate()
+        self._pool.join()
+        _WORKER_STATE.pop(self._key, None)
+
+    def run(self, shards):
+        """ shards: iterable of record lists, consumed by the pool in the background while results come back """
+        tasks = ((self._key, [{'instance': record['instance'], 'zone_info': record['zone_info']} for record in shard])
+                 for shard in shards)
+        for results, timings in self._pool.imap_unordered(_run_shard, tasks):
+            self.pipeline.add_timings(timings)
+            yield [{'zone_info': zone_info, 'result': result, 'error': _unpack_error(error)}
+                   for zone_info, result, error in results]
+
+
+def _init_worker(key):
+    """ worker side, once after the fork: only the forking thread is copied, a lock held by any other thread
+    of the parent at that moment (this module's one included) would never be released here
+    """
+    global _LOCK
+    _LOCK = threading.Lock()
+    record._LOCK = threading.RLock()
+    struct_serializer._LOCK = threading.Lock()
+
+    _, resource_index, _, initializer = _WORKER_STATE[key]
+    if hasattr(resource_index, '_lock'):
+        resource_index._lock = threading.RLock()
+    if initializer is not None:
+        try:
+            initializer()
+        except Exception as e:
+            # a pool whose initializer raises forks new workers forever, the worker goes on without it
+            _LOGGER.error(f'[ShardedTransform] worker initializer failed: {e}')
+
+
+def _run_shard(task):
+    """ worker side: the pipeline and resource index are the ones inherited from the parent at fork """
+    key, records = task
+    pipeline, resource_index, export, _ = _WORKER_STATE[key]
+    timings = dict(pipeline.timings)
+
+    results = []
+    for record in pipeline.run(records, resource_index):
+        error = record.get('error')
+        if error is None:
+            try:
+                results.append((record['zone_info'], export(record['server']), None))
+                continue
+            except Exception as e:
+                error = e
+        results.append((record['zone_info'], None, _pack_error(error)))
+
+    return results, {name: elapsed - timings.get(name, 0.0) for name, elapsed in pipeline.timings.items()}
+
+
+def _pack_error(error):
+    # SpaceONE errors can not be unpickled (their kwargs are not kept), so they are sent as their fields
+    if isinstance(error, ERROR_BASE):
+        return type(error), error.error_code, error.message
+    return error if _is_picklable(error) else RuntimeError(f'{type(error).__name__}: {error}')
+
+
+def _unpack_error(error):
+    if isinstance(error, tuple):
+        error_class, error_code, message = error
+        unpacked = error_class.__new__(error_class)
+        unpacked._error_code = error_code
+        unpacked._message = message
+        return unpacked
+    return error
+
+
+def _is_picklable(error):
+    try:
+        pickle.loads(pickle.dumps(error))
+        return True
+    except Exception:
+        return False
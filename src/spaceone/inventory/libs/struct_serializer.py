@@ -0,0 +1,151 @@
+__all__ = ['to_struct']
+
+import threading
+from google.protobuf import struct_pb2
+from schematics.common import DROP, NONEMPTY, NOT_NONE, DEFAULT
+from schematics.models import Model
+from schematics.transforms import to_primitive
+from schematics.types import BaseType, ModelType, ListType, DictType
+from schematics.types.serializable import Serializable
+from schematics.undefined import Undefined
+from spaceone.core.pygrpc.message_type import change_struct_type
+
+_LEAF, _MODEL, _LIST, _DICT = range(4)
+
+
+class _ExportContext(object):
+    # Model.to_primitive() is called without an export level, so only the field / model options count
+    export_level = None
+
+
+_CONTEXT = _ExportContext()
+_PLANS = {}
+_LOCK = threading.Lock()
+
+
+def to_struct(model):
+    """
+    Struct of a schematics model, same as change_struct_type(model.to_primitive()) but written straight into
+    the protobuf messages, without building the primitive dict first.
+    Models with roles or serializable fields fall back to to_primitive().
+    """
+    plan = _get_plan(type(model))
+    if plan is None:
+        return change_struct_type(model.to_primitive())
+
+    struct = struct_pb2.Struct()
+    _write_model(struct, plan, model)
+    return struct
+
+
+def _get_plan(model_class):
+    if model_class not in _PLANS:
+        with _LOCK:
+            if model_class not in _PLANS:
+                _PLANS[model_class] = _compile_model(model_class)
+    return _PLANS[model_class]
+
+
+def _compile_model(model_class):
+    """ (field name, serialized name, export level, field plan) of every field, None if it is not supported """
+    schema = model_class._schema
+    if model_class._options.roles or any(isinstance(field, Serializable) for field in schema.fields.values()):
+        return None
+
+    return [(field_name, field.serialized_name or field_name, field.get_export_level(_CONTEXT), _compile_field(field))
+            for field_name, field in schema.fields.items()]
+
+
+def _compile_field(field):
+    if isinstance(field, ModelType):
+        return _MODEL, field.model_class, None
+    elif isinstance(field, (ListType, DictType)):
+        return _LIST if isinstance(field, ListType) else _DICT, \
+            _compile_field(field.field), field.field.get_export_level(_CONTEXT)
+    elif type(field).to_primitive is BaseType.to_primitive:
+        return _LEAF, None, None
+    return _LEAF, field, None
+
+
+def _write_model(struct, plan, model):
+    data = model._data if isinstance(model, Model) else model
+    fields = struct.fields
+    for field_name, serialized_name, export_level, field_plan in plan:
+        if export_level == DROP:
+            continue
+
+        value = data.get(field_name, Undefined)
+        if value is Undefined:
+            if export_level <= DEFAULT:
+                continue
+            value = None
+
+        if value is None:
+            if export_level <= NOT_NONE:
+                continue
+            fields[serialized_name].null_value = struct_pb2.NULL_VALUE
+        elif not _write_value(fields[serialized_name], field_plan, value) and export_level <= NONEMPTY:
+            del fields[serialized_name]
+
+
+def _write_value(message, field_plan, value):
+    """ write an exported value into a Value message, returns False for an empty compound value """
+    kind, sub_plan, item_export_level = field_plan
+    if kind == _LEAF:
+        if sub_plan is not None:
+            value = sub_plan.to_primitive(value)
+        _set_primitive(message, value)
+        return True
+
+    elif kind == _MODEL:
+        model_class = type(value) if isinstance(value, Model) else sub_plan
+        plan = _get_plan(model_class)
+        if plan is None:
+            message.struct_value.Clear()
+            message.struct_value.update(to_primitive(model_class, value))
+        else:
+            message.struct_value.Clear()
+            _write_model(message.struct_value, plan, value)
+        return len(message.struct_value.fields) > 0
+
+    elif kind == _LIST:
+        list_value = message.list_value
+        list_value.Clear()
+        if item_export_level != DROP:
+            for item in value:
+                if item is None:
+                    if item_export_level <= NOT_NONE:
+                        continue
+                    list_value.values.add().null_value = struct_pb2.NULL_VALUE
+                elif not _write_value(list_value.values.add(), sub_plan, item) and item_export_level <= NONEMPTY:
+                    del list_value.values[-1]
+        return len(list_value.values) > 0
+
+    struct_value = message.struct_value
+    struct_value.Clear()
+    if item_export_level != DROP:
+        for key, item in value.items():
+            if item is None:
+                if item_export_level <= NOT_NONE:
+                    continue
+                struct_value.fields[key].null_value = struct_pb2.NULL_VALUE
+            elif not _write_value(struct_value.fields[key], sub_plan, item) and item_export_level <= NONEMPTY:
+                del struct_value.fields[key]
+    return len(struct_value.fields) > 0
+
+
+def _set_primitive(message, value):
+    if value is None:
+        message.null_value = struct_pb2.NULL_VALUE
+    elif isinstance(value, bool):
+        message.bool_value = value
+    elif isinstance(value, str):
+        message.string_value = value
+    elif isinstance(value, (int, float)):
+        message.number_value = value
+    elif isinstance(value, dict):
+        message.struct_value.update(value)
+    elif isinstance(value, (list, tuple)):
+        message.list_value.extend(value)
+    else:
+        raise ValueError(f'Unexpected type {type(value)} of value {value}')
@@ -1,24 +1,65 @@
 __all__ = ['CollectorManager']
 
+import json
 import time
+import asyncio
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from google.protobuf import struct_pb2
+from spaceone.core.error import ERROR_INVALID_PARAMETER
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.connector import GoogleCloudComputeConnector
+from spaceone.inventory.connector import GoogleCloudComputeConnector, GoogleCloudComputeAsyncConnector
+from spaceone.inventory.error.custom import ERROR_FIELD_MASKED
+from spaceone.inventory.libs.credential_cache import CREDENTIAL_CACHE
+from spaceone.inventory.libs.enrichment_pipeline import Enricher, EnrichmentPipeline
+from spaceone.inventory.libs.global_resource_index import GlobalResourceIndex
+from spaceone.inventory.libs.image_catalogue import IMAGE_CATALOGUE
+from spaceone.inventory.libs.incremental_collection import IncrementalCollection, UNCHANGED
+from spaceone.inventory.libs.lazy_resources import LazyResources
+from spaceone.inventory.libs.machine_type_catalogue import MachineTypeIndex, MACHINE_TYPE_CATALOGUE
+from spaceone.inventory.libs.rate_limiter import RATE_LIMITER
+from spaceone.inventory.libs.sharded_transform import ShardedTransform, get_zone_shards, is_fork_supported
+from spaceone.inventory.libs.struct_serializer import to_struct
 from spaceone.inventory.manager.compute_engine import VMInstanceManager, AutoScalerManager, LoadBalancerManager, \
     DiskManager, NICManager, VPCManager, SecurityGroupManager, StackDriverManager
-from spaceone.inventory.manager.metadata.metadata_manager import MetadataManager
-from spaceone.inventory.model.server import Server, ReferenceModel
+from spaceone.inventory import model
+from spaceone.inventory.libs.record import validate_choices
+from spaceone.inventory.model import records
 from spaceone.inventory.model.region import Region
 from spaceone.inventory.model.cloud_service_type import CloudServiceType
 
 # from pprint import pprint
 _LOGGER = logging.getLogger(__name__)
 NUMBER_OF_CONCURRENT = 20
+ENRICHMENT_BATCH_SIZE = 100
+# read by the enrichers when the listing failed or found nothing
+DEFAULT_RESOURCES = {'instance_group': [], 'public_images': {}}
+# enrichers run and zone independent resources listed by every options['collection_level'], None is everything.
+# compute still runs without disks / images / instance groups, the image, OS details and managed flag stay empty
+COLLECTION_LEVELS = {
+    'basic': {
+        'enrichers': ['compute', 'server'],
+        'resources': ['instance_type']
+    },
+    'standard': {
+        'enrichers': ['compute', 'disk', 'vpc', 'nic', 'server'],
+        'resources': ['instance_type', 'disk', 'vpcs', 'subnets']
+    },
+    'full': {
+        'enrichers': None,
+        'resources': None
+    }
+}
+DEFAULT_COLLECTION_LEVEL = 'full'
+_CHOICE_ERRORS = set()
 
 
 class CollectorManager(BaseManager):
 
     gcp_connector = None
+    enrichment_pipeline = None
 
     def __init__(self, transaction):
         super().__init__(transaction)
@@ -36,7 +77,6 @@ class CollectorManager(BaseManager):
         self.gcp_connector.get_connect(secret_data)
 
     def list_resources(self, params):
-        resources = []
         '''
         params = {
             'zone_info': {
@@ -46,6 +86,7 @@ class CollectorManager(BaseManager):
             'query': query,
             'secret_data': 'secret_data',
             'instance_ids': [instance_id, instance_id, ...],
+            'zones': [{'zone': 'us-east1-b', 'region': 'us-east1'}, ...],  # only when the filter has region_name
             'resources': {
                 'url_maps': url_maps,
                 'images': images,
@@ -56,162 +97,521 @@ class CollectorManager(BaseManager):
             },
             'instances': [...]
         }
+        options = {
+            'collection_level': 'basic' | 'standard' | 'full',  # see COLLECTION_LEVELS, full by default
+            'disabled_enrichers': ['load_balancer', 'security_group', ...],  # see get_enrichment_pipeline
+            'enrichment_batch_size': 100,
+            'sharded_transform': False,  # transform the instances in forked worker processes, zone by zone
+            'transform_shards': 4,  # number of worker processes, the number of cores by default
+            'incremental': False,  # emit only the servers changed since the last collect, see IncrementalCollection
+            'full_resweep_interval': 21600  # seconds between full collects of an incremental schedule
+        }
+
+        Yields: Server of every instance, page by page of the instance listing
+                (with sharded_transform, the Struct of every Server in the order the shards complete,
+                 with incremental, the Struct of every changed Server)
+
+        Instances are listed while the zone independent resources are still loading (see get_lazy_global_resources),
+        a batch of instances only waits for the resources read by its enrichers.
         '''
 
-        print(f"START LIST Resources")
+        _LOGGER.debug(f'[list_resources] START LIST Resources')
         start_time = time.time()
         secret_data = params.get('secret_data', {})
-        global_resources = self.get_global_resources(secret_data)
-        compute_vms = self.gcp_connector.list_instances()
-
-        for compute_vm in compute_vms:
-
-            zone, region = self._get_zone_and_region(compute_vm)
-            zone_info = {'zone': zone, 'region': region, 'project_id': secret_data.get('project_id', '')}
+        options = params.get('options', {})
 
+        if self.gcp_connector is None:
+            self.set_connector(secret_data)
+        self.gcp_connector.set_field_mask(options.get('field_mask', True), options.get('field_mask_debug', False))
+
+        # enrichers are registered once per collect, resources only read by disabled enrichers are not fetched
+        pipeline = self.get_enrichment_pipeline(options)
+        resource_kinds = self.get_resource_kinds(pipeline, options)
+        batch_size = max(1, int(options.get('enrichment_batch_size', ENRICHMENT_BATCH_SIZE)))
+
+        # push the collect filter down to the API queries
+        scopes = self._get_scopes(params.get('zones'))
+        instance_query = self._get_instance_query(params.get('instance_ids', []), scopes)
+
+        incremental = None
+        cached_resources = {}
+        if options.get('incremental', False):
+            incremental = self.get_incremental_collection(secret_data, options, scopes, params.get('instance_ids', []))
+            # a failed instance page raises, the collect is not finished and its watermark not saved
+            instance_query = dict(self._add_name_filter(instance_query, incremental.get_instance_names()),
+                                  skip_error=False)
+            cached_resources = incremental.get_cached_resources(resource_kinds)
+        fetched_kinds = set(resource_kinds) - set(cached_resources)
+
+        if incremental is not None and incremental.mode == UNCHANGED:
+            global_resources = {}
+            instance_pages = []
+        elif options.get('async_connector', False):
+            global_resources = asyncio.run(self.get_global_resources_async(secret_data, scopes, instance_query,
+                                                                           fetched_kinds, cached_resources))
+            instance_pages = [global_resources.pop('instances', [])]
+        else:
+            global_resources = self.get_lazy_global_resources(secret_data, options, scopes, fetched_kinds,
+                                                              cached_resources)
+            # the next page of instances is requested only after every server of this page is yielded
+            instance_pages = self.gcp_connector.iter_instances(**instance_query)
+
+        if incremental is not None:
+            instance_pages = ([compute_vm for compute_vm in compute_vms if incremental.is_selected(compute_vm)]
+                              for compute_vms in instance_pages)
+
+        resource_index = GlobalResourceIndex(global_resources)
+        project_id = secret_data.get('project_id', '')
+        if options.get('sharded_transform', False) and is_fork_supported():
+            servers = self._transform_sharded(pipeline, resource_index, instance_pages, project_id, batch_size,
+                                              options.get('transform_shards'))
+        else:
+            servers = self._transform(pipeline, resource_index, instance_pages, project_id, batch_size)
+
+        if incremental is not None:
+            servers = self._get_changed_servers(servers, incremental)
+
+        first_resource_latency = None
+        try:
+            for server in servers:
+                if first_resource_latency is None:
+                    first_resource_latency = round(time.time() - start_time, 3)
+                yield server
+        finally:
+            if isinstance(global_resources, LazyResources):
+                global_resources.close()
+
+        if incremental is not None:
+            incremental.finish(self._get_read_resources(global_resources, resource_kinds))
+            _LOGGER.info(f'[list_resources] incremental collect: {incremental.mode}, '
+                         f'{len(incremental.fingerprints)} servers transformed')
+
+        _LOGGER.info(f'[list_resources] Compute VMs Finished {time.time() - start_time} Seconds')
+        _LOGGER.info(f'[list_resources] latency (seconds): first resource {first_resource_latency}, '
+                     f'total {round(time.time() - start_time, 3)}')
+        if isinstance(global_resources, LazyResources):
+            _LOGGER.info(f'[list_resources] waited for resources (seconds): {global_resources.get_wait_times()}')
+        _LOGGER.info(f'[list_resources] enrichers (seconds): {pipeline.get_timings()}')
+        _LOGGER.info(f'[list_resources] API calls: {RATE_LIMITER.get_counters(secret_data.get("project_id"))}')
+        _LOGGER.info(f'[list_resources] credential cache: {CREDENTIAL_CACHE.get_counters()}')
+
+    def get_incremental_collection(self, secret_data, options, scopes=None, instance_ids=None):
+        """ IncrementalCollection of this project, collection level and filter, its mode set from the operations
+        since the last collect
+        """
+        project_id = secret_data.get('project_id', '')
+        # collects of another level or filter emit other servers, each of them keeps its own state
+        state_key = hashlib.sha1(json.dumps([project_id, options.get('collection_level') or DEFAULT_COLLECTION_LEVEL,
+                                             scopes, sorted(instance_ids or [])]).encode()).hexdigest()
+        incremental = IncrementalCollection(state_key, options.get('full_resweep_interval'))
+
+        operations = None
+        if incremental.mode is None:
             try:
-                resources.append(self.get_instances(zone_info, compute_vm, global_resources))
+                query = {'scopes': scopes, 'filter': incremental.get_operation_filter()}
+                if options.get('async_connector', False):
+                    operations = asyncio.run(self.list_operations_async(secret_data, **query))
+                else:
+                    operations = self.gcp_connector.list_operations(**query)
             except Exception as e:
-                print(f'[ERROR: {zone}] : {e}')
+                _LOGGER.error(f'[get_incremental_collection] operations of {project_id} are not read, '
+                              f'collect every server: {e}')
+
+        incremental.set_operations(operations)
+        return incremental
+
+    async def list_operations_async(self, secret_data, **query):
+        async_connector: GoogleCloudComputeAsyncConnector = \
+            self.locator.get_connector('GoogleCloudComputeAsyncConnector')
+        async_connector.get_connect(secret_data)
+        async_connector.field_mask = self.gcp_connector.field_mask
+
+        async with async_connector:
+            return await async_connector.list_operations(**query)
+
+    @staticmethod
+    def _add_name_filter(instance_query, instance_names):
+        if instance_names is None:
+            return instance_query
+        return {**instance_query,
+                'filter': instance_query.get('filter', []) + [{'key': 'name', 'values': instance_names}]}
+
+    def _transform(self, pipeline, resource_index, instance_pages, project_id, batch_size):
+        for compute_vms in instance_pages:
+            for idx in range(0, len(compute_vms), batch_size):
+                records = [self._get_instance_record(compute_vm, project_id)
+                           for compute_vm in compute_vms[idx:idx + batch_size]]
+
+                for record in pipeline.run(records, resource_index):
+                    if self._check_record(record):
+                        yield record['server']
+
+    def _transform_sharded(self, pipeline, resource_index, instance_pages, project_id, batch_size, processes=None):
+        """ instances of a page are split by zone into shards of batch_size at most, each shard is transformed
+        by a worker forked after the lookups of every stage are built, the Struct of a Server comes back serialized.
+        The pool reads the instance pages in the background, so the next page does not wait for this one.
+        """
+        # workers can not wait for the listings of the parent, every resource is loaded before the fork
+        resource_index.load()
+        pipeline.prepare(resource_index)
+        shards = (shard for compute_vms in instance_pages
+                  for shard in get_zone_shards([self._get_instance_record(compute_vm, project_id)
+                                                for compute_vm in compute_vms], batch_size))
+
+        with ShardedTransform(pipeline, resource_index, self._serialize_server, processes,
+                              initializer=self._reset_after_fork) as transform:
+            _LOGGER.info(f'[list_resources] sharded transform on {transform.processes} processes')
+            for records in transform.run(shards):
+                for record in records:
+                    if self._check_record(record):
+                        yield struct_pb2.Struct.FromString(record['result'])
+
+    @staticmethod
+    def _serialize_server(server):
+        return to_struct(server).SerializeToString()
+
+    def _reset_after_fork(self):
+        """ initializer of a sharded transform worker, forked from a thread of the gRPC server """
+        if self.gcp_connector is not None:
+            self.gcp_connector.reset_after_fork()
+        RATE_LIMITER.reset_after_fork()
+        MACHINE_TYPE_CATALOGUE.lock = threading.RLock()
+        IMAGE_CATALOGUE.lock = threading.RLock()
+
+    @staticmethod
+    def _get_changed_servers(servers, incremental):
+        """ Struct of every server which differs from the one emitted before,
+        serialized once for the fingerprint and for the API """
+        for server in servers:
+            struct = server if isinstance(server, struct_pb2.Struct) else to_struct(server)
+            if incremental.is_changed(struct):
+                yield struct
+
+    @staticmethod
+    def _get_read_resources(global_resources, resource_kinds):
+        """ global resources of resource_kinds this collect has read, a lazy kind nobody waited for is left out,
+        so is an empty one (a failed listing reads as empty, it is listed again next time)
+        """
+        if isinstance(global_resources, LazyResources):
+            global_resources = global_resources.get_loaded()
+        return {kind: value for kind, value in global_resources.items() if kind in resource_kinds and value}
+
+    @staticmethod
+    def _check_record(record):
+        """ False for a record whose enrichment failed, a masked field fails the whole collect """
+        error = record.get('error')
+        if isinstance(error, ERROR_FIELD_MASKED):
+            raise error
+        elif error is not None:
+            _LOGGER.error(f'[list_resources] {record["zone_info"]["zone"]}: {error}')
+            return False
+        return True
+
+    def list_regions(self, secret_data):
+        if self.gcp_connector is None:
+            self.set_connector(secret_data)
+        return self.gcp_connector.list_regions()
+
+    def get_global_resources(self, secret_data, options=None, scopes=None, resource_kinds=None):
+        options = options or {}
+        number_of_concurrent = options.get('number_of_concurrent', NUMBER_OF_CONCURRENT)
+
+        # Zone independent resources do not depend on each other, so each list runs on its own worker
+        fetchers = self._get_connector_fetchers(secret_data, scopes, resource_kinds)
+        global_resources = self.fetch_concurrently(fetchers, number_of_concurrent)
+        return self._set_default_resources(global_resources)
+
+    def get_lazy_global_resources(self, secret_data, options=None, scopes=None, resource_kinds=None, resources=None):
+        """ Same listings as get_global_resources, started in the background and read as they finish
+        resources: kinds already known (kept from the last incremental collect), read as they are
+        Returns: LazyResources, close() it at the end of the collect
+        """
+        options = options or {}
+        fetchers = self._get_connector_fetchers(secret_data, scopes, resource_kinds)
+        fetchers.update({kind: (lambda value=value: value) for kind, value in (resources or {}).items()})
+        return LazyResources(fetchers, options.get('number_of_concurrent', NUMBER_OF_CONCURRENT), DEFAULT_RESOURCES)
+
+    def _get_connector_fetchers(self, secret_data, scopes=None, resource_kinds=None):
+        if self.gcp_connector is None:
+            self.set_connector(secret_data)
 
-        print(f' Compute VMs Finished {time.time() - start_time} Seconds')
-        return resources
+        fetchers = self._get_global_resource_fetchers(self.gcp_connector, secret_data.get('project_id'), scopes)
+        fetchers['instance_group'] = lambda: self.list_instance_groups_with_members(scopes)
+        return self._filter_fetchers(fetchers, resource_kinds)
 
-    def get_global_resources(self, secret_data):
-        # print("[ GET zone independent resources ]")
+    async def get_global_resources_async(self, secret_data, scopes=None, instance_query=None, resource_kinds=None,
+                                         resources=None):
+        """ Same as get_global_resources, but every listing (including instances) runs on one event loop
+        through GoogleCloudComputeAsyncConnector.
+        resources: kinds already known (kept from the last incremental collect), not listed again
+        """
         if self.gcp_connector is None:
             self.set_connector(secret_data)
 
-        instance_group = self.gcp_connector.list_instance_group_managers()
+        async_connector: GoogleCloudComputeAsyncConnector = \
+            self.locator.get_connector('GoogleCloudComputeAsyncConnector')
+        async_connector.get_connect(secret_data)
+        async_connector.field_mask = self.gcp_connector.field_mask
+
+        async with async_connector:
+            fetchers = self._get_global_resource_fetchers(async_connector, secret_data.get('project_id'), scopes)
+            fetchers['instance_group'] = lambda: self.list_instance_groups_with_members_async(async_connector, scopes)
+            fetchers = self._filter_fetchers(fetchers, resource_kinds)
+            # an error of the instance listing is raised, not read as no instance
+            global_resources, instances = await asyncio.gather(
+                self.fetch_concurrently_async(fetchers), async_connector.list_instances(**(instance_query or {})))
+
+        global_resources.update(resources or {})
+        global_resources['instances'] = instances
+        return self._set_default_resources(global_resources)
+
+    def list_instance_groups_with_members(self, scopes=None):
+        instance_group = self.gcp_connector.list_instance_group_managers(scopes=scopes)
         self.gcp_connector.set_instance_into_instance_group_managers(instance_group)
+        return instance_group
+
+    async def list_instance_groups_with_members_async(self, async_connector, scopes=None):
+        instance_group = await async_connector.list_instance_group_managers(scopes=scopes)
+        await async_connector.set_instance_into_instance_group_managers(instance_group)
+        return instance_group
+
+    @staticmethod
+    def _get_global_resource_fetchers(connector, project_id, scopes=None):
+        return {
+            'disk': lambda: connector.list_disks(scopes=scopes),
+            'auto_scaler': lambda: connector.list_autoscalers(scopes=scopes),
+            'instance_type': connector.get_machine_type_index,
+            'public_images': lambda: connector.list_images(project_id),
+            'vpcs': connector.list_vpcs,
+            'subnets': lambda: connector.list_subnetworks(scopes=scopes),
+            'fire_walls': connector.list_firewall,
+            'forwarding_rules': lambda: connector.list_forwarding_rules(scopes=scopes),
+            'target_pools': lambda: connector.list_target_pools(scopes=scopes),
+            'url_maps': lambda: connector.list_url_maps(scopes=scopes),
+            'backend_svcs': lambda: connector.list_back_end_services(scopes=scopes),
+        }
 
-        managed_state_less = [i.get('selfLink') for i in instance_group if
-                              i.get('status', {}).get('stateful', {}).get('hasStatefulConfig') == False]
-        instance_groups_instance = []
+    @staticmethod
+    def _filter_fetchers(fetchers, resource_kinds=None):
+        """ fetchers of resource_kinds only, None keeps every fetcher """
+        if resource_kinds is None:
+            return fetchers
+        return {kind: fetcher for kind, fetcher in fetchers.items() if kind in resource_kinds}
+
+    @staticmethod
+    def _get_scopes(zones):
+        """ zones of the matched regions -> scopes of connector listings, None means the whole project """
+        if not zones:
+            return None
+
+        return {
+            'zone': sorted(set([zone_info.get('zone') for zone_info in zones])),
+            'region': sorted(set([zone_info.get('region') for zone_info in zones]))
+        }
 
-        for self_link in managed_state_less:
-            _self_link = self_link[:self_link.find('/instanceGroupManagers/')]
-            instance_group_name = self_link[self_link.rfind('/')+1:]
+    @staticmethod
+    def _get_instance_query(instance_ids, scopes):
+        query = {}
+        if instance_ids:
+            query.update({'filter': [{'key': 'id', 'values': instance_ids}]})
+        if scopes is not None:
+            query.update({'scopes': scopes})
+        return query
 
-            val = _self_link[_self_link.find('/zones/') + 7:] if 'zones' in self_link \
-                else _self_link[_self_link.find('/regions/') + 9:]
+    @staticmethod
+    def _set_default_resources(global_resources):
+        # managed / stateless membership is indexed from instance_list by GlobalResourceIndex
+        global_resources.update({kind: global_resources.get(kind) or default
+                                 for kind, default in DEFAULT_RESOURCES.items()})
+        return global_resources
 
+    @staticmethod
+    def fetch_concurrently(fetchers, number_of_concurrent):
+        """ Run every fetcher on its own worker and collect the results by resource kind
+        Args:
+            fetchers (dict): resource kind -> callable without arguments
+            number_of_concurrent (int): max number of workers
+
+        Returns: dict of resource kind -> fetched resources (empty list if the fetch failed)
+        """
+        results = {}
+        max_workers = max(1, min(int(number_of_concurrent), len(fetchers)))
+
+        def _fetch(kind, fetcher):
+            _start_time = time.time()
             try:
-                instances = self.gcp_connector.get_instance_in_group('zone', val,
-                                                                     instance_group_name) if 'zones' in self_link else \
-                    self.gcp_connector.get_instance_in_group('region', val, instance_group_name)
+                return kind, fetcher(), None, time.time() - _start_time
+            except Exception as e:
+                return kind, None, e, time.time() - _start_time
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(_fetch, kind, fetcher) for kind, fetcher in fetchers.items()]
+            for future in as_completed(futures):
+                kind, result, error, elapsed = future.result()
+                if error is not None:
+                    _LOGGER.error(f'[fetch_concurrently] {kind} failed after {elapsed:.2f} Seconds: {error}')
+                    results[kind] = []
+                else:
+                    _LOGGER.info(f'[fetch_concurrently] {kind} finished in {elapsed:.2f} Seconds')
+                    results[kind] = result
 
-                instance_groups_instance.extend(instances.get('items'))
+        return results
 
+    @staticmethod
+    async def fetch_concurrently_async(fetchers):
+        """ asyncio version of fetch_concurrently, fetchers return coroutines
+        """
+        async def _fetch(kind, fetcher):
+            _start_time = time.time()
+            try:
+                result = await fetcher()
+                _LOGGER.info(f'[fetch_concurrently_async] {kind} finished in {time.time() - _start_time:.2f} Seconds')
+                return result
             except Exception as e:
-                print(e)
+                _LOGGER.error(f'[fetch_concurrently_async] {kind} failed after {time.time() - _start_time:.2f} '
+                              f'Seconds: {e}')
+                return []
 
-        return {
-            'disk': self.gcp_connector.list_disks(),
-            'auto_scaler': self.gcp_connector.list_autoscalers(),
-            'instance_type': self.gcp_connector.list_machine_types(),
-            'instance_group': instance_group,
-            'public_images': self.gcp_connector.list_images(secret_data.get('project_id')),
-            'vpcs': self.gcp_connector.list_vpcs(),
-            'subnets': self.gcp_connector.list_subnetworks(),
-            'fire_walls': self.gcp_connector.list_firewall(),
-            'forwarding_rules': self.gcp_connector.list_forwarding_rules(),
-            'target_pools': self.gcp_connector.list_target_pools(),
-            'url_maps': self.gcp_connector.list_url_maps(),
-            'backend_svcs':  self.gcp_connector.list_back_end_services(),
-            'managed_stateless': [i.get('instance') for i in instance_groups_instance if 'instance' in i]
-        }
+        results = await asyncio.gather(*[_fetch(kind, fetcher) for kind, fetcher in fetchers.items()])
+        return dict(zip(fetchers.keys(), results))
 
     def get_instances(self, zone_info, instance, global_resources):
-        # VPC
-        vpcs = global_resources.get('vpcs', [])
-        subnets = global_resources.get('subnets', [])
-
-        # All Public Images
-        public_images = global_resources.get('public_images', {})
-
-        # URL Maps
-        url_maps = global_resources.get('url_maps', [])
-        backend_svcs = global_resources.get('backend_svcs', [])
-        target_pools = global_resources.get('target_pools', [])
-        # Forwarding Rules
-        forwarding_rules = global_resources.get('forwarding_rules', [])
-
-        # Security Group (Firewall)
-        firewalls = global_resources.get('fire_walls', [])
-
-        # Get Instance Groups
-        instance_group = global_resources.get('instance_group', [])
-
-        # Get Machine Types
-        instance_types = global_resources.get('instance_type', [])
-
-        # Autoscaling group list
-        auto_scaler = global_resources.get('auto_scaler', [])
-
-        instance_in_managed_instance_groups = global_resources.get('managed_stateless', [])
-
-        # disks
-        disks = global_resources.get('disk', [])
-        # TODO: if distro has additional requirement with os_distros for future
-        # disk_types = self.gcp_connector.list_disk_types(zone=zone)
-
-        # call_up all the managers
-        vm_instance_manager: VMInstanceManager = VMInstanceManager(self.gcp_connector)
-        auto_scaler_manager: AutoScalerManager = AutoScalerManager()
-        lb_manager: LoadBalancerManager = LoadBalancerManager()
-        disk_manager: DiskManager = DiskManager()
-        nic_manager: NICManager = NICManager()
-        vpc_manager: VPCManager = VPCManager()
-        security_group_manager: SecurityGroupManager = SecurityGroupManager()
-        stackdriver_manager: StackDriverManager = StackDriverManager()
-        meta_manager: MetadataManager = MetadataManager()
-
-        server_data = vm_instance_manager.get_server_info(instance, instance_types, disks, zone_info, public_images, instance_in_managed_instance_groups)
-
-        auto_scaler_vo = auto_scaler_manager.get_auto_scaler_info(instance, instance_group, auto_scaler)
-        load_balancer_vos = lb_manager.get_load_balancer_info(instance, instance_group, backend_svcs, url_maps,
-                                                              target_pools, forwarding_rules)
-        disk_vos = disk_manager.get_disk_info(instance, disks)
-        vpc_vo, subnet_vo = vpc_manager.get_vpc_info(instance, vpcs, subnets)
-        nic_vos = nic_manager.get_nic_info(instance, subnet_vo)
-        security_group_vos = security_group_manager.get_security_group_rules_info(instance, firewalls)
-        security_groups = [d.get('security_group_name') for d in security_group_vos if
-                           d.get('security_group_name', '') != '']
-
-        google_cloud = server_data['data'].get('google_cloud', {})
-
-        _google_cloud = google_cloud.to_primitive()
-        labels = _google_cloud.get('labels', [])
-        server_data.update({
-            'nics': nic_vos,
-            'disks': disk_vos,
-        })
-        _name = instance.get('name', '')
-        server_data['data']['compute']['security_groups'] = security_groups
-        server_data['data'].update({
-            'load_balancers': load_balancer_vos,
-            'security_group': security_group_vos,
-            'auto_scaler': auto_scaler_vo,
-            'vpc': vpc_vo,
-            'subnet': subnet_vo,
-            'stackdriver': stackdriver_manager.get_stackdriver_info(instance.get('id', ''))
-        })
-
-        server_data.update({
-            'name': _name,
-            'tags': labels,
-            '_metadata': meta_manager.get_metadata(),
-            'reference': ReferenceModel({
-                'resource_id': server_data['data']['google_cloud']['self_link'],
-                'external_link': f"https://console.cloud.google.com/compute/instancesDetail/zones/{zone_info.get('zone')}/instances/{server_data['name']}?project={server_data['data']['compute']['account']}"
+        # hash lookups over the global resources, built once per collect by list_resources
+        resource_index = global_resources if isinstance(global_resources, GlobalResourceIndex) \
+            else GlobalResourceIndex(global_resources)
+
+        if self.enrichment_pipeline is None:
+            self.get_enrichment_pipeline()
+
+        record = self.enrichment_pipeline.run([{'instance': instance, 'zone_info': zone_info}], resource_index)[0]
+        if record.get('error') is not None:
+            raise record['error']
+        return record['server']
+
+    def get_enrichment_pipeline(self, options=None):
+        """ Managers are created once per collect and shared by every instance, they keep no state per instance.
+        Enrichers in options['disabled_enrichers'] do not run and the resources only they read are not fetched:
+            auto_scaler, load_balancer, disk, vpc, nic, security_group, stackdriver
+        compute (the server itself) and server (the Server model) always run.
+        options['collection_level'] disables the enrichers out of its level as well.
+
+        With options['record_layer'] servers are built from the __slots__ records of spaceone.inventory.model.records
+        instead of the schematics models, choices are then checked once per server.
+        """
+        options = options or {}
+        level_enrichers = self.get_collection_level(options)['enrichers']
+        record_layer = options.get('record_layer', False)
+        models = records if record_layer else model
+        vm_instance_manager: VMInstanceManager = VMInstanceManager(self.gcp_connector, models)
+        auto_scaler_manager: AutoScalerManager = AutoScalerManager(models)
+        lb_manager: LoadBalancerManager = LoadBalancerManager(models)
+        disk_manager: DiskManager = DiskManager(models)
+        nic_manager: NICManager = NICManager(models)
+        vpc_manager: VPCManager = VPCManager(models)
+        security_group_manager: SecurityGroupManager = SecurityGroupManager(models)
+        stackdriver_manager: StackDriverManager = StackDriverManager(models)
+
+        def _compute(record, resource_index):
+            instance_types = resource_index.get('instance_type') or MachineTypeIndex()
+            record['server_data'] = vm_instance_manager.get_server_info(record['instance'], instance_types,
+                                                                        resource_index, record['zone_info'])
+
+        def _auto_scaler(record, resource_index):
+            record['server_data']['data']['auto_scaler'] = \
+                auto_scaler_manager.get_auto_scaler_info(record['instance'], resource_index)
+
+        def _load_balancer(record, resource_index):
+            record['server_data']['data']['load_balancers'] = \
+                lb_manager.get_load_balancer_info(record['instance'], resource_index)
+
+        def _disk(record, resource_index):
+            record['server_data']['disks'] = disk_manager.get_disk_info(record['instance'], resource_index)
+
+        def _vpc(record, resource_index):
+            vpc_vo, record['subnet'] = vpc_manager.get_vpc_info(record['instance'], resource_index)
+            record['server_data']['data'].update({'vpc': vpc_vo, 'subnet': record['subnet']})
+
+        def _nic(record, resource_index):
+            record['server_data']['nics'] = nic_manager.get_nic_info(record['instance'], record.get('subnet') or {})
+
+        def _security_group(record, resource_index):
+            security_group_vos = security_group_manager.get_security_group_rules_info(record['instance'],
+                                                                                      resource_index)
+            record['server_data']['data']['security_group'] = security_group_vos
+            record['server_data']['data']['compute']['security_groups'] = \
+                [d.get('security_group_name') for d in security_group_vos if d.get('security_group_name', '') != '']
+
+        def _stackdriver(record, resource_index):
+            record['server_data']['data']['stackdriver'] = \
+                stackdriver_manager.get_stackdriver_info(record['instance'].get('id', ''))
+
+        def _server(record, resource_index):
+            server_data = record['server_data']
+            zone_info = record['zone_info']
+            labels = server_data['data'].get('google_cloud', {}).to_primitive().get('labels', [])
+            server_data.update({
+                'name': record['instance'].get('name', ''),
+                'tags': labels,
+                # metadata is the same layout for every server, the Collector API splices it into the message
+                'reference': models.ReferenceModel({
+                    'resource_id': server_data['data']['google_cloud']['self_link'],
+                    'external_link': f"https://console.cloud.google.com/compute/instancesDetail/zones/{zone_info.get('zone')}/instances/{server_data['name']}?project={server_data['data']['compute']['account']}"
+                })
             })
-        })
-
-        return Server(server_data, strict=False)
+            record['server'] = models.Server(server_data, strict=False)
+            if record_layer:
+                self._log_choice_errors(validate_choices(record['server']))
+
+        enrichers = [
+            Enricher('compute', _compute, requires=('instance_type', 'disk', 'public_images', 'instance_group'),
+                     required=True, prepare=lambda resource_index: resource_index.get_os_image_index()),
+            Enricher('auto_scaler', _auto_scaler, requires=('instance_group', 'auto_scaler')),
+            Enricher('load_balancer', _load_balancer,
+                     requires=('instance_group', 'backend_svcs', 'url_maps', 'target_pools', 'forwarding_rules'),
+                     prepare=lambda resource_index: resource_index.get_load_balancer_topology(
+                         lb_manager.compile_http_row, lb_manager.compile_target_pool_row)),
+            Enricher('disk', _disk, requires=('disk',)),
+            Enricher('vpc', _vpc, requires=('vpcs', 'subnets')),
+            Enricher('nic', _nic),
+            Enricher('security_group', _security_group, requires=('fire_walls',),
+                     prepare=lambda resource_index: resource_index.get_firewall_index(
+                         security_group_manager.compile_security_group_rules)),
+            Enricher('stackdriver', _stackdriver),
+            Enricher('server', _server, required=True)
+        ]
+
+        disabled = list(options.get('disabled_enrichers', []))
+        if level_enrichers is not None:
+            disabled.extend([enricher.name for enricher in enrichers if enricher.name not in level_enrichers])
+
+        self.enrichment_pipeline = EnrichmentPipeline(enrichers, disabled)
+        return self.enrichment_pipeline
+
+    def get_resource_kinds(self, pipeline, options):
+        """ zone independent resources read by the enabled enrichers, within the collection level """
+        resource_kinds = pipeline.get_required_resources()
+        level_resources = self.get_collection_level(options)['resources']
+        return resource_kinds if level_resources is None else resource_kinds & set(level_resources)
 
+    @staticmethod
+    def get_collection_level(options):
+        collection_level = options.get('collection_level') or DEFAULT_COLLECTION_LEVEL
+        if collection_level not in COLLECTION_LEVELS:
+            raise ERROR_INVALID_PARAMETER(key='options.collection_level',
+                                          reason=f'{collection_level} is not one of {list(COLLECTION_LEVELS.keys())}')
+        return COLLECTION_LEVELS[collection_level]
 
+    @staticmethod
+    def _log_choice_errors(choice_errors):
+        # the schematics models do not validate choices either, so values out of the choices are only logged
+        for path, value, choices in choice_errors:
+            if (path, value) not in _CHOICE_ERRORS:
+                _CHOICE_ERRORS.add((path, value))
+                _LOGGER.warning(f'[record_layer] {path}: {value} is not one of {choices}')
 
+    def _get_instance_record(self, instance, project_id):
+        zone, region = self._get_zone_and_region(instance)
+        return {'instance': instance, 'zone_info': {'zone': zone, 'region': region, 'project_id': project_id}}
 
     @staticmethod
     def list_cloud_service_types():
@@ -258,12 +658,17 @@ class CollectorManager(BaseManager):
             "us-west4": {"name": "US, Nevada (Las Vegas)", "tags": {"latitude": "36.092498", "longitude": "-115.086073"}}
         }
 
-        match_region_info = REGION_INFO.get(result.get('region_code'))
+        # a Server, or its Struct when the transform is sharded
+        if isinstance(result, struct_pb2.Struct):
+            region_code = result['region_code'] if 'region_code' in result else None
+        else:
+            region_code = result.get('region_code')
+        match_region_info = REGION_INFO.get(region_code)
 
         if match_region_info is not None:
             region_info = match_region_info.copy()
             region_info.update({
-                'region_code': result.get('region_code')
+                'region_code': region_code
             })
 
             return Region(region_info, strict=False)
@@ -1,11 +1,11 @@
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.model.disk import Disk
+from spaceone.inventory import model
 
 class DiskManager(BaseManager):
-    def __init__(self):
-        pass
+    def __init__(self, models=None):
+        self.models = models or model
 
-    def get_disk_info(self, instance, disk_list):
+    def get_disk_info(self, instance, resource_index):
         '''
         disk_data = {
             "device_index": 0,
@@ -32,7 +32,7 @@ class DiskManager(BaseManager):
         for int_disk in int_disks:
             single_disk_tag = {}
             disk_sz = float(int_disk.get('diskSizeGb'))
-            matching_single_disk_tag = self._get_matched_disk_tag_info(int_disk, disk_list)
+            matching_single_disk_tag = self._get_matched_disk_tag_info(int_disk, resource_index)
             if matching_single_disk_tag is not None:
                 single_disk_type = self._get_disk_type(matching_single_disk_tag)
                 single_disk_tag.update({
@@ -56,7 +56,7 @@ class DiskManager(BaseManager):
                 'tags': single_disk_tag
             }
 
-            disks.append(Disk(single_disk, strict=False))
+            disks.append(self.models.Disk(single_disk, strict=False))
 
         return disks
 
@@ -100,13 +100,8 @@ class DiskManager(BaseManager):
         return constant
 
     @staticmethod
-    def _get_matched_disk_tag_info(int_disk, disk_list):
-        source_disk = None
-        source = int_disk.get('source', '')
-        disk = [disk_single for disk_single in disk_list if disk_single['selfLink'] == source]
-        if len(disk) > 0:
-            source_disk = disk[0]
-        return source_disk
+    def _get_matched_disk_tag_info(int_disk, resource_index):
+        return resource_index.get_disk(int_disk.get('source', ''))
 
     @staticmethod
     def _get_disk_type(matching_single_disk_tag):
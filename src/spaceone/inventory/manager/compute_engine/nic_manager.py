@@ -1,11 +1,11 @@
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.model.nic import NIC
+from spaceone.inventory import model
 
 
 class NICManager(BaseManager):
 
-    def __init__(self):
-        pass
+    def __init__(self, models=None):
+        self.models = models or model
 
     def get_nic_info(self, instance, subnet_vo):
         '''
@@ -35,7 +35,7 @@ class NICManager(BaseManager):
                 'tags': {}
             }
 
-            nics.append(NIC(nic_data, strict=False))
+            nics.append(self.models.NIC(nic_data, strict=False))
 
         return nics
 
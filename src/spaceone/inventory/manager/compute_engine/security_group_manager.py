@@ -1,14 +1,14 @@
 from itertools import product
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.model.security_group import SecurityGroup
+from spaceone.inventory import model
 
 
 class SecurityGroupManager(BaseManager):
 
-    def __init__(self):
-        pass
+    def __init__(self, models=None):
+        self.models = models or model
 
-    def get_security_group_rules_info(self, instance, firewalls):
+    def get_security_group_rules_info(self, instance, resource_index):
         '''
         "data.security_group_rules" = [
                     {
@@ -22,34 +22,21 @@ class SecurityGroupManager(BaseManager):
                         port_range_max = IntType(serialize_when_none=False)
                         security_group_id = StringType()
                         description = StringType(default="")
-                        direction = StringType(choices=("inboud", "outbound"))
+                        direction = StringType(choices=("inbound", "outbound"))
                         port = StringType(serialize_when_none=False)
                         action = StringType(choices=('allow', 'deny'))
                     }
                 ],
         '''
-        sg_rules = []
-        inst_svc_accounts = self._get_svc_account_infos(instance)
-        inst_network_info = self._get_instance_network_info(instance)
-
-        for firewall in firewalls:
-            if firewall.get('network', '') in inst_network_info:
-                for fire_wall_target_tag in firewall.get('targetTags', []):
-                    if fire_wall_target_tag in self._get_tag_item_list(instance) \
-                            or 'allow-all-instance' in fire_wall_target_tag:
-                        protocol_ports_list = self.get_allowed_or_denied_info(firewall)
-                        self.append_security_group(protocol_ports_list, firewall, sg_rules)
-
-            elif "targetServiceAccounts" in firewall:
-                for firewall_target_service_account in firewall.get('targetServiceAccounts', []):
-                    if firewall_target_service_account in inst_svc_accounts or \
-                            'allow-all-instance' in fire_wall_target_tag:
-                        protocol_ports_list = self.get_allowed_or_denied_info(firewall)
-                        self.append_security_group(protocol_ports_list, firewall, sg_rules)
-
-            elif "targetTags" not in firewall and "targetServiceAccounts" not in firewall:
-                pass
+        firewall_index = resource_index.get_firewall_index(self.compile_security_group_rules)
+        return firewall_index.get_rules(self._get_instance_network_info(instance), self._get_tag_item_list(instance),
+                                        self._get_svc_account_infos(instance))
 
+    def compile_security_group_rules(self, firewall):
+        """ SecurityGroup rows of a firewall, compiled once per collect by FirewallIndex """
+        sg_rules = []
+        protocol_ports_list = self.get_allowed_or_denied_info(firewall)
+        self.append_security_group(protocol_ports_list, firewall, sg_rules)
         return sg_rules
 
     def append_security_group(self, protocol_ports_list, firewall, sg_rules):
@@ -81,7 +68,7 @@ class SecurityGroupManager(BaseManager):
                     'remote': remote_cidr if remote_cidr != '' else remote_id
                 })
 
-                sg_rules.append(SecurityGroup(sg_single, strict=False))
+                sg_rules.append(self.models.SecurityGroup(sg_single, strict=False))
 
     def get_allowed_or_denied_info(self, firewall):
         if 'allowed' in firewall:
@@ -1,11 +1,11 @@
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.model.stackdriver import StackDriver, StackDriverFilters
+from spaceone.inventory import model
 
 
 class StackDriverManager(BaseManager):
 
-    def __init__(self):
-        pass
+    def __init__(self, models=None):
+        self.models = models or model
 
     def get_stackdriver_info(self, instance_id):
         '''
@@ -23,10 +23,9 @@ class StackDriverManager(BaseManager):
             'filters': self.get_filters(instance_id)
         }
 
-        return StackDriver(stackdriver_data, strict=False)
+        return self.models.StackDriver(stackdriver_data, strict=False)
 
-    @staticmethod
-    def get_filters(instance_id):
+    def get_filters(self, instance_id):
         '''
         "filters": [
             {
@@ -41,4 +40,4 @@ class StackDriverManager(BaseManager):
             'value': instance_id
         }
 
-        return [StackDriverFilters(filter, strict=False)]
\ No newline at end of file
+        return [self.models.StackDriverFilters(filter, strict=False)]
\ No newline at end of file
@@ -1,15 +1,15 @@
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.model.compute import Compute
-from spaceone.inventory.model.google_cloud import GoogleCloud
-from spaceone.inventory.model.os import OS
-from spaceone.inventory.model.hardware import Hardware
+from spaceone.inventory import model
+from spaceone.inventory.libs.machine_type_catalogue import parse_custom_machine_type
+from spaceone.inventory.libs.os_image_index import get_os_identity
 
 class VMInstanceManager(BaseManager):
 
-    def __init__(self,  gcp_connector=None):
+    def __init__(self,  gcp_connector=None, models=None):
         self.google_connector = gcp_connector
+        self.models = models or model
 
-    def get_server_info(self, instance, instance_types, disks, zone_info, public_images, instance_in_managed_instance_groups):
+    def get_server_info(self, instance, instance_types, resource_index, zone_info):
         '''
         server_data = {
             "name": '',
@@ -68,11 +68,11 @@ class VMInstanceManager(BaseManager):
         }
         '''
 
-        os_type, os_data = self.get_os_type_and_data(instance, public_images)
+        os_type, os_data = self.get_os_type_and_data(instance, resource_index)
         server_dic = self.get_server_dic(instance, os_type, zone_info)
-        google_cloud_data = self.get_google_cloud_data(instance, instance_in_managed_instance_groups)
+        google_cloud_data = self.get_google_cloud_data(instance, resource_index)
         hardware_data = self.get_hardware_data(instance, instance_types, zone_info)
-        compute_data = self.get_compute_data(instance, disks, zone_info)
+        compute_data = self.get_compute_data(instance, resource_index, zone_info)
 
         server_dic.update({
             'data': {
@@ -98,52 +98,16 @@ class VMInstanceManager(BaseManager):
 
         return server_data
 
-    def get_os_type_and_data(self, instance, public_images):
+    def get_os_type_and_data(self, instance, resource_index):
 
         disk_info = instance.get("disks", [])
-        os_dists = disk_info[0].get('licenses', []) if len(disk_info) > 0 else []
         licenses = disk_info[0].get('licenses', []) if len(disk_info) > 0 else []
-        os_type = "LINUX"
-        os_identity = ''
-
-        for idx, val in enumerate(os_dists):
-            os_items = val.split("/")
-            os_identity = os_items[-1].lower()
-            if idx == 0:
-                if "windows" in os_identity:
-                    os_type = "WINDOWS"
-                break
-
-        os_data = self._get_appropriate_image_info(os_identity, licenses, public_images)
-        return os_type, OS(os_data, strict=False)
-
-    @staticmethod
-    def _get_appropriate_image_info(os_identity, licenses, public_images):
-        # temp arch lists will be updated when full list has prepared.
-        arch_list = ['x86_64', 'x86_32', 'x64', 'x86', 'amd64']
-        os_data = {
-            'details': '',
-            'os_distro': '',
-            'os_arch': ''
-        }
-        for key, images in public_images.items():
-            find = False
-            if key in os_identity:
-                for image in images:
-                    if licenses == image.get('licenses', []):
-                        os_arch_index = [i for i, e in enumerate(arch_list) if e in image.get('description', '')]
-
-                        os_data.update({'os_distro': 'windows-server' if key == 'windows' else key,
-                                        'details': image.get('description', ''),
-                                        'os_arch': arch_list[os_arch_index[0]] if len(os_arch_index) > 0 else ''})
-                        find = True
-                        break
-            if find:
-                break
+        os_type = "WINDOWS" if "windows" in get_os_identity(licenses) else "LINUX"
 
-        return os_data
+        os_data = resource_index.get_os_image_index().get_os_data(licenses)
+        return os_type, self.models.OS(os_data, strict=False)
 
-    def get_google_cloud_data(self, instance, instance_in_managed_instance_groups):
+    def get_google_cloud_data(self, instance, resource_index):
         google_cloud = {
             "self_link": instance.get('selfLink', ''),
             "fingerprint": instance.get('fingerprint', ''),
@@ -151,10 +115,10 @@ class VMInstanceManager(BaseManager):
             "deletion_protection": instance.get('deletionProtection', False),
             "scheduling": self.get_scheduling(instance),
             "labels": instance.get('labels', {}),
-            'is_managed_instance': True if instance.get('selfLink', '') in instance_in_managed_instance_groups else False,
+            'is_managed_instance': resource_index.is_managed_instance(instance.get('selfLink', '')),
         }
 
-        return GoogleCloud(google_cloud, strict=False)
+        return self.models.GoogleCloud(google_cloud, strict=False)
 
     def get_hardware_data(self, instance, instance_types, zone_info):
         '''
@@ -176,9 +140,9 @@ class VMInstanceManager(BaseManager):
             'is_vm': True
         }
 
-        return Hardware(hardware_data, strict=False)
+        return self.models.Hardware(hardware_data, strict=False)
 
-    def get_compute_data(self, instance, disks, zone_info):
+    def get_compute_data(self, instance, resource_index, zone_info):
         '''
             {
                 'keypair': StringType(default="")
@@ -204,19 +168,20 @@ class VMInstanceManager(BaseManager):
             'instance_state': instance.get('status'),
             'instance_type': self._get_instance_type(instance),
             'account': zone_info.get('project_id', ''),
-            'image': self._get_images(instance, disks),
+            'image': self._get_images(instance, resource_index),
             'launched_at': instance.get('creationTimestamp'),
             'tags': self._get_tags_only_string_values(instance)
         }
 
-        return Compute(compute_data)
+        return self.models.Compute(compute_data)
 
     def get_custom_image_type(self, instance, zone_info, instance_types):
         machine = instance.get('machineType', '')
         _machine = machine[machine.rfind('/')+1:]
 
-        custom_image_type = self.google_connector.get_machine_type(zone_info.get('zone'), _machine)
-        instance_types.append(custom_image_type)
+        # custom shapes carry vCPUs and memory in the name, the API is asked only for the others
+        custom_image_type = parse_custom_machine_type(_machine) or \
+            self.google_connector.get_machine_type(zone_info.get('zone'), _machine)
 
         cpu = custom_image_type.get('guestCpus', 0)
         memory = round(float((custom_image_type.get('memoryMb', 0)) / 1024), 2)
@@ -231,15 +196,13 @@ class VMInstanceManager(BaseManager):
         return tags
 
     @staticmethod
-    def _get_images(instance, disks):
+    def _get_images(instance, resource_index):
         image = ''
-        name = instance.get('name', '')
+        disk = resource_index.get_disk_by_name(instance.get('name', ''))
 
-        for disk in disks:
-            if name == disk.get('name', ''):
-                _image = disk.get('sourceImage', '')
-                image = _image[_image.rfind('/')+1:]
-                break
+        if disk is not None:
+            _image = disk.get('sourceImage', '')
+            image = _image[_image.rfind('/')+1:]
         return image
 
     @staticmethod
@@ -250,15 +213,13 @@ class VMInstanceManager(BaseManager):
 
     @staticmethod
     def _get_core_and_memory(instance, instance_types):
-        machine_type = instance.get('machineType', '')
-        _machine = machine_type[machine_type.rfind('/') + 1:]
+        # instance_types: MachineTypeIndex
         cpu = 0
         memory = 0
-        for i_type in instance_types:
-            if i_type.get('selfLink', '') == machine_type or i_type.get('name', '') == _machine:
-                cpu = i_type.get('guestCpus')
-                memory = round(float((i_type.get('memoryMb', 0)) / 1024), 2)
-                break
+        i_type = instance_types.get_by_self_link(instance.get('machineType', ''))
+        if i_type is not None:
+            cpu = i_type.get('guestCpus')
+            memory = round(float((i_type.get('memoryMb', 0)) / 1024), 2)
 
         return cpu, memory
 
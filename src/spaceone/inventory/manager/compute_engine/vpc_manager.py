@@ -1,14 +1,13 @@
 from spaceone.core.manager import BaseManager
-from spaceone.inventory.model.vpc import VPC
-from spaceone.inventory.model.subnet import Subnet
+from spaceone.inventory import model
 
 
 class VPCManager(BaseManager):
 
-    def __init__(self):
-        pass
+    def __init__(self, models=None):
+        self.models = models or model
 
-    def get_vpc_info(self, instance, vpcs, subnets):
+    def get_vpc_info(self, instance, resource_index):
         '''
         vpc_data = {
             "vpc_id": "",
@@ -29,8 +28,8 @@ class VPCManager(BaseManager):
 
         vpc_data = {}
         subnet_data = {}
-        matched_subnet = self._get_matching_subnet(instance, subnets)
-        matched_vpc = self.get_matching_vpc(matched_subnet, vpcs)
+        matched_subnet = self._get_matching_subnet(instance, resource_index)
+        matched_vpc = self.get_matching_vpc(matched_subnet, resource_index)
 
         if matched_vpc is not None:
             vpc_data.update({
@@ -50,22 +49,18 @@ class VPCManager(BaseManager):
                 'self_link': matched_subnet.get('selfLink', '')
             })
 
-        return VPC(vpc_data, strict=False), Subnet(subnet_data, strict=False)
+        return self.models.VPC(vpc_data, strict=False), self.models.Subnet(subnet_data, strict=False)
 
-    def get_matching_vpc(self, matched_subnet, vpcs):
+    def get_matching_vpc(self, matched_subnet, resource_index):
         matching_vpc = None
         network = matched_subnet.get('selfLink', None)
         if network is not None:
-            for vpc in vpcs:
-                if network in vpc.get('subnetworks', []):
-                    matching_vpc = vpc
-                    break
+            matching_vpc = resource_index.get_vpc(network)
 
         return matching_vpc
 
     @staticmethod
-    def _get_matching_subnet(instance, subnets):
-        subnet_data = None
+    def _get_matching_subnet(instance, resource_index):
         subnet_work_links =[]
         network_interfaces = instance.get('networkInterfaces', [])
         for network_interface in network_interfaces:
@@ -73,12 +68,7 @@ class VPCManager(BaseManager):
             if subnet_work != '':
                 subnet_work_links.append(subnet_work)
 
-        for subnet in subnets:
-            if subnet.get('selfLink', '') in subnet_work_links:
-                subnet_data = subnet
-                break
-
-        return subnet_data
+        return resource_index.get_subnet(subnet_work_links)
 
     @staticmethod
     def _get_network_str(subnet):
@@ -111,6 +111,8 @@ labels = TableDynamicLayout.set_fields('Google Cloud Labels', root_path='data.go
 ])
 
 metadata = ServerMetadata.set_layouts([compute_engine, labels, disk, nic, security_group, lb])
+# the layout is the same for every server, so it is serialized once at import instead of once per server
+metadata_primitive = metadata.to_primitive()
 
 
 class MetadataManager(BaseManager):
@@ -120,3 +122,7 @@ class MetadataManager(BaseManager):
 
     def get_metadata(self):
         return self.metadata
+
+    @staticmethod
+    def get_metadata_primitive():
+        return metadata_primitive
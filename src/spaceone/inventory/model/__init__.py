@@ -10,9 +10,9 @@ from spaceone.inventory.model.security_group import SecurityGroup
 from spaceone.inventory.model.subnet import Subnet
 from spaceone.inventory.model.vpc import VPC
 from spaceone.inventory.model.region import Region
-from spaceone.inventory.model.stackdriver import StackDriver
+from spaceone.inventory.model.stackdriver import StackDriver, StackDriverFilters
 # METADATA
 from spaceone.inventory.model.metadata.metadata import *
 from spaceone.inventory.model.metadata.metadata_dynamic_field import *
 
-from spaceone.inventory.model.server import Server, ServerData
+from spaceone.inventory.model.server import Server, ServerData, ReferenceModel
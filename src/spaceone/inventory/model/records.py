@@ -0,0 +1,23 @@
+"""
+Record classes (spaceone.inventory.libs.record) of the server models, used instead of the schematics models
+when the collect option 'record_layer' is set. Names are the same as the models.
+"""
+from spaceone.inventory.libs.record import record_class
+from spaceone.inventory.model import auto_scaler, compute, disk, google_cloud, hardware, load_balancer, nic, os, \
+    security_group, server, stackdriver, subnet, vpc
+
+AutoScaler = record_class(auto_scaler.AutoScaler)
+Compute = record_class(compute.Compute)
+Disk = record_class(disk.Disk)
+GoogleCloud = record_class(google_cloud.GoogleCloud)
+Hardware = record_class(hardware.Hardware)
+LoadBalancer = record_class(load_balancer.LoadBalancer)
+NIC = record_class(nic.NIC)
+OS = record_class(os.OS)
+SecurityGroup = record_class(security_group.SecurityGroup)
+Server = record_class(server.Server)
+ReferenceModel = record_class(server.ReferenceModel)
+StackDriver = record_class(stackdriver.StackDriver)
+StackDriverFilters = record_class(stackdriver.StackDriverFilters)
+Subnet = record_class(subnet.Subnet)
+VPC = record_class(vpc.VPC)
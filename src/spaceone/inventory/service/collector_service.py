@@ -1,7 +1,8 @@
 import time
 import logging
 from spaceone.core.service import *
-from spaceone.inventory.manager.collector_manager import CollectorManager
+from spaceone.inventory.manager.collector_manager import CollectorManager, COLLECTION_LEVELS, \
+    DEFAULT_COLLECTION_LEVEL
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -62,7 +63,8 @@ FILTER_FORMAT = [
 SUPPORTED_RESOURCE_TYPE = ['inventory.Server', 'inventory.Region']
 NUMBER_OF_CONCURRENT = 20
 SUPPORTED_FEATURES = ['garbage_collection']
-SUPPORTED_SCHEDULES = ['hours']
+# interval schedules are meant for options['incremental'], every run of them is cheap
+SUPPORTED_SCHEDULES = ['hours', 'interval']
 
 @authentication_handler
 class CollectorService(BaseService):
@@ -79,7 +81,10 @@ class CollectorService(BaseService):
             'filter_format': FILTER_FORMAT,
             'supported_resource_type': SUPPORTED_RESOURCE_TYPE,
             'supported_features': SUPPORTED_FEATURES,
-            'supported_schedules': SUPPORTED_SCHEDULES
+            'supported_schedules': SUPPORTED_SCHEDULES,
+            # options['collection_level'], from the cheapest to the complete collect
+            'supported_collection_levels': list(COLLECTION_LEVELS.keys()),
+            'default_collection_level': DEFAULT_COLLECTION_LEVEL
             }
         return {'metadata': capability}
 
@@ -117,7 +122,13 @@ class CollectorService(BaseService):
         """
 
         start_time = time.time()
-        # all_regions = self.collector_manager.list_regions(params['secret_data'])
+
+        # push region_name / instance_id of the filter down to the API queries
+        (query, instance_ids, filter_region_name) = self._check_query(params['filter'])
+        params['instance_ids'] = instance_ids
+        if filter_region_name or 'region_name' in params['secret_data']:
+            all_regions = self.collector_manager.list_regions(params['secret_data'])
+            params['zones'] = self.get_all_zones(params['secret_data'], filter_region_name, all_regions)
 
         resource_regions = []
         collected_region_code = []
@@ -181,8 +192,9 @@ class CollectorService(BaseService):
             match_zones = self.match_zones_from_region(all_regions, secret_data['region_name'])
 
         if filter_region_name:
+            match_zones = []
             for _region in filter_region_name:
-                match_zones = self.match_zones_from_region(all_regions, _region)
+                match_zones.extend(self.match_zones_from_region(all_regions, _region))
 
         if not match_zones:
             # print(f'region count = {len(all_regions)}')
@@ -0,0 +1,48 @@
+import unittest
+
+from spaceone.core.error import ERROR_INVALID_PARAMETER
+from spaceone.inventory.manager.collector_manager import CollectorManager
+from test_struct_serializer import get_sample_servers
+
+
+class TestCollectionLevel(unittest.TestCase):
+
+    def setUp(self):
+        self.collector_manager = CollectorManager.__new__(CollectorManager)
+
+    def get_stages_and_resources(self, options):
+        pipeline = self.collector_manager.get_enrichment_pipeline(options)
+        return [stage.name for stage in pipeline.stages], \
+            sorted(self.collector_manager.get_resource_kinds(pipeline, options))
+
+    def test_stages_and_resources_of_every_level(self):
+        self.assertEqual((['compute', 'server'], ['instance_type']),
+                         self.get_stages_and_resources({'collection_level': 'basic'}))
+        self.assertEqual((['compute', 'disk', 'vpc', 'nic', 'server'], ['disk', 'instance_type', 'subnets', 'vpcs']),
+                         self.get_stages_and_resources({'collection_level': 'standard'}))
+        self.assertEqual(self.get_stages_and_resources({}), self.get_stages_and_resources({'collection_level': 'full'}))
+        self.assertEqual(9, len(self.get_stages_and_resources({})[0]))
+
+    def test_disabled_enrichers_within_a_level(self):
+        self.assertEqual((['compute', 'disk', 'vpc', 'server'], ['disk', 'instance_type', 'subnets', 'vpcs']),
+                         self.get_stages_and_resources({'collection_level': 'standard', 'disabled_enrichers': ['nic']}))
+
+    def test_unknown_level(self):
+        with self.assertRaises(ERROR_INVALID_PARAMETER):
+            self.collector_manager.get_enrichment_pipeline({'collection_level': 'deep'})
+
+    def test_basic_servers(self):
+        full_servers = get_sample_servers()
+        for server, full_server in zip(get_sample_servers({'collection_level': 'basic'}), full_servers):
+            self.assertEqual(full_server['data']['compute']['instance_state'],
+                             server['data']['compute']['instance_state'])
+            self.assertEqual(full_server['ip_addresses'], server['ip_addresses'])
+            self.assertEqual(full_server['data']['hardware'].to_primitive(),
+                             server['data']['hardware'].to_primitive())
+            self.assertIsNone(server['disks'])
+            self.assertIsNone(server['nics'])
+            self.assertIsNone(server['data']['load_balancers'])
+
+
+if __name__ == "__main__":
+    unittest.main()
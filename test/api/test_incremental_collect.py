@@ -0,0 +1,116 @@
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from google.protobuf import struct_pb2
+from spaceone.inventory.libs.incremental_collection import COLLECTION_STATE_STORE
+from spaceone.inventory.manager.collector_manager import CollectorManager
+from test_struct_serializer import get_sample
+
+
+class FakeConnector(object):
+    """ lists the resources of data/collect_sample.json and counts the listings """
+
+    field_mask = None
+
+    def __init__(self, sample):
+        self.sample = sample
+        self.operations = []
+        self.listed = []
+        self.failed_page = False
+
+    def set_field_mask(self, *args):
+        pass
+
+    def list_operations(self, **query):
+        return self.operations
+
+    def iter_instances(self, skip_error=True, **query):
+        self.listed.append('instances')
+        yield self.sample['instances'][:2]
+        if self.failed_page:
+            if skip_error:
+                return
+            raise ConnectionError('page 2')
+        yield self.sample['instances'][2:]
+
+    def get_machine_type_index(self):
+        return self.sample['global_resources']['instance_type']
+
+    def list_images(self, project_id):
+        return self.sample['global_resources'].get('public_images', {})
+
+    def set_instance_into_instance_group_managers(self, instance_group_managers):
+        pass
+
+    def __getattr__(self, name):
+        kinds = {'list_disks': 'disk', 'list_autoscalers': 'auto_scaler', 'list_vpcs': 'vpcs',
+                 'list_subnetworks': 'subnets', 'list_firewall': 'fire_walls', 'list_forwarding_rules': 'forwarding_rules',
+                 'list_target_pools': 'target_pools', 'list_url_maps': 'url_maps',
+                 'list_back_end_services': 'backend_svcs', 'list_instance_group_managers': 'instance_group'}
+        if name not in kinds:
+            raise AttributeError(name)
+
+        def _list(*args, **query):
+            self.listed.append(kinds[name])
+            return self.sample['global_resources'].get(kinds[name], [])
+        return _list
+
+
+class TestIncrementalCollect(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        patcher = mock.patch('spaceone.inventory.libs.incremental_collection.config.get_global',
+                             side_effect=lambda key, default=None: {'cache_dir': self.cache_dir})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+        self.addCleanup(COLLECTION_STATE_STORE.reset)
+        COLLECTION_STATE_STORE.reset()
+
+        self.sample = get_sample()
+        self.connector = FakeConnector(self.sample)
+
+    def collect(self):
+        self.connector.listed = []
+        collector_manager = CollectorManager.__new__(CollectorManager)
+        collector_manager.gcp_connector = self.connector
+        return list(collector_manager.list_resources({'secret_data': {'project_id': 'p'},
+                                                      'options': {'incremental': True}}))
+
+    def test_narrow_collect_lists_only_the_touched_resources(self):
+        self.assertEqual(4, len(self.collect()))
+
+        disk = self.sample['global_resources']['disk'][0]
+        self.connector.operations = [{'targetLink': disk['selfLink'], 'status': 'RUNNING'}]
+        self.assertEqual([], self.collect())
+        self.assertEqual(['disk', 'instances'], sorted(self.connector.listed))
+
+        instance = self.sample['instances'][0]
+        instance['labels'] = {'changed': 'true'}
+        self.connector.operations = [{'targetLink': instance['selfLink'], 'status': 'RUNNING'}]
+        servers = self.collect()
+        self.assertEqual(['instances'], self.connector.listed)
+        self.assertEqual([instance['selfLink']], [server['reference']['resource_id'] for server in servers])
+        self.assertIsInstance(servers[0], struct_pb2.Struct)
+
+    def test_failed_instance_page_keeps_the_watermark(self):
+        self.collect()
+        state = COLLECTION_STATE_STORE.get_state(self._get_state_key())
+
+        self.connector.operations = [{'targetLink': 'https://www.googleapis.com/compute/v1/projects/p/global/'
+                                                    'firewalls/allow-ssh', 'status': 'RUNNING'}]
+        self.connector.failed_page = True
+        with self.assertRaises(ConnectionError):
+            self.collect()
+        self.assertEqual(state, COLLECTION_STATE_STORE.get_state(self._get_state_key()))
+
+    @staticmethod
+    def _get_state_key():
+        return list(COLLECTION_STATE_STORE._states.keys())[0]
+
+
+if __name__ == "__main__":
+    unittest.main()
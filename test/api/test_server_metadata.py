@@ -0,0 +1,25 @@
+import unittest
+
+from spaceone.core.pygrpc.message_type import change_struct_type
+from spaceone.inventory.api.plugin.collector import Collector
+from spaceone.inventory.manager.metadata.metadata_manager import MetadataManager
+from spaceone.inventory.model.region import Region
+from spaceone.inventory.model.server import Server
+
+
+class TestServerMetadata(unittest.TestCase):
+
+    def test_server_metadata_is_spliced(self):
+        server_data = {'name': 'vm-1', 'os_type': 'LINUX', 'tags': {'env': 'dev'}}
+        serialized = change_struct_type(
+            Server(dict(server_data, _metadata=MetadataManager().get_metadata()), strict=False).to_primitive())
+
+        self.assertEqual(serialized, Collector.get_resource_struct(Server(server_data, strict=False), 'inventory.Server'))
+
+    def test_other_resources_have_no_metadata(self):
+        region = Region({'name': 'US, Iowa', 'region_code': 'us-central1'}, strict=False)
+        self.assertNotIn('metadata', Collector.get_resource_struct(region, 'inventory.Region').fields)
+
+
+if __name__ == "__main__":
+    unittest.main()
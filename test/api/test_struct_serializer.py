@@ -0,0 +1,89 @@
+import os
+import json
+import unittest
+
+from google.protobuf.json_format import MessageToDict
+from spaceone.core.pygrpc.message_type import change_struct_type
+from spaceone.inventory.api.plugin.collector import Collector
+from spaceone.inventory.libs.global_resource_index import GlobalResourceIndex
+from spaceone.inventory.libs.machine_type_catalogue import MachineTypeIndex
+from spaceone.inventory.libs.sharded_transform import is_fork_supported
+from spaceone.inventory.libs.struct_serializer import to_struct
+from spaceone.inventory.manager.collector_manager import CollectorManager
+from spaceone.inventory.model.region import Region
+from spaceone.inventory.model.server import Server
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), 'data')
+
+
+def get_sample():
+    with open(os.path.join(DATA_DIR, 'collect_sample.json')) as f:
+        sample = json.load(f)
+
+    global_resources = sample['global_resources']
+    instance_types = MachineTypeIndex()
+    for machine_type in global_resources['instance_type']:
+        instance_types.add(machine_type, [MachineTypeIndex.parse_self_link(machine_type['selfLink'])[0]])
+    global_resources['instance_type'] = instance_types
+    return sample
+
+
+def get_sample_servers(options=None):
+    """ Servers of data/collect_sample.json, transformed by CollectorManager.get_instances """
+    sample = get_sample()
+    global_resources = sample['global_resources']
+
+    collector_manager = CollectorManager.__new__(CollectorManager)
+    collector_manager.get_enrichment_pipeline(options)
+    servers = []
+    for instance in sample['instances']:
+        zone, region = collector_manager._get_zone_and_region(instance)
+        servers.append(collector_manager.get_instances({'zone': zone, 'region': region, 'project_id': 'p'},
+                                                       instance, global_resources))
+    return servers
+
+
+class TestStructSerializer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.servers = get_sample_servers()
+
+    def test_same_struct_as_to_primitive(self):
+        for server in self.servers:
+            self.assertEqual(change_struct_type(server.to_primitive()), to_struct(server))
+
+        for model in [Server({'name': 'empty', 'disks': [], 'nics': None}, strict=False),
+                      Region({'name': 'US, Iowa', 'region_code': 'us-central1', 'tags': {}}, strict=False)]:
+            self.assertEqual(change_struct_type(model.to_primitive()), to_struct(model))
+
+    def test_golden_file(self):
+        self.assertGolden(self.servers)
+
+    def test_golden_file_of_record_layer(self):
+        self.assertGolden(get_sample_servers({'record_layer': True}))
+
+    @unittest.skipUnless(is_fork_supported(), 'fork start method is not available')
+    def test_golden_file_of_sharded_transform(self):
+        sample = get_sample()
+        collector_manager = CollectorManager.__new__(CollectorManager)
+        servers = collector_manager._transform_sharded(collector_manager.get_enrichment_pipeline(),
+                                                       GlobalResourceIndex(sample['global_resources']),
+                                                       [sample['instances']], 'p', batch_size=2, processes=2)
+
+        # shards complete in any order
+        self.assertGolden(sorted(servers, key=lambda server: server['reference']['resource_id']), sort=True)
+
+    def assertGolden(self, servers, sort=False):
+        with open(os.path.join(DATA_DIR, 'collect_sample_servers.json')) as f:
+            golden = json.load(f)
+        if sort:
+            golden.sort(key=lambda server: server['reference']['resource_id'])
+
+        resources = [MessageToDict(Collector.get_resource_struct(server, 'inventory.Server')) for server in servers]
+        self.assertEqual(golden, [{key: value for key, value in resource.items() if key != 'metadata'}
+                                  for resource in resources])
+
+
+if __name__ == "__main__":
+    unittest.main()
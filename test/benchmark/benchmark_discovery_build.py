@@ -0,0 +1,46 @@
+"""
+Client construction time of GoogleCloudComputeConnector.
+
+    before : googleapiclient.discovery.build('compute', 'v1') on every verify / collect
+    after  : build_from_document() with the pinned document once, memoized service afterwards
+
+usage)
+    cd src && PYTHONPATH=. python ../test/benchmark/benchmark_discovery_build.py
+"""
+import time
+import httplib2
+import googleapiclient.discovery
+from spaceone.inventory.connector import GoogleCloudComputeConnector
+
+ROUNDS = 10
+
+
+def _measure(func, rounds=ROUNDS):
+    elapsed = []
+    for _ in range(rounds):
+        start_time = time.perf_counter()
+        func()
+        elapsed.append(time.perf_counter() - start_time)
+    return elapsed
+
+
+def _build_every_time():
+    googleapiclient.discovery.build('compute', 'v1', http=httplib2.Http(), cache_discovery=False)
+
+
+def _build_pinned_document():
+    GoogleCloudComputeConnector._service = None
+    GoogleCloudComputeConnector.get_service()
+
+
+def _get_memoized_service():
+    GoogleCloudComputeConnector.get_service()
+
+
+if __name__ == '__main__':
+    for name, func in [('discovery.build (before)', _build_every_time),
+                       ('pinned document, first build', _build_pinned_document),
+                       ('pinned document, memoized', _get_memoized_service)]:
+        elapsed = _measure(func)
+        print(f'{name:<32} avg {sum(elapsed) / len(elapsed) * 1000:9.3f} ms   '
+              f'max {max(elapsed) * 1000:9.3f} ms')
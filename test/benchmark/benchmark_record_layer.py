@@ -0,0 +1,48 @@
+"""
+Transform time and memory of a server built from the schematics models and from the records
+(options['record_layer']), over the instances of benchmark_transform_scaling.
+    time:   CollectorManager.get_instances per VM
+    blocks: memory blocks allocated per VM and still held by the servers (tracemalloc)
+    peak:   peak traced memory of the transform per VM
+
+usage)
+    cd src && PYTHONPATH=.:../test/benchmark python ../test/benchmark/benchmark_record_layer.py
+"""
+import time
+import tracemalloc
+from benchmark_transform_scaling import ZONE, REGION, _instance, _global_resources
+from spaceone.inventory.manager.collector_manager import CollectorManager
+from spaceone.inventory.libs.global_resource_index import GlobalResourceIndex
+
+SIZE = 1000
+
+
+def _transform(options, instances, resource_index):
+    collector_manager = CollectorManager.__new__(CollectorManager)
+    collector_manager.gcp_connector = None
+    collector_manager.get_enrichment_pipeline(options)
+    return [collector_manager.get_instances({'zone': ZONE, 'region': REGION, 'project_id': 'sample-project'},
+                                            instance, resource_index) for instance in instances]
+
+
+if __name__ == '__main__':
+    instances = [_instance(idx) for idx in range(SIZE)]
+    resource_index = GlobalResourceIndex(_global_resources(SIZE))
+    # compile the per collect indexes before measuring
+    _transform({}, instances[:1], resource_index)
+
+    for name, options in [('schematics', {}), ('record_layer', {'record_layer': True})]:
+        start_time = time.perf_counter()
+        _transform(options, instances, resource_index)
+        elapsed = time.perf_counter() - start_time
+
+        tracemalloc.start()
+        before = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        servers = _transform(options, instances, resource_index)
+        after = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        print(f'{name:>14}   per VM {elapsed / SIZE * 1000000:8.1f} us   blocks {(after - before) / SIZE:8.1f}'
+              f'   peak {peak / SIZE / 1024:8.1f} KiB')
+        del servers
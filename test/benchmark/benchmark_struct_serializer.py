@@ -0,0 +1,38 @@
+"""
+Serialization of a Server into the protobuf Struct of Collector.collect.
+    to_primitive: change_struct_type(server.to_primitive()), the dict of schematics then the Struct
+    to_struct:    struct_serializer.to_struct(server), written straight into the Struct
+
+usage)
+    cd src && PYTHONPATH=.:../test/api python ../test/benchmark/benchmark_struct_serializer.py
+"""
+import time
+import tracemalloc
+from spaceone.core.pygrpc.message_type import change_struct_type
+from spaceone.inventory.libs.struct_serializer import to_struct
+from test_struct_serializer import get_sample_servers
+
+ROUNDS = 500
+
+
+def _measure(serialize, servers):
+    start_time = time.perf_counter()
+    for _ in range(ROUNDS):
+        for server in servers:
+            serialize(server)
+    elapsed = time.perf_counter() - start_time
+
+    tracemalloc.start()
+    for server in servers:
+        serialize(server)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed / (ROUNDS * len(servers)), peak / len(servers)
+
+
+if __name__ == '__main__':
+    servers = get_sample_servers()
+    for name, serialize in [('to_primitive', lambda server: change_struct_type(server.to_primitive())),
+                            ('to_struct', to_struct)]:
+        per_server, peak = _measure(serialize, servers)
+        print(f'{name:>14}   per server {per_server * 1000000:8.1f} us   peak {peak / 1024:8.1f} KiB')
@@ -0,0 +1,89 @@
+"""
+Transform time of CollectorManager.get_instances as the project grows.
+
+Every instance has a boot disk, two data disks and its own subnet, so disks (3x), subnets and VPC subnetworks
+grow with the fleet.
+With GlobalResourceIndex the time per instance stays flat (linear total), the linear scans it replaced
+made it grow with the number of resources (quadratic total).
+
+usage)
+    cd src && PYTHONPATH=. python ../test/benchmark/benchmark_transform_scaling.py
+"""
+import time
+from spaceone.inventory.manager.collector_manager import CollectorManager
+from spaceone.inventory.libs.global_resource_index import GlobalResourceIndex
+from spaceone.inventory.libs.machine_type_catalogue import MACHINE_TYPE_CATALOGUE
+
+SIZES = [500, 1000, 2000, 4000]
+PROJECT = 'https://www.googleapis.com/compute/v1/projects/sample-project'
+ZONE = 'us-central1-a'
+REGION = 'us-central1'
+
+
+def _instance(idx):
+    name = f'instance-{idx}'
+    return {
+        'id': str(idx),
+        'name': name,
+        'zone': f'{PROJECT}/zones/{ZONE}',
+        'status': 'RUNNING',
+        'selfLink': f'{PROJECT}/zones/{ZONE}/instances/{name}',
+        'machineType': f'{PROJECT}/zones/{ZONE}/machineTypes/e2-medium',
+        'creationTimestamp': '2020-08-18T06:22:45.863-07:00',
+        'tags': {'items': ['http-server']},
+        'disks': [{'index': 0, 'diskSizeGb': '10', 'source': f'{PROJECT}/zones/{ZONE}/disks/{name}',
+                   'licenses': [f'{PROJECT}/global/licenses/debian-10-buster']}],
+        'networkInterfaces': [{'network': f'{PROJECT}/global/networks/default',
+                               'subnetwork': f'{PROJECT}/regions/{REGION}/subnetworks/subnet-{idx}',
+                               'networkIP': '10.0.0.2', 'accessConfigs': [{'natIP': '34.1.1.1'}]}],
+        'serviceAccounts': [{'email': 'sa@sample-project.iam.gserviceaccount.com'}]
+    }
+
+
+def _global_resources(size):
+    subnets = [{'id': str(idx), 'name': f'subnet-{idx}',
+                'selfLink': f'{PROJECT}/regions/{REGION}/subnetworks/subnet-{idx}',
+                'ipCidrRange': '10.0.0.0/24', 'gatewayAddress': '10.0.0.1'} for idx in range(size)]
+    # two data disks per instance, listed before the boot disks
+    disk_names = [f'data-{idx}-{n}' for n in range(2) for idx in range(size)] + \
+                 [f'instance-{idx}' for idx in range(size)]
+    return {
+        'disk': [{'id': name, 'name': name, 'selfLink': f'{PROJECT}/zones/{ZONE}/disks/{name}',
+                  'type': f'{PROJECT}/zones/{ZONE}/diskTypes/pd-balanced', 'sizeGb': '10',
+                  'sourceImage': f'{PROJECT}/global/images/debian-10'} for name in disk_names],
+        'subnets': subnets,
+        'vpcs': [{'id': 'vpc', 'name': 'default', 'selfLink': f'{PROJECT}/global/networks/default',
+                  'subnetworks': [subnet['selfLink'] for subnet in subnets]}],
+        'instance_type': MACHINE_TYPE_CATALOGUE.get_index(),
+        'public_images': {},
+        'instance_group': [{'name': 'stateless', 'status': {'stateful': {'hasStatefulConfig': False}},
+                            'instance_list': [{'instance': f'{PROJECT}/zones/{ZONE}/instances/instance-{idx}'}
+                                              for idx in range(0, size, 2)]}],
+        'auto_scaler': [],
+        'fire_walls': [],
+        'url_maps': [],
+        'backend_svcs': [],
+        'target_pools': [],
+        'forwarding_rules': []
+    }
+
+
+def _transform(collector_manager, size):
+    instances = [_instance(idx) for idx in range(size)]
+    global_resources = _global_resources(size)
+
+    start_time = time.perf_counter()
+    resource_index = GlobalResourceIndex(global_resources)
+    for instance in instances:
+        collector_manager.get_instances({'zone': ZONE, 'region': REGION, 'project_id': 'sample-project'},
+                                        instance, resource_index)
+    return time.perf_counter() - start_time
+
+
+if __name__ == '__main__':
+    collector_manager = CollectorManager.__new__(CollectorManager)
+    collector_manager.gcp_connector = None
+
+    for size in SIZES:
+        elapsed = _transform(collector_manager, size)
+        print(f'{size:>6} instances   total {elapsed:8.3f} s   per instance {elapsed / size * 1000000:8.1f} us')
@@ -0,0 +1,113 @@
+import os
+import json
+import asyncio
+import unittest
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from spaceone.inventory.connector.google_cloud_compute_async_connector import GoogleCloudComputeAsyncConnector
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+PROJECT_ID = 'sample-project'
+
+
+def _load_page(name):
+    with open(os.path.join(DATA_DIR, name)) as json_file:
+        return json.load(json_file)
+
+
+class FakeCredentials:
+    valid = True
+    token = 'fake-token'
+
+
+class FakeComputeServer:
+    """ Serves recorded list pages, page_token -> file name """
+
+    def __init__(self):
+        self.requests = []
+        self.pages = {
+            f'/compute/v1/projects/{PROJECT_ID}/aggregated/instances': {
+                None: 'aggregated_instances_page_1.json',
+                'page-2': 'aggregated_instances_page_2.json'
+            },
+            f'/compute/v1/projects/{PROJECT_ID}/aggregated/disks': {
+                None: 'aggregated_disks_page_1.json'
+            },
+            f'/compute/v1/projects/{PROJECT_ID}/global/firewalls': {
+                None: 'global_firewalls_page_1.json'
+            },
+            f'/compute/v1/projects/{PROJECT_ID}/zones/asia-northeast3-a/instanceGroups/sample-group/listInstances': {
+                None: 'instance_group_instances_page_1.json',
+                'page-2': 'instance_group_instances_page_2.json'
+            },
+            f'/compute/v1/projects/{PROJECT_ID}/aggregated/operations': {
+                None: 'aggregated_operations_page_1.json'
+            }
+        }
+
+    async def handle(self, request):
+        self.requests.append(request)
+        if request.headers.get('Authorization') != f'Bearer {FakeCredentials.token}':
+            raise web.HTTPUnauthorized()
+
+        pages = self.pages.get(request.path)
+        if pages is None or request.query.get('pageToken') not in pages:
+            raise web.HTTPNotFound()
+
+        return web.json_response(_load_page(pages[request.query.get('pageToken')]))
+
+
+class TestGoogleCloudComputeAsyncConnector(unittest.IsolatedAsyncioTestCase):
+
+    async def asyncSetUp(self):
+        self.fake_server = FakeComputeServer()
+        app = web.Application()
+        app.router.add_route('*', '/{tail:.*}', self.fake_server.handle)
+        self.server = TestServer(app)
+        await self.server.start_server()
+
+        self.connector = GoogleCloudComputeAsyncConnector()
+        self.connector.endpoint = str(self.server.make_url('/compute/v1'))
+        self.connector.project_id = PROJECT_ID
+        self.connector.credentials = FakeCredentials()
+        await self.connector.open()
+
+    async def asyncTearDown(self):
+        await self.connector.close()
+        await self.server.close()
+
+    async def test_list_instances_follows_pages(self):
+        instances = await self.connector.list_instances()
+
+        self.assertEqual(['sample-instance-1', 'sample-instance-2'], [i['name'] for i in instances])
+        self.assertEqual(['', 'page-2'], [r.query.get('pageToken', '') for r in self.fake_server.requests])
+        self.assertIn('status=RUNNING', self.fake_server.requests[0].query.get('filter'))
+
+    async def test_list_resources_concurrently(self):
+        instances, disks, firewalls = await asyncio.gather(self.connector.list_instances(),
+                                                           self.connector.list_disks(),
+                                                           self.connector.list_firewall())
+
+        self.assertEqual(2, len(instances))
+        self.assertEqual(['sample-instance-1'], [d['name'] for d in disks])
+        self.assertEqual(['default-allow-ssh'], [f['name'] for f in firewalls])
+
+    async def test_list_instances_of_group_follows_pages(self):
+        members = await self.connector.list_instance_from_instance_groups('sample-group', 'zone', 'asia-northeast3-a')
+
+        self.assertEqual(['sample-instance-1', 'sample-instance-2'], [m['instance'].split('/')[-1] for m in members])
+        self.assertEqual(['POST', 'POST'], [r.method for r in self.fake_server.requests])
+        self.assertEqual(['', 'page-2'], [r.query.get('pageToken', '') for r in self.fake_server.requests])
+
+    async def test_list_operations_of_every_scope(self):
+        operations = await self.connector.list_operations()
+
+        self.assertEqual(['stop', 'patch'], [operation['operationType'] for operation in operations])
+
+    async def test_failed_listing_returns_empty_list(self):
+        self.assertEqual([], await self.connector.list_autoscalers())
+
+
+if __name__ == "__main__":
+    unittest.main()
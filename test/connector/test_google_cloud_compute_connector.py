@@ -0,0 +1,67 @@
+import os
+import unittest
+
+from googleapiclient.http import HttpMockSequence
+from spaceone.inventory.connector.google_cloud_compute_connector import GoogleCloudComputeConnector
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
+PROJECT_ID = 'sample-project'
+
+
+def _load_page(name):
+    with open(os.path.join(DATA_DIR, name)) as json_file:
+        return json_file.read()
+
+
+class TestGoogleCloudComputeConnector(unittest.TestCase):
+
+    def setUp(self):
+        self.connector = GoogleCloudComputeConnector()
+        self.connector.project_id = PROJECT_ID
+        self.connector.client = GoogleCloudComputeConnector.get_service()
+
+    def _replay(self, *pages):
+        http = HttpMockSequence([({'status': '200'}, _load_page(page)) for page in pages])
+        self.connector._get_http = lambda: http
+        return http
+
+    def test_iter_instances_requests_next_page_on_demand(self):
+        http = self._replay('aggregated_instances_page_1.json', 'aggregated_instances_page_2.json')
+        pages = self.connector.iter_instances()
+
+        self.assertEqual(['sample-instance-1'], [i['name'] for i in next(pages)])
+        self.assertEqual(1, len(http._iterable))
+        self.assertEqual(['sample-instance-2'], [i['name'] for i in next(pages)])
+        self.assertRaises(StopIteration, next, pages)
+
+    def test_list_instances_flattens_pages(self):
+        self._replay('aggregated_instances_page_1.json', 'aggregated_instances_page_2.json')
+
+        instances = self.connector.list_instances()
+
+        self.assertEqual(['sample-instance-1', 'sample-instance-2'], [i['name'] for i in instances])
+
+    def test_iter_firewall(self):
+        self._replay('global_firewalls_page_1.json')
+
+        self.assertEqual([['default-allow-ssh']], [[f['name'] for f in page]
+                                                   for page in self.connector.iter_firewall()])
+
+    def test_regional_disks_in_region_scope(self):
+        http = self._replay('aggregated_disks_regional_page_1.json')
+
+        disks = self.connector.list_disks(scopes={'zone': ['asia-northeast3-a'], 'region': ['asia-northeast3']})
+
+        self.assertEqual(['sample-instance-1', 'sample-regional-disk'], [d['name'] for d in disks])
+        self.assertEqual(0, len(http._iterable))
+
+    def test_list_operations_of_every_scope(self):
+        self._replay('aggregated_operations_page_1.json')
+
+        operations = self.connector.list_operations()
+
+        self.assertEqual(['stop', 'patch'], [operation['operationType'] for operation in operations])
+
+
+if __name__ == "__main__":
+    unittest.main()
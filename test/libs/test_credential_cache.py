@@ -0,0 +1,64 @@
+import datetime
+import unittest
+from unittest import mock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from spaceone.inventory.libs.credential_cache import CredentialCache
+
+
+def _secret_data(client_email):
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048).private_bytes(
+        serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    return {
+        'type': 'service_account',
+        'project_id': 'sample-project',
+        'client_email': client_email,
+        'private_key': private_key.decode('utf-8'),
+        'token_uri': 'https://oauth2.googleapis.com/token'
+    }
+
+
+class TestCredentialCache(unittest.TestCase):
+
+    def setUp(self):
+        self.cache = CredentialCache()
+        self.secret_data = _secret_data('collector@sample-project.iam.gserviceaccount.com')
+
+    def test_same_service_account_hits(self):
+        credentials = self.cache.get_credentials(self.secret_data)
+
+        self.assertIs(credentials, self.cache.get_credentials(dict(self.secret_data)))
+        self.assertEqual({'hits': 1, 'misses': 1, 'refreshes': 0, 'evictions': 0, 'size': 1},
+                         self.cache.get_counters())
+
+    def test_rotated_key_misses(self):
+        rotated = dict(self.secret_data, private_key=_secret_data('rotated')['private_key'])
+
+        self.assertIsNot(self.cache.get_credentials(self.secret_data), self.cache.get_credentials(rotated))
+        self.assertEqual(2, self.cache.get_counters()['misses'])
+
+    @mock.patch('spaceone.inventory.libs.credential_cache.config.get_global', return_value={'max_size': 1})
+    def test_least_recently_used_is_evicted(self, _):
+        self.cache.get_credentials(self.secret_data)
+        self.cache.get_credentials(_secret_data('other@sample-project.iam.gserviceaccount.com'))
+
+        self.assertEqual({'hits': 0, 'misses': 2, 'refreshes': 0, 'evictions': 1, 'size': 1},
+                         self.cache.get_counters())
+
+    def test_expiring_token_is_refreshed(self):
+        credentials = self.cache.get_credentials(self.secret_data)
+        credentials.token = 'cached-token'
+        credentials.expiry = datetime.datetime.utcnow() + datetime.timedelta(seconds=60)
+
+        with mock.patch.object(type(credentials), 'refresh') as refresh:
+            self.cache.get_credentials(self.secret_data)
+            credentials.expiry = datetime.datetime.utcnow() + datetime.timedelta(hours=1)
+            self.cache.get_credentials(self.secret_data)
+
+        self.assertEqual(1, refresh.call_count)
+        self.assertEqual(1, self.cache.get_counters()['refreshes'])
+
+
+if __name__ == "__main__":
+    unittest.main()
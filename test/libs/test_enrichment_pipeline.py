@@ -0,0 +1,55 @@
+import unittest
+
+from spaceone.inventory.libs.enrichment_pipeline import Enricher, EnrichmentPipeline
+
+
+def _name(record, resource_index):
+    record['name'] = record['instance']['name']
+
+
+def _disk(record, resource_index):
+    record['disks'] = resource_index[record['name']]
+
+
+def _server(record, resource_index):
+    record['server'] = dict(record['instance'], disks=record.get('disks', []))
+
+
+ENRICHERS = [
+    Enricher('name', _name, required=True),
+    Enricher('disk', _disk, requires=('disk',)),
+    Enricher('stackdriver', lambda record, resource_index: None, requires=('instance_group',)),
+    Enricher('server', _server, required=True)
+]
+
+
+class TestEnrichmentPipeline(unittest.TestCase):
+
+    def test_stages_over_a_batch(self):
+        pipeline = EnrichmentPipeline(ENRICHERS)
+        records = pipeline.run([{'instance': {'name': 'vm-1'}}, {'instance': {'name': 'vm-2'}}],
+                               {'vm-1': ['boot'], 'vm-2': []})
+
+        self.assertEqual([{'name': 'vm-1', 'disks': ['boot']}, {'name': 'vm-2', 'disks': []}],
+                         [record['server'] for record in records])
+        self.assertEqual(['name', 'disk', 'stackdriver', 'server'], list(pipeline.get_timings().keys()))
+
+    def test_error_skips_the_later_stages_of_its_record_only(self):
+        records = EnrichmentPipeline(ENRICHERS).run([{'instance': {'name': 'broken'}}, {'instance': {'name': 'vm-1'}}],
+                                                    {'vm-1': ['boot']})
+
+        self.assertIsInstance(records[0]['error'], KeyError)
+        self.assertNotIn('server', records[0])
+        self.assertEqual(['boot'], records[1]['server']['disks'])
+
+    def test_disabled_enrichers_and_their_resources(self):
+        pipeline = EnrichmentPipeline(ENRICHERS, disabled=['disk', 'server', 'unknown'])
+        records = pipeline.run([{'instance': {'name': 'broken'}}], {})
+
+        self.assertEqual(['name', 'stackdriver', 'server'], [stage.name for stage in pipeline.stages])
+        self.assertEqual({'instance_group'}, pipeline.get_required_resources())
+        self.assertEqual([], records[0]['server']['disks'])
+
+
+if __name__ == "__main__":
+    unittest.main()
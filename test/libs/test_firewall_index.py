@@ -0,0 +1,60 @@
+import unittest
+
+from spaceone.inventory.libs.firewall_index import FirewallIndex
+
+FIREWALLS = [
+    {'name': 'web', 'network': 'default', 'targetTags': ['http-server', 'https-server']},
+    {'name': 'all', 'network': 'default', 'targetTags': ['allow-all-instance']},
+    {'name': 'other-network', 'network': 'other', 'targetTags': ['http-server']},
+    {'name': 'by-service-account', 'network': 'other', 'targetServiceAccounts': ['sa@sample-project']},
+    {'name': 'broken', 'network': 'default', 'targetTags': ['broken']}
+]
+
+
+def _compile_rules(firewall):
+    if firewall['name'] == 'broken':
+        raise ValueError('broken firewall')
+    return [firewall['name']]
+
+
+class TestFirewallIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.compiled = []
+        self.firewall_index = FirewallIndex(FIREWALLS, self._compile_rules)
+
+    def _compile_rules(self, firewall):
+        self.compiled.append(firewall['name'])
+        return _compile_rules(firewall)
+
+    def test_rules_in_firewall_order_for_every_matched_tag(self):
+        rules = self.firewall_index.get_rules(['default'], ['https-server', 'http-server'], [])
+
+        self.assertEqual(['web', 'web', 'all'], rules)
+
+    def test_service_account_only_in_firewall_network(self):
+        self.assertEqual(['other-network', 'by-service-account'],
+                         self.firewall_index.get_rules(['other'], ['http-server'], ['sa@sample-project']))
+        self.assertEqual(['all'], self.firewall_index.get_rules(['default'], [], ['sa@sample-project']))
+
+    def test_rules_are_compiled_once(self):
+        self.firewall_index.get_rules(['default'], ['http-server'], [])
+        self.firewall_index.get_rules(['default'], ['http-server'], [])
+        self.firewall_index.get_rules(['default'], ['https-server'], [])
+
+        self.assertEqual(['web', 'all'], self.compiled)
+
+    def test_error_of_matched_firewall(self):
+        self.assertRaises(ValueError, self.firewall_index.get_rules, ['default'], ['broken'], [])
+        self.assertEqual(['all'], self.firewall_index.get_rules(['default'], [], []))
+
+    def test_firewall_without_target_applies_to_every_instance_of_its_network(self):
+        firewall_index = FirewallIndex(FIREWALLS + [{'name': 'untargeted', 'network': 'other'}], _compile_rules)
+
+        self.assertEqual(['other-network', 'untargeted'], firewall_index.get_rules(['other'], ['http-server'], []))
+        self.assertEqual(['untargeted'], firewall_index.get_rules(['other'], [], []))
+        self.assertEqual(['all'], firewall_index.get_rules(['default'], [], []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+from spaceone.inventory.libs.global_resource_index import GlobalResourceIndex
+
+SUBNET = 'https://www.googleapis.com/compute/v1/projects/sample-project/regions/us-central1/subnetworks/{name}'
+
+
+class TestGlobalResourceIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.resource_index = GlobalResourceIndex({
+            'disk': [{'name': 'boot', 'selfLink': 'zones/a/disks/boot', 'id': '1'},
+                     {'name': 'boot', 'selfLink': 'zones/b/disks/boot', 'id': '2'}],
+            'subnets': [{'name': 'first', 'selfLink': SUBNET.format(name='first')},
+                        {'name': 'second', 'selfLink': SUBNET.format(name='second')}],
+            'vpcs': [{'name': 'vpc-1', 'subnetworks': [SUBNET.format(name='first')]},
+                     {'name': 'vpc-2', 'subnetworks': [SUBNET.format(name='first'), SUBNET.format(name='second')]}],
+            'instance_group': [{'name': 'stateless', 'status': {'stateful': {'hasStatefulConfig': False}},
+                                'instance_list': [{'instance': 'zones/a/instances/managed'}]}],
+            'fire_walls': [{'name': 'allow-ssh'}]
+        })
+
+    def test_first_match_in_listed_order(self):
+        self.assertEqual('2', self.resource_index.get_disk('zones/b/disks/boot')['id'])
+        self.assertEqual('1', self.resource_index.get_disk_by_name('boot')['id'])
+        self.assertEqual('vpc-1', self.resource_index.get_vpc(SUBNET.format(name='first'))['name'])
+        self.assertEqual('first', self.resource_index.get_subnet([SUBNET.format(name='second'),
+                                                                  SUBNET.format(name='first')])['name'])
+
+    def test_missing(self):
+        self.assertIsNone(self.resource_index.get_disk('zones/c/disks/boot'))
+        self.assertIsNone(self.resource_index.get_subnet([]))
+        self.assertFalse(self.resource_index.is_managed_instance('zones/a/instances/other'))
+        self.assertTrue(self.resource_index.is_managed_instance('zones/a/instances/managed'))
+
+    def test_not_indexed_resources(self):
+        self.assertEqual([{'name': 'allow-ssh'}], self.resource_index.get('fire_walls', []))
+        self.assertEqual([], self.resource_index.get('url_maps', []))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from spaceone.inventory.libs.image_catalogue import ImageCatalogue
+
+FIELDS = 'items(name,selfLink,description,licenses),nextPageToken'
+PUBLIC_IMAGES = {'debian': [{'name': 'debian-11-bullseye-v20221102'}], 'ubuntu': []}
+
+
+class TestImageCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.settings = {'ttl': 60, 'custom_ttl': 60, 'cache_dir': self.cache_dir}
+        patcher = mock.patch('spaceone.inventory.libs.image_catalogue.config.get_global',
+                             side_effect=lambda key, default=None: self.settings)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_public_images_survive_restart(self):
+        ImageCatalogue().set_public_images(PUBLIC_IMAGES, FIELDS)
+
+        self.assertEqual(PUBLIC_IMAGES, ImageCatalogue().get_public_images(FIELDS))
+
+    def test_public_images_expire(self):
+        catalogue = ImageCatalogue()
+        catalogue.set_public_images(PUBLIC_IMAGES, FIELDS)
+
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertIsNone(catalogue.get_public_images(FIELDS))
+            self.assertIsNone(ImageCatalogue().get_public_images(FIELDS))
+
+    def test_other_fields_are_listed_again(self):
+        catalogue = ImageCatalogue()
+        catalogue.set_public_images(PUBLIC_IMAGES, FIELDS)
+
+        self.assertIsNone(catalogue.get_public_images(None))
+
+    def test_custom_images_per_project(self):
+        catalogue = ImageCatalogue()
+        catalogue.set_custom_images('project-a', [{'name': 'image-a'}], FIELDS)
+
+        self.assertEqual([{'name': 'image-a'}], catalogue.get_custom_images('project-a', FIELDS))
+        self.assertIsNone(catalogue.get_custom_images('project-b', FIELDS))
+        self.assertIsNone(ImageCatalogue().get_custom_images('project-a', FIELDS))
+
+
+if __name__ == "__main__":
+    unittest.main()
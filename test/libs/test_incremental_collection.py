@@ -0,0 +1,126 @@
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from spaceone.inventory.libs.incremental_collection import IncrementalCollection, CollectionStateStore, \
+    FULL, WIDE, NARROW, UNCHANGED
+from spaceone.inventory.model.server import Server
+
+PROJECT = 'https://www.googleapis.com/compute/v1/projects/sample-project'
+VM_1 = f'{PROJECT}/zones/us-central1-a/instances/vm-1'
+VM_2 = f'{PROJECT}/zones/us-central1-a/instances/vm-2'
+DISK = f'{PROJECT}/zones/us-central1-a/disks/data'
+NOW = 1667376000.0
+
+
+def _operation(target_link, end_time=NOW + 30, status='DONE'):
+    return {'targetLink': target_link, 'status': status, 'operationType': 'patch',
+            'insertTime': time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(end_time - 10)),
+            'endTime': time.strftime('%Y-%m-%dT%H:%M:%S+00:00', time.gmtime(end_time))}
+
+
+def _server(self_link, status='RUNNING'):
+    return Server({'name': self_link.split('/')[-1], 'data': {'compute': {'instance_state': status}},
+                   'reference': {'resource_id': self_link}}, strict=False)
+
+
+class TestIncrementalCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.settings = {'full_resweep_interval': 3600, 'operation_margin': 60, 'cache_dir': self.cache_dir}
+        patcher = mock.patch('spaceone.inventory.libs.incremental_collection.config.get_global',
+                             side_effect=lambda key, default=None: self.settings)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+        self.store = CollectionStateStore()
+        collection = self.get_collection(NOW)
+        self.assertEqual(FULL, collection.set_operations([]))
+        self.assertTrue(all([collection.is_changed(_server(VM_1)), collection.is_changed(_server(VM_2))]))
+        collection.finish()
+
+    def get_collection(self, now, operations=None):
+        collection = IncrementalCollection('sample-project', store=self.store, now=now)
+        if operations is not None:
+            collection.set_operations(operations)
+        return collection
+
+    def test_no_operation(self):
+        collection = self.get_collection(NOW + 60, [_operation(VM_1, end_time=NOW - 600)])
+
+        self.assertEqual(UNCHANGED, collection.mode)
+        self.assertFalse(collection.is_selected({'selfLink': VM_1}))
+
+    def test_touched_instance(self):
+        collection = self.get_collection(NOW + 60, [_operation(VM_1)])
+
+        self.assertEqual(NARROW, collection.mode)
+        self.assertEqual(['vm-1'], collection.get_instance_names())
+        self.assertTrue(collection.is_selected({'selfLink': VM_1}))
+        self.assertFalse(collection.is_selected({'selfLink': VM_2}))
+
+    def test_touched_disk(self):
+        collection = self.get_collection(NOW + 60, [_operation(DISK)])
+
+        self.assertEqual(NARROW, collection.mode)
+        self.assertIsNone(collection.get_instance_names())
+        self.assertTrue(collection.is_selected({'selfLink': VM_2, 'disks': [{'source': DISK}]}))
+        self.assertFalse(collection.is_selected({'selfLink': VM_1, 'disks': []}))
+
+    def test_running_operation_counts_whenever_it_started(self):
+        collection = self.get_collection(NOW + 60, [_operation(f'{PROJECT}/global/firewalls/allow-ssh',
+                                                               end_time=NOW - 7200, status='RUNNING')])
+        self.assertEqual(WIDE, collection.mode)
+
+    def test_unknown_target_type_is_wide(self):
+        collection = self.get_collection(NOW + 60, [_operation(VM_1), _operation(f'{PROJECT}/global/images/custom')])
+        self.assertEqual(WIDE, collection.mode)
+
+    def test_operation_filter_from_the_watermark(self):
+        collection = self.get_collection(NOW + 60)
+
+        self.assertEqual('(insertTime > "2022-11-01T07:59:00Z") OR (endTime > "2022-11-01T07:59:00Z") OR '
+                         '(status != "DONE")', collection.get_operation_filter())
+        self.assertIsNone(self.get_collection(NOW + 3600).get_operation_filter())
+
+    def test_only_changed_servers_are_emitted(self):
+        collection = self.get_collection(NOW + 60, [_operation(f'{PROJECT}/global/firewalls/allow-ssh')])
+
+        self.assertFalse(collection.is_changed(_server(VM_1)))
+        self.assertTrue(collection.is_changed(_server(VM_2, status='TERMINATED')))
+        collection.finish()
+
+        # state read back from cache_dir by another process
+        self.store = CollectionStateStore()
+        collection = self.get_collection(NOW + 120, [_operation(VM_2, end_time=NOW + 90)])
+        self.assertFalse(collection.is_changed(_server(VM_2, status='TERMINATED')))
+
+    def test_narrow_collect_reads_the_untouched_resources_of_the_last_one(self):
+        collection = self.get_collection(NOW + 60, [_operation(VM_1)])
+        self.assertEqual({}, collection.get_cached_resources({'disk', 'vpcs'}))
+        collection.finish({'disk': ['data'], 'vpcs': ['default']})
+
+        collection = self.get_collection(NOW + 120, [_operation(DISK, end_time=NOW + 90)])
+        self.assertEqual({'vpcs': ['default']}, collection.get_cached_resources({'disk', 'vpcs', 'fire_walls'}))
+        collection.finish({})
+        # the touched kind was not listed again, it is not kept either
+        self.assertEqual({'vpcs': ['default']}, self.store.get_resources('sample-project'))
+
+        collection = self.get_collection(NOW + 180, [_operation(f'{PROJECT}/global/firewalls/allow-ssh',
+                                                                end_time=NOW + 150)])
+        self.assertEqual({}, collection.get_cached_resources({'disk', 'vpcs'}))
+
+    def test_full_resweep(self):
+        self.assertEqual(FULL, self.get_collection(NOW + 3600, [_operation(VM_1)]).mode)
+        self.assertEqual(FULL, self.get_collection(NOW + 60, None).set_operations(None))
+
+        collection = self.get_collection(NOW + 3600, [])
+        self.assertTrue(collection.is_changed(_server(VM_1)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+import unittest
+
+from spaceone.inventory.libs.instance_group_membership import InstanceGroupMembership
+
+PROJECT = 'https://www.googleapis.com/compute/v1/projects/sample-project'
+ZONE = f'{PROJECT}/zones/us-central1-a'
+
+INSTANCE_GROUPS = [
+    {'name': 'stateful', 'status': {'autoscaler': f'{ZONE}/autoscalers/stateful',
+                                    'stateful': {'hasStatefulConfig': True}},
+     'instance_list': [{'instance': f'{ZONE}/instances/vm-1'}]},
+    {'name': 'stateless', 'status': {'autoscaler': f'{ZONE}/autoscalers/stateless',
+                                     'stateful': {'hasStatefulConfig': False}},
+     'instance_list': [{'instance': f'{ZONE}/instances/vm-1'}, {'instance': f'{ZONE}/instances/vm-2'},
+                       {'instance': f'{ZONE}/instances/vm-2'}, {'status': 'RUNNING'}]},
+]
+
+
+class TestInstanceGroupMembership(unittest.TestCase):
+
+    def setUp(self):
+        self.membership = InstanceGroupMembership(INSTANCE_GROUPS)
+
+    def test_groups_in_listed_order(self):
+        self.assertEqual(['stateful', 'stateless'],
+                         [group['name'] for group in self.membership.get_groups(f'{ZONE}/instances/vm-1')])
+        self.assertEqual(['stateless'],
+                         [group['name'] for group in self.membership.get_groups(f'{ZONE}/instances/vm-2')])
+        self.assertEqual(f'{ZONE}/autoscalers/stateful', self.membership.get_auto_scaler_link(f'{ZONE}/instances/vm-1'))
+
+    def test_stateless_members(self):
+        self.assertTrue(self.membership.is_managed_stateless(f'{ZONE}/instances/vm-1'))
+        self.assertTrue(self.membership.is_managed_stateless(f'{ZONE}/instances/vm-2'))
+
+    def test_matched_by_link_not_by_name(self):
+        other_zone = f'{PROJECT}/zones/us-east1-b/instances/vm-1'
+        self.assertIsNone(self.membership.get_group(other_zone))
+        self.assertFalse(self.membership.is_managed_stateless(other_zone))
+        self.assertEqual('', self.membership.get_auto_scaler_link(other_zone))
+
+    def test_api_version_of_link_does_not_matter(self):
+        beta_link = 'https://www.googleapis.com/compute/beta/projects/sample-project/zones/us-central1-a/instances/vm-2'
+        self.assertEqual('stateless', self.membership.get_group(beta_link)['name'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import threading
+import unittest
+
+from spaceone.inventory.libs.global_resource_index import GlobalResourceIndex
+from spaceone.inventory.libs.lazy_resources import LazyResources
+
+
+def _broken():
+    raise ConnectionError('listing failed')
+
+
+class TestLazyResources(unittest.TestCase):
+
+    def setUp(self):
+        self.fire_walls_listed = threading.Event()
+        self.global_resources = LazyResources({
+            'disk': lambda: [{'name': 'boot', 'selfLink': 'zones/a/disks/boot'}],
+            'fire_walls': lambda: self.fire_walls_listed.wait(5) and [{'name': 'allow-ssh'}],
+            'public_images': _broken,
+            'subnets': _broken
+        }, 4, defaults={'public_images': {}})
+
+    def tearDown(self):
+        self.fire_walls_listed.set()
+        self.global_resources.close()
+
+    def test_lookup_waits_for_its_resource_only(self):
+        resource_index = GlobalResourceIndex(self.global_resources)
+
+        self.assertEqual('boot', resource_index.get_disk_by_name('boot')['name'])
+        self.assertFalse(self.global_resources.is_ready('fire_walls'))
+
+        self.fire_walls_listed.set()
+        self.assertEqual([{'name': 'allow-ssh'}], resource_index.get('fire_walls'))
+        self.assertEqual(['disk', 'fire_walls'], sorted(self.global_resources.get_wait_times().keys()))
+
+    def test_failed_or_unknown_resources(self):
+        self.assertEqual({}, self.global_resources.get('public_images'))
+        self.assertEqual([], self.global_resources.get('subnets'))
+        self.assertIsNone(self.global_resources.get('url_maps'))
+        self.assertNotIn('url_maps', self.global_resources)
+
+    def test_load_waits_for_every_resource(self):
+        self.fire_walls_listed.set()
+        GlobalResourceIndex(self.global_resources).load()
+        self.assertTrue(all(self.global_resources.is_ready(kind)
+                            for kind in ['disk', 'fire_walls', 'public_images', 'subnets']))
+
+
+if __name__ == "__main__":
+    unittest.main()
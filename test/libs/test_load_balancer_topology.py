@@ -0,0 +1,80 @@
+import unittest
+
+from spaceone.inventory.libs.instance_group_membership import InstanceGroupMembership
+from spaceone.inventory.libs.load_balancer_topology import LoadBalancerTopology
+
+PROJECT = 'https://www.googleapis.com/compute/v1/projects/sample-project'
+VM_1 = f'{PROJECT}/zones/us-central1-a/instances/vm-1'
+VM_10 = f'{PROJECT}/zones/us-central1-a/instances/vm-10'
+
+GLOBAL_RESOURCES = {
+    'instance_group': [
+        {'instanceGroup': f'{PROJECT}/zones/us-central1-a/instanceGroups/web',
+         'instance_list': [{'instance': VM_1}]},
+        {'instanceGroup': f'{PROJECT}/zones/us-central1-a/instanceGroups/web-canary',
+         'instance_list': [{'instance': VM_10}]}
+    ],
+    'backend_svcs': [
+        {'selfLink': f'{PROJECT}/global/backendServices/web', 'protocol': 'HTTP', 'port': 80,
+         'loadBalancingScheme': 'EXTERNAL',
+         'backends': [{'group': 'https://www.googleapis.com/compute/beta/projects/sample-project'
+                                '/zones/us-central1-a/instanceGroups/web'}]},
+        {'selfLink': f'{PROJECT}/global/backendServices/tcp', 'protocol': 'TCP', 'port': 443,
+         'loadBalancingScheme': 'EXTERNAL',
+         'backends': [{'group': f'{PROJECT}/zones/us-central1-a/instanceGroups/web'}]}
+    ],
+    'url_maps': [
+        {'name': 'web-map', 'defaultService': f'{PROJECT}/global/backendServices/web'},
+        {'name': 'tcp-map', 'defaultService': f'{PROJECT}/global/backendServices/tcp'}
+    ],
+    'target_pools': [
+        {'name': 'pool', 'selfLink': f'{PROJECT}/regions/us-central1/targetPools/pool', 'instances': [VM_1]}
+    ],
+    'forwarding_rules': [
+        {'target': f'{PROJECT}/regions/us-central1/targetPools/pool', 'IPProtocol': 'TCP',
+         'loadBalancingScheme': 'EXTERNAL', 'portRange': '8080-8080'}
+    ]
+}
+
+
+def _compile_http_row(backend_svc, url_map):
+    return {'name': url_map['name'], 'protocol': [backend_svc['protocol']]}
+
+
+def _compile_target_pool_row(forwarding_rule, target_pool):
+    return {'name': target_pool['name'], 'protocol': [forwarding_rule['IPProtocol']]}
+
+
+class TestLoadBalancerTopology(unittest.TestCase):
+
+    def setUp(self):
+        self.membership = InstanceGroupMembership(GLOBAL_RESOURCES['instance_group'])
+        self.topology = LoadBalancerTopology(GLOBAL_RESOURCES, self.membership, _compile_http_row,
+                                             _compile_target_pool_row)
+
+    def test_rows_of_instance_groups_then_target_pools(self):
+        self.assertEqual([{'name': 'web-map', 'protocol': ['HTTP']}, {'name': 'pool', 'protocol': ['TCP']}],
+                         [dict(row) for row in self.topology.get_rows(VM_1)])
+
+    def test_links_are_matched_exactly(self):
+        # vm-1 and the 'web' group are substrings of vm-10 and 'web-canary'
+        self.assertEqual([], self.topology.get_rows(VM_10))
+        self.assertEqual([], self.topology.get_rows(f'{PROJECT}/zones/us-central1-a/instances/vm'))
+
+    def test_rows_are_read_only(self):
+        row = self.topology.get_rows(VM_1)[0]
+        with self.assertRaises(TypeError):
+            row['name'] = 'changed'
+        self.assertNotIn('lb_info', GLOBAL_RESOURCES['forwarding_rules'][0])
+
+    def test_error_of_matched_load_balancer(self):
+        def _broken(forwarding_rule, target_pool):
+            raise ValueError('broken target pool')
+
+        topology = LoadBalancerTopology(GLOBAL_RESOURCES, self.membership, _compile_http_row, _broken)
+        self.assertRaises(ValueError, topology.get_rows, VM_1)
+        self.assertEqual([], topology.get_rows(VM_10))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,79 @@
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from spaceone.inventory.libs.machine_type_catalogue import MachineTypeCatalogue, parse_custom_machine_type
+
+SELF_LINK = 'https://www.googleapis.com/compute/v1/projects/sample-project/zones/{zone}/machineTypes/{name}'
+
+
+def _machine_type(zone, name, cpus, memory_mb):
+    return {'name': name, 'selfLink': SELF_LINK.format(zone=zone, name=name), 'guestCpus': cpus,
+            'memoryMb': memory_mb}
+
+
+class TestMachineTypeCatalogue(unittest.TestCase):
+
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.settings = {'ttl': 60, 'cache_dir': self.cache_dir}
+        patcher = mock.patch('spaceone.inventory.libs.machine_type_catalogue.config.get_global',
+                             side_effect=lambda key, default=None: self.settings)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(shutil.rmtree, self.cache_dir)
+
+    def test_bundled_snapshot(self):
+        index = MachineTypeCatalogue().get_index()
+
+        machine_type = index.get_by_self_link(SELF_LINK.format(zone='us-central1-a', name='e2-medium'))
+        self.assertEqual((2, 4096), (machine_type['guestCpus'], machine_type['memoryMb']))
+        self.assertIsNone(index.get('us-central1-a', 'custom-4-8192'))
+
+    def test_refresh_dedups_zones_and_survives_restart(self):
+        catalogue = MachineTypeCatalogue()
+        catalogue.refresh([_machine_type('us-central1-a', 'x9-standard-2', 2, 8192),
+                           _machine_type('us-central1-b', 'x9-standard-2', 2, 8192)])
+
+        families = catalogue._catalogue['families']
+        self.assertEqual(['us-central1-a', 'us-central1-b'], families['x9']['x9-standard-2']['zones'])
+        self.assertIn('e2-medium', families['e2'])
+
+        index = MachineTypeCatalogue().get_index()
+        self.assertEqual(8192, index.get('us-central1-b', 'x9-standard-2')['memoryMb'])
+
+    def test_expired_after_ttl(self):
+        catalogue = MachineTypeCatalogue()
+        catalogue.refresh([])
+
+        self.assertFalse(catalogue.is_expired())
+        with mock.patch('time.time', return_value=time.time() + 61):
+            self.assertTrue(catalogue.is_expired())
+
+    def test_one_refresh_at_a_time_and_backoff_after_failure(self):
+        catalogue = MachineTypeCatalogue()
+
+        self.assertTrue(catalogue.begin_refresh())
+        self.assertFalse(catalogue.begin_refresh())
+        catalogue.fail_refresh()
+        self.assertFalse(catalogue.begin_refresh())
+
+        with mock.patch('time.time', return_value=time.time() + 3601):
+            self.assertTrue(catalogue.begin_refresh())
+            catalogue.refresh([])
+            self.assertFalse(catalogue.begin_refresh())
+
+    def test_parse_custom_machine_type(self):
+        for name, cpus, memory_mb in [('custom-4-8192', 4, 8192), ('n2-custom-8-32768', 8, 32768),
+                                      ('e2-custom-2-4096-ext', 2, 4096), ('n2d-custom-96-786432-ext', 96, 786432)]:
+            self.assertEqual({'name': name, 'guestCpus': cpus, 'memoryMb': memory_mb},
+                             parse_custom_machine_type(name))
+
+        for name in ['e2-medium', 'e2-custom-medium-4096', 'custom-4', 'n2-standard-8']:
+            self.assertIsNone(parse_custom_machine_type(name))
+
+
+if __name__ == "__main__":
+    unittest.main()
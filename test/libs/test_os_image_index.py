@@ -0,0 +1,45 @@
+import unittest
+
+from spaceone.inventory.libs.os_image_index import OSImageIndex
+
+LICENSE = 'https://www.googleapis.com/compute/v1/projects/{project}/global/licenses/{name}'
+DEBIAN = [LICENSE.format(project='debian-cloud', name='debian-10-buster')]
+WINDOWS = [LICENSE.format(project='windows-cloud', name='windows-server-2019-dc'),
+           LICENSE.format(project='windows-cloud', name='windows-byol')]
+
+PUBLIC_IMAGES = {
+    'debian': [{'name': 'debian-10-v1', 'licenses': DEBIAN, 'description': 'Debian, 10 (buster), amd64 built on v1'},
+               {'name': 'debian-10-v2', 'licenses': DEBIAN, 'description': 'Debian, 10 (buster), x86_64 built on v2'}],
+    'windows': [{'name': 'windows-2019', 'licenses': WINDOWS, 'description': 'Windows Server 2019, x64'}],
+    'custom': [{'name': 'golden', 'licenses': [LICENSE.format(project='p', name='golden')], 'description': ''}]
+}
+
+
+class TestOSImageIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.os_image_index = OSImageIndex(PUBLIC_IMAGES)
+
+    def test_first_image_of_the_license_list(self):
+        self.assertEqual({'details': 'Debian, 10 (buster), amd64 built on v1', 'os_distro': 'debian',
+                          'os_arch': 'amd64'}, self.os_image_index.get_os_data(DEBIAN))
+        self.assertEqual({'details': 'Windows Server 2019, x64', 'os_distro': 'windows-server', 'os_arch': 'x64'},
+                         self.os_image_index.get_os_data(WINDOWS))
+
+    def test_license_list_is_compared_in_order(self):
+        self.assertEqual('', self.os_image_index.get_os_data(list(reversed(WINDOWS)))['os_distro'])
+
+    def test_no_match_is_cached(self):
+        # 'golden' does not contain the 'custom' key
+        custom = PUBLIC_IMAGES['custom'][0]['licenses']
+        self.assertEqual({'details': '', 'os_distro': '', 'os_arch': ''}, self.os_image_index.get_os_data(custom))
+        self.assertIsNone(self.os_image_index._resolved[tuple(custom)])
+        self.assertEqual('', self.os_image_index.get_os_data([])['os_distro'])
+
+    def test_os_data_is_a_copy(self):
+        self.os_image_index.get_os_data(DEBIAN)['os_distro'] = 'changed'
+        self.assertEqual('debian', self.os_image_index.get_os_data(DEBIAN)['os_distro'])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import json
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+from spaceone.inventory.libs.rate_limiter import RateLimiter
+
+
+def _http_error(status, reason):
+    content = json.dumps({'error': {'code': status, 'message': reason, 'errors': [{'reason': reason}]}})
+    return HttpError(httplib2.Response({'status': status}), content.encode())
+
+
+class FakeRequest:
+
+    def __init__(self, errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def execute(self, http=None):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {'items': []}
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch('spaceone.inventory.libs.rate_limiter.config.get_global',
+                             side_effect=lambda key, default=None: {'backoff_base': 0.0, 'backoff_max': 0.0})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.rate_limiter = RateLimiter()
+
+    def test_rate_limited_forbidden_is_retried(self):
+        request = FakeRequest([_http_error(403, 'rateLimitExceeded'), _http_error(403, 'userRateLimitExceeded'),
+                               _http_error(429, 'rateLimitExceeded')])
+
+        self.assertEqual({'items': []}, self.rate_limiter.execute('sample-project', 'list', request))
+        self.assertEqual(4, request.calls)
+        self.assertEqual(3, self.rate_limiter.get_counters()['sample-project/list']['retries'])
+
+    def test_denied_forbidden_is_raised(self):
+        request = FakeRequest([_http_error(403, 'forbidden')])
+
+        with self.assertRaises(HttpError):
+            self.rate_limiter.execute('sample-project', 'list', request)
+        self.assertEqual(1, request.calls)
+
+    def test_unreadable_error_body_is_not_retried(self):
+        error = HttpError(httplib2.Response({'status': 403}), b'<html>Forbidden</html>')
+
+        self.assertFalse(RateLimiter.is_retryable(error))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from spaceone.inventory.libs.record import record_class, validate_choices
+from spaceone.inventory.model import Disk, Compute, SecurityGroup, StackDriver, StackDriverFilters
+from spaceone.inventory.model.server import Server
+
+
+class TestRecord(unittest.TestCase):
+
+    def assertSamePrimitive(self, model_class, raw_data):
+        self.assertEqual(model_class(raw_data, strict=False).to_primitive(),
+                         record_class(model_class)(raw_data, strict=False).to_primitive())
+
+    def test_same_primitive_as_the_model(self):
+        self.assertSamePrimitive(Disk, {})
+        self.assertSamePrimitive(Disk, {'device_index': '1', 'size': '10', 'tags': {'disk_type': 'pd-ssd',
+                                                                                     'labels': [{'key': 'a'}]}})
+        self.assertSamePrimitive(SecurityGroup, {'priority': '1000', 'direction': 'inbound', 'port': 80})
+        self.assertSamePrimitive(Compute, {'instance_id': 1, 'launched_at': '2020-08-18T06:22:45.863-07:00',
+                                           'tags': {'env': 'dev'}, 'unknown': 'ignored'})
+        self.assertSamePrimitive(StackDriver, {'type': 'gce_instance', 'filters': [{'key': 'k', 'value': 'v'}]})
+
+    def test_nested_records_and_models_access(self):
+        Record = record_class(Server)
+        server = Record({'name': 'vm-1', 'data': {'compute': {'instance_id': '1'}},
+                         'disks': [record_class(Disk)({'size': 10})]}, strict=False)
+
+        server['data']['compute']['security_groups'] = ['default']
+        self.assertEqual('vm-1', server.get('name'))
+        self.assertIsNone(server.get('unknown'))
+        self.assertEqual(10.0, server.disks[0].size)
+        model = Server({'name': 'vm-1', 'data': {'compute': {'instance_id': '1', 'security_groups': ['default']}},
+                        'disks': [{'size': 10}]}, strict=False)
+        self.assertEqual(model.to_primitive(), server.to_primitive())
+        self.assertRaises(AttributeError, setattr, server, 'unknown', 1)
+
+    def test_choices_are_checked_once_for_a_record(self):
+        Record = record_class(Server)
+        server = Record({'os_type': 'MAC', 'data': {'security_group': [{'direction': 'inbound', 'action': 'drop'}]}},
+                        strict=False)
+
+        self.assertEqual([('os_type', 'MAC', ('LINUX', 'WINDOWS')),
+                          ('data.security_group[].action', 'drop', ('allow', 'deny'))], validate_choices(server))
+        self.assertEqual([], validate_choices(record_class(StackDriverFilters)({'key': 'k'})))
+
+
+if __name__ == "__main__":
+    unittest.main()
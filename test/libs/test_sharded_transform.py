@@ -0,0 +1,100 @@
+import threading
+import unittest
+
+from spaceone.inventory.error.custom import ERROR_FIELD_MASKED
+from spaceone.inventory.libs.enrichment_pipeline import Enricher, EnrichmentPipeline
+from spaceone.inventory.libs.sharded_transform import ShardedTransform, get_zone_shards, is_fork_supported
+
+
+class ResourceIndex(object):
+    """ can not be pickled, the workers only see it through fork """
+
+    def __init__(self, disks):
+        self.disks = disks
+        self.prepared = False
+        self._lock = threading.Lock()
+
+    def prepare(self):
+        self.prepared = True
+
+
+def _server(record, resource_index):
+    name = record['instance']['name']
+    if name == 'masked':
+        raise ERROR_FIELD_MASKED(resource='instance', key='disks')
+    elif name == 'broken':
+        raise ValueError(name)
+    record['server'] = {'name': name, 'disks': resource_index.disks.get(name, []), 'prepared': resource_index.prepared}
+
+
+def _get_records(names, zone):
+    return [{'instance': {'name': name}, 'zone_info': {'zone': zone, 'region': zone[:-2]}} for name in names]
+
+
+@unittest.skipUnless(is_fork_supported(), 'fork start method is not available')
+class TestShardedTransform(unittest.TestCase):
+
+    def setUp(self):
+        self.pipeline = EnrichmentPipeline([
+            Enricher('server', _server, required=True, prepare=lambda resource_index: resource_index.prepare())])
+        self.resource_index = ResourceIndex({'vm-1': ['boot'], 'vm-3': ['boot', 'data']})
+
+    def test_zone_shards(self):
+        records = _get_records(['vm-1', 'vm-2', 'vm-3'], 'us-east1-b') + _get_records(['vm-4'], 'us-west1-a') + \
+            _get_records(['vm-5'], 'us-east1-b')
+
+        shards = get_zone_shards(records, 2)
+        self.assertEqual([['vm-1', 'vm-2'], ['vm-3', 'vm-5'], ['vm-4']],
+                         [[record['instance']['name'] for record in shard] for shard in shards])
+
+    def test_workers_read_the_forked_index(self):
+        self.pipeline.prepare(self.resource_index)
+        shards = get_zone_shards(_get_records(['vm-1', 'vm-2'], 'us-east1-b') +
+                                 _get_records(['vm-3'], 'us-west1-a'), 1)
+
+        with ShardedTransform(self.pipeline, self.resource_index, lambda server: server, processes=2) as transform:
+            records = [record for shard_records in transform.run(shards) for record in shard_records]
+
+        self.assertEqual([{'name': 'vm-1', 'disks': ['boot'], 'prepared': True},
+                          {'name': 'vm-2', 'disks': [], 'prepared': True},
+                          {'name': 'vm-3', 'disks': ['boot', 'data'], 'prepared': True}],
+                         sorted([record['result'] for record in records], key=lambda server: server['name']))
+        self.assertEqual(['server'], list(self.pipeline.get_timings().keys()))
+
+    def test_errors_come_back_per_record(self):
+        shards = [_get_records(['masked', 'vm-1'], 'us-east1-b'), _get_records(['broken'], 'us-west1-a')]
+
+        with ShardedTransform(self.pipeline, self.resource_index, lambda server: server['name'], processes=2) \
+                as transform:
+            records = [record for shard_records in transform.run(shards) for record in shard_records]
+
+        errors = {record['result'] or type(record['error']).__name__: record['error'] for record in records}
+        self.assertIsNone(errors['vm-1'])
+        self.assertIsInstance(errors['ERROR_FIELD_MASKED'], ERROR_FIELD_MASKED)
+        self.assertEqual('instance.disks is read, but it is masked out by the field mask',
+                         errors['ERROR_FIELD_MASKED'].message)
+        self.assertEqual('broken', str(errors['ValueError']))
+
+    def test_workers_start_with_released_locks(self):
+        def _locked_server(record, resource_index):
+            with resource_index._lock:
+                _server(record, resource_index)
+
+        pipeline = EnrichmentPipeline([Enricher('server', _locked_server, required=True)])
+        initialized = []
+        # held by the parent while the pool is forked, like a lock of another thread of the gRPC server
+        self.resource_index._lock.acquire()
+        try:
+            with ShardedTransform(pipeline, self.resource_index, lambda server: (server['name'], initialized),
+                                  processes=1, initializer=lambda: initialized.append(True)) as transform:
+                results = [record['result'] for shard_records in transform.run([_get_records(['vm-1'], 'us-east1-b')])
+                           for record in shard_records]
+        finally:
+            self.resource_index._lock.release()
+
+        self.assertEqual([('vm-1', [True])], results)
+        self.assertEqual([], initialized)
+
+
+if __name__ == "__main__":
+    unittest.main()